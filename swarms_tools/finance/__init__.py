@@ -1,21 +1,36 @@
 from swarms_tools.finance.coinbase_tool import (
     get_coin_data,
+    get_multiple_coin_data,
     place_buy_order,
     place_sell_order,
 )
 from swarms_tools.finance.coingecko_tool import (
     coin_gecko_coin_api,
+    coin_gecko_markets_api,
+    coin_gecko_price_api,
 )
 from swarms_tools.finance.eodh_api import fetch_stock_news
-from swarms_tools.finance.helius_api import helius_api_tool
-from swarms_tools.finance.htx_tool import fetch_htx_data
-from swarms_tools.finance.okx_tool import okx_api_tool
+from swarms_tools.finance.helius_api import (
+    helius_api_tool,
+    helius_api_batch_tool,
+)
+from swarms_tools.finance.htx_tool import (
+    fetch_htx_data,
+    fetch_htx_data_concurrent,
+    fetch_multiple_htx_data,
+)
+from swarms_tools.finance.okx_tool import (
+    okx_api_tool,
+    okx_history_candles_tool,
+)
 from swarms_tools.finance.yahoo_finance import (
     yahoo_finance_api,
 )
 from swarms_tools.finance.coin_market_cap import coinmarketcap_api
+from swarms_tools.finance.coin_resolver import resolve_coin_id
 from swarms_tools.finance.dex_screener import (
     DexScreenerAPI,
+    TokenUniverse,
     fetch_dex_screener_profiles,
     fetch_latest_token_boosts,
     fetch_solana_token_pairs,
@@ -24,24 +39,55 @@ from swarms_tools.finance.macro_tool import fetch_macro_financial_data
 from swarms_tools.finance.check_solana_address import (
     check_solana_balance,
     check_multiple_wallets,
+    check_wallets_batch,
+    aggregate_wallet_balances,
+)
+from swarms_tools.finance.order_book import OrderBook
+from swarms_tools.finance.price_aggregator import (
+    get_best_price,
+    best_price_tool,
+)
+from swarms_tools.finance.market_streams import (
+    MarketState,
+    start_market_streams,
+    stop_market_streams,
+    get_streamed_market_data,
 )
 
 __all__ = [
     "fetch_stock_news",
     "fetch_htx_data",
+    "fetch_htx_data_concurrent",
+    "fetch_multiple_htx_data",
     "yahoo_finance_api",
     "coin_gecko_coin_api",
+    "coin_gecko_markets_api",
+    "coin_gecko_price_api",
     "helius_api_tool",
+    "helius_api_batch_tool",
     "okx_api_tool",
+    "okx_history_candles_tool",
     "get_coin_data",
+    "get_multiple_coin_data",
     "place_buy_order",
     "place_sell_order",
     "coinmarketcap_api",
+    "resolve_coin_id",
     "DexScreenerAPI",
+    "TokenUniverse",
     "fetch_dex_screener_profiles",
     "fetch_latest_token_boosts",
     "fetch_solana_token_pairs",
     "fetch_macro_financial_data",
     "check_solana_balance",
     "check_multiple_wallets",
+    "check_wallets_batch",
+    "aggregate_wallet_balances",
+    "OrderBook",
+    "get_best_price",
+    "best_price_tool",
+    "MarketState",
+    "start_market_streams",
+    "stop_market_streams",
+    "get_streamed_market_data",
 ]
@@ -1,5 +1,184 @@
-import requests
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+import pandas as pd
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from swarms_tools.finance.solana_token_list import (
+    TokenSymbolTable,
+    iter_token_symbols,
+    write_token_symbol_table,
+)
+from swarms_tools.utils.cache import get_cache_dir
+from swarms_tools.utils.formatted_string import (
+    format_object_to_string,
+)
+
+TOKEN_LIST_URL = "https://raw.githubusercontent.com/solana-labs/token-list/main/src/tokens/solana.tokenlist.json"
+
+_token_mapping: Optional[Mapping[str, str]] = None
+_token_mapping_lock = threading.Lock()
+# Set while _token_mapping is a fallback: monotonic time of the next download.
+_token_mapping_retry_at: Optional[float] = None
+
+
+def _token_list_cache_paths():
+    cache_dir = get_cache_dir("solana")
+    return (
+        cache_dir / "tokenlist_symbols.bin",
+        cache_dir / "tokenlist_symbols.meta.json",
+    )
+
+
+def _read_cached_token_mapping() -> Optional[TokenSymbolTable]:
+    mapping_path, _ = _token_list_cache_paths()
+    try:
+        return TokenSymbolTable(mapping_path)
+    except (OSError, ValueError):
+        return None
+
+
+def _fetch_token_mapping(
+    session: requests.Session,
+) -> TokenSymbolTable:
+    """
+    Downloads the token list, revalidating the on-disk copy with ETag / Last-Modified.
+
+    The response is parsed as a stream into a mint -> symbol dict and stored as
+    a memory-mapped ``TokenSymbolTable``; the full document is never decoded.
+    """
+    mapping_path, meta_path = _token_list_cache_paths()
+    cached = _read_cached_token_mapping()
+
+    meta: Dict[str, str] = {}
+    if cached is not None:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = session.get(
+        TOKEN_LIST_URL, headers=headers, timeout=30, stream=True
+    )
+    if response.status_code == 304 and cached is not None:
+        logger.debug("Solana token list not modified, using cache")
+        response.close()
+        os.utime(meta_path)
+        return cached
+
+    response.raise_for_status()
+    with response:
+        mapping = dict(
+            iter_token_symbols(
+                response.iter_content(chunk_size=64 * 1024)
+            )
+        )
+
+    write_token_symbol_table(mapping_path, mapping)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            },
+            f,
+        )
+    logger.info(f"Cached Solana token list with {len(mapping)} tokens")
+    if cached is not None:
+        cached.close()
+    return TokenSymbolTable(mapping_path)
+
+
+def load_token_mapping(
+    session: Optional[requests.Session] = None,
+    max_age: float = 3600,
+    force_refresh: bool = False,
+    retry_after: float = 300,
+) -> Mapping[str, str]:
+    """
+    Loads the Solana mint address -> symbol mapping once per process.
+
+    The mapping is cached on disk as a memory-mapped table shared by every
+    process, and only revalidated against the remote token list (with
+    If-None-Match / If-Modified-Since) once it is older than ``max_age``.
+    If the download fails, the stale on-disk copy (or an empty mapping) is
+    served and the download is not retried for ``retry_after`` seconds.
+
+    Args:
+        session (Optional[requests.Session]): Session used for the download.
+        max_age (float): Seconds before the on-disk copy is revalidated.
+        force_refresh (bool): Revalidate even if the cache is fresh.
+        retry_after (float): Seconds to wait before retrying a failed download.
+
+    Returns:
+        Mapping[str, str]: A read-only mapping of mint addresses to token symbols.
+    """
+    global _token_mapping, _token_mapping_retry_at
+
+    with _token_mapping_lock:
+        if (
+            _token_mapping is not None
+            and not force_refresh
+            and (
+                _token_mapping_retry_at is None
+                or time.monotonic() < _token_mapping_retry_at
+            )
+        ):
+            return _token_mapping
+
+        _, meta_path = _token_list_cache_paths()
+        cached = None
+        if not force_refresh:
+            try:
+                if time.time() - meta_path.stat().st_mtime < max_age:
+                    cached = _read_cached_token_mapping()
+            except OSError:
+                cached = None
+
+        if cached is not None:
+            # Replaced tables are not closed: other threads may still be
+            # reading them, and the mmap is released with the last reference.
+            _token_mapping = cached
+            _token_mapping_retry_at = None
+            return _token_mapping
+
+        try:
+            _token_mapping = _fetch_token_mapping(
+                session or requests.Session()
+            )
+            _token_mapping_retry_at = None
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(
+                f"Error fetching token list, retrying in {retry_after}s: {e}"
+            )
+            if _token_mapping is None:
+                _token_mapping = _read_cached_token_mapping() or {}
+            _token_mapping_retry_at = time.monotonic() + retry_after
+
+        return _token_mapping
+
+
+def _pooled_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class SolanaWalletBalanceChecker:
@@ -7,6 +186,7 @@ class SolanaWalletBalanceChecker:
         self,
         api_key: str = os.getenv("HELIUS_API_KEY"),
         base_url: str = "https://api.helius.xyz/v0/addresses/",
+        session: Optional[requests.Session] = None,
     ):
         """
         Initializes the Solana wallet balance checker using Hélius API.
@@ -14,30 +194,47 @@ class SolanaWalletBalanceChecker:
         Args:
             api_key (str): Your Hélius API key.
             base_url (str): The base URL for the Hélius API.
+            session (Optional[requests.Session]): Session to reuse for all requests.
         """
         self.api_key = api_key
         self.base_url = base_url
-        self.token_mapping = self.load_token_list()
+        self.session = session or requests.Session()
+        self.load_token_list()
 
-    def load_token_list(self) -> dict:
+    @property
+    def token_mapping(self) -> Mapping[str, str]:
+        """The current process-wide mapping of mint addresses to token names."""
+        return load_token_mapping(session=self.session)
+
+    def load_token_list(self) -> Mapping[str, str]:
         """
         Loads the Solana token list to map mint addresses to token names.
 
+        The list is shared by every checker in the process and cached on disk,
+        see ``load_token_mapping``.
+
         Returns:
-            dict: A dictionary mapping mint addresses to token names.
+            Mapping[str, str]: A mapping of mint addresses to token names.
         """
-        url = "https://raw.githubusercontent.com/solana-labs/token-list/main/src/tokens/solana.tokenlist.json"
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            token_list = response.json()["tokens"]
-            return {
-                token["address"]: token["symbol"]
-                for token in token_list
-            }
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching token list: {e}")
-            return {}
+        return load_token_mapping(session=self.session)
+
+    def fetch_wallet_balances(self, wallet_address: str) -> dict:
+        """
+        Fetches the raw Helius balances response, raising on failure.
+
+        Args:
+            wallet_address (str): The public key of the wallet.
+
+        Returns:
+            dict: The raw balances response.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        url = f"{self.base_url}{wallet_address}/balances?api-key={self.api_key}"
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()  # Ensure the request was successful
+        return response.json()
 
     def get_wallet_balances(self, wallet_address: str) -> dict:
         """
@@ -49,50 +246,219 @@ class SolanaWalletBalanceChecker:
         Returns:
             dict: A dictionary containing SOL and SPL token balances.
         """
-        url = f"{self.base_url}{wallet_address}/balances?api-key={self.api_key}"
         try:
-            response = requests.get(url)
-            response.raise_for_status()  # Ensure the request was successful
-            return response.json()
+            return self.fetch_wallet_balances(wallet_address)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching wallet balances: {e}")
             return None
 
-    def display_balances(self, wallet_address: str) -> None:
+    def parse_balances(
+        self, wallet_address: str, balances_data: dict
+    ) -> Dict[str, Any]:
+        """
+        Converts a raw Helius balances response into scaled, named balances.
+
+        Args:
+            wallet_address (str): The public key of the wallet.
+            balances_data (dict): The raw balances response.
+
+        Returns:
+            Dict[str, Any]: ``{"wallet", "sol", "tokens"}`` where each token has
+            ``mint``, ``symbol``, ``amount`` (scaled by decimals) and ``decimals``.
+        """
+        mapping = self.token_mapping
+        tokens = []
+        for token in balances_data.get("tokens", []):
+            mint = token.get("mint")
+            decimals = token.get("decimals") or 0
+            tokens.append(
+                {
+                    "mint": mint,
+                    "symbol": mapping.get(mint, "Unknown Token"),
+                    "amount": (token.get("amount") or 0) / (10**decimals),
+                    "decimals": decimals,
+                }
+            )
+        return {
+            "wallet": wallet_address,
+            "sol": balances_data.get("nativeBalance", 0) / 1e9,
+            "tokens": tokens,
+        }
+
+    def get_balances(
+        self, wallet_address: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetches the SOL and SPL token balances as structured data.
+
+        Args:
+            wallet_address (str): The public key of the wallet.
+
+        Returns:
+            Optional[Dict[str, Any]]: Parsed balances (see ``parse_balances``),
+            or None if the request failed.
+        """
+        balances_data = self.get_wallet_balances(wallet_address)
+        if not balances_data:
+            return None
+        return self.parse_balances(wallet_address, balances_data)
+
+    def get_balances_batch(
+        self, wallet_addresses: List[str], max_workers: int = 16
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches balances for many wallets concurrently.
+
+        Args:
+            wallet_addresses (List[str]): The public keys of the wallets.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Parsed balances keyed by wallet address, or
+            ``{"error": ...}`` for wallets whose request failed.
+        """
+
+        def fetch(wallet_address: str) -> Dict[str, Any]:
+            try:
+                return self.parse_balances(
+                    wallet_address,
+                    self.fetch_wallet_balances(wallet_address),
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error fetching balances for {wallet_address}: {e}"
+                )
+                return {"wallet": wallet_address, "error": str(e)}
+
+        unique = list(dict.fromkeys(wallet_addresses))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, unique))
+        return dict(zip(unique, results))
+
+    def display_balances(
+        self, wallet_address: str
+    ) -> Optional[Dict[str, Any]]:
         """
         Fetches and displays the SOL and SPL token balances with token names.
 
         Args:
             wallet_address (str): The public key of the wallet.
+
+        Returns:
+            Optional[Dict[str, Any]]: The displayed balances (see ``parse_balances``),
+            or None if the request failed.
         """
         print(f"Fetching balances for wallet: {wallet_address}")
-        balances_data = self.get_wallet_balances(wallet_address)
+        balances = self.get_balances(wallet_address)
 
-        if not balances_data:
+        if not balances:
             print("No balance data found or API request failed.")
-            return
+            return None
 
-        # Display SOL balance
-        sol_balance = (
-            balances_data.get("nativeBalance", 0) / 1e9
-        )  # Convert lamports to SOL
-        print(f"SOL: {sol_balance}")
+        print(f"SOL: {balances['sol']}")
 
-        # Display SPL token balances
-        tokens = balances_data.get("tokens", [])
-        if not tokens:
+        if not balances["tokens"]:
             print("No SPL tokens found.")
         else:
             print("SPL Tokens:")
-            for token in tokens:
-                mint = token.get("mint")
-                amount = token.get("amount", 0)
-                decimals = token.get("decimals", 0)
-                balance = amount / (10**decimals)
-                token_name = self.token_mapping.get(
-                    mint, "Unknown Token"
+            for token in balances["tokens"]:
+                print(
+                    f"  {token['symbol']} ({token['mint']}): {token['amount']}"
                 )
-                print(f"  {token_name} ({mint}): {balance}")
+
+        return balances
+
+
+def balances_to_frame(
+    balances: Union[Dict[str, Dict[str, Any]], Iterable[Dict[str, Any]]],
+) -> pd.DataFrame:
+    """
+    Flattens parsed wallet balances into one row per (wallet, mint) holding.
+
+    Args:
+        balances (Union[Dict[str, Dict[str, Any]], Iterable[Dict[str, Any]]]):
+            Output of ``check_wallets_batch`` or a list of ``get_balances`` results.
+            Entries with an ``error`` are skipped.
+
+    Returns:
+        pd.DataFrame: Columns ``wallet``, ``mint``, ``symbol`` and ``amount``.
+    """
+    if isinstance(balances, dict):
+        balances = balances.values()
+
+    rows = [
+        (entry["wallet"], token["mint"], token["symbol"], token["amount"])
+        for entry in balances
+        if entry and "error" not in entry
+        for token in entry["tokens"]
+    ]
+    return pd.DataFrame(
+        rows, columns=["wallet", "mint", "symbol", "amount"]
+    )
+
+
+def aggregate_wallet_balances(
+    balances: Union[Dict[str, Dict[str, Any]], Iterable[Dict[str, Any]]],
+    top_n: int = 5,
+) -> Dict[str, Any]:
+    """
+    Aggregates balances across many wallets in a single vectorized pass.
+
+    Args:
+        balances (Union[Dict[str, Dict[str, Any]], Iterable[Dict[str, Any]]]):
+            Output of ``check_wallets_batch`` or a list of ``get_balances`` results.
+        top_n (int): Number of top holders to report per mint.
+
+    Returns:
+        Dict[str, Any]: A dictionary with:
+            - ``total_sol``: SOL held across all wallets
+            - ``top_sol_holders``: largest SOL balances
+            - ``holdings``: per mint ``total`` amount and number of ``holders``,
+              largest first
+            - ``top_holders``: per mint list of the largest ``wallet``/``amount``
+            - ``failed``: wallets that could not be fetched
+    """
+    entries = list(
+        balances.values() if isinstance(balances, dict) else balances
+    )
+    valid = [entry for entry in entries if entry and "error" not in entry]
+
+    sol = pd.Series(
+        [entry["sol"] for entry in valid],
+        index=[entry["wallet"] for entry in valid],
+        dtype="float64",
+    )
+    frame = balances_to_frame(valid)
+
+    holdings = (
+        frame.groupby(["mint", "symbol"], sort=False)["amount"]
+        .agg(total="sum", holders="count")
+        .reset_index()
+        .sort_values("total", ascending=False)
+    )
+    top = (
+        frame.sort_values("amount", ascending=False)
+        .groupby("mint", sort=False)
+        .head(top_n)
+    )
+
+    return {
+        "total_sol": float(sol.sum()),
+        "top_sol_holders": [
+            {"wallet": wallet, "amount": float(amount)}
+            for wallet, amount in sol.nlargest(top_n).items()
+        ],
+        "holdings": holdings.to_dict("records"),
+        "top_holders": {
+            mint: group[["wallet", "amount"]].to_dict("records")
+            for mint, group in top.groupby("mint", sort=False)
+        },
+        "failed": [
+            entry.get("wallet")
+            for entry in entries
+            if entry and "error" in entry
+        ],
+    }
 
 
 def check_solana_balance(wallet_address: str) -> str:
@@ -113,8 +479,10 @@ def check_solana_balance(wallet_address: str) -> str:
         checker = SolanaWalletBalanceChecker(
             api_key=os.getenv("HELIUS_API_KEY")
         )
-        balance_info = checker.display_balances(wallet_address)
-        return str(balance_info)
+        balance_info = checker.get_balances(wallet_address)
+        if balance_info is None:
+            return "No balance data found or API request failed."
+        return format_object_to_string(balance_info)
     except Exception as e:
         raise TypeError(
             f"Invalid wallet_address: {wallet_address}. Error: {e}"
@@ -129,14 +497,35 @@ def check_multiple_wallets(wallet_addresses: list[str]) -> str:
         wallet_addresses (list[str]): A list of public keys of the Solana wallets.
 
     Returns:
-        list[str]: A list of string representations of the SOL and SPL token balances for each wallet address.
+        str: A string representation of the SOL and SPL token balances for each wallet address.
+    """
+    return format_object_to_string(
+        check_wallets_batch(wallet_addresses)
+    )
 
-    Raises:
-        ValueError: If any wallet_address in the list is not a string.
-        TypeError: If any wallet_address in the list is not a valid Solana wallet address.
+
+def check_wallets_batch(
+    wallet_addresses: List[str], max_workers: int = 16
+) -> Dict[str, Dict[str, Any]]:
     """
-    out = [
-        check_solana_balance(wallet_address)
-        for wallet_address in wallet_addresses
-    ]
-    return str(out)
+    Checks the SOL and SPL token balances for many Solana wallets at once.
+
+    The token list is loaded once (and cached on disk) and all wallets are
+    fetched concurrently over a single pooled session.
+
+    Args:
+        wallet_addresses (List[str]): The public keys of the Solana wallets.
+        max_workers (int): Maximum number of concurrent requests.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Balances keyed by wallet address. Each entry
+        has ``sol`` and ``tokens`` (amounts already scaled by decimals), or an
+        ``error`` message if that wallet could not be fetched.
+    """
+    checker = SolanaWalletBalanceChecker(
+        api_key=os.getenv("HELIUS_API_KEY"),
+        session=_pooled_session(max_workers),
+    )
+    return checker.get_balances_batch(
+        wallet_addresses, max_workers=max_workers
+    )
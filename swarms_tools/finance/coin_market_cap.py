@@ -1,12 +1,40 @@
+import json
 import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from swarms_tools.utils.cache import get_cache_dir
+from swarms_tools.utils.coin_index import CoinIndex
 from swarms_tools.utils.formatted_string import (
     format_object_to_string,
 )
 
+MAX_IDS_PER_REQUEST = 100
+MAX_LISTINGS_PER_REQUEST = 5000
+
+_session: Optional[requests.Session] = None
+_coin_map: Optional[List[Dict[str, Any]]] = None
+_coin_index: Optional[CoinIndex] = None
+_coin_map_lock = threading.Lock()
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=8),
+            )
+            _session = session
+        return _session
+
 
 class CoinMarketCapAPI:
     """
@@ -26,50 +54,269 @@ class CoinMarketCapAPI:
         """
         Fetch all possible data about one or more cryptocurrencies from CoinMarketCap.
 
+        Named coins are resolved to ids through the cached coin map and fetched
+        with batched ``/cryptocurrency/quotes/latest`` requests, so coins outside
+        the top listings page can be found too.
+
         Args:
-            coin_names (Optional[List[str]]): A list of coin names to fetch data for (e.g., ['Bitcoin', 'Ethereum']).
-                                              If None, fetches data for all available coins.
+            coin_names (Optional[List[str]]): A list of coin names, symbols or slugs to fetch data for
+                                              (e.g., ['Bitcoin', 'ETH']). If None, fetches the latest
+                                              listings (top 100 coins by market cap).
 
         Returns:
-            Dict[str, Any]: A dictionary containing the fetched cryptocurrency data.
+            Dict[str, Any]: A dictionary containing the fetched cryptocurrency data,
+                keyed by the requested name, symbol or slug (by coin name for
+                the latest listings).
 
         Raises:
             ValueError: If the API response contains errors or if the coin names are invalid.
             requests.RequestException: If the API request fails.
         """
-        endpoint = f"{CoinMarketCapAPI.BASE_URL}/cryptocurrency/listings/latest"
-        headers = {"X-CMC_PRO_API_KEY": CoinMarketCapAPI.API_KEY}
         logger.info(
             f"Fetching data from CoinMarketCap for coins: {coin_names or 'all available coins'}"
         )
 
         try:
-            response = requests.get(
-                endpoint, headers=headers, timeout=10
-            )
-            response.raise_for_status()
+            if not coin_names:
+                listings = CoinMarketCapAPI._get(
+                    "/cryptocurrency/listings/latest"
+                )
+                return CoinMarketCapAPI._filter_data(listings, None)
+
+            ids = CoinMarketCapAPI.resolve_ids(coin_names)
+            missing = [name for name in coin_names if name not in ids]
+            if missing:
+                logger.warning(
+                    f"No CoinMarketCap id found for: {missing}"
+                )
+            quotes = CoinMarketCapAPI.fetch_quotes(list(ids.values()))
         except requests.RequestException as e:
             logger.error(
                 f"Failed to fetch data from CoinMarketCap API: {e}"
             )
             raise
 
-        data = response.json()
-        logger.debug(f"Raw data received: {data}")
+        filtered_data = {
+            coin: quotes[str(coin_id)]
+            for coin, coin_id in ids.items()
+            if str(coin_id) in quotes
+        }
+        logger.info(f"Returning data for {len(filtered_data)} coins")
+        return filtered_data
+
+    @staticmethod
+    def _get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Perform a GET request over the pooled session and unwrap ``data``.
 
+        Raises:
+            ValueError: If the API response contains errors.
+            requests.RequestException: If the API request fails.
+        """
+        response = _get_session().get(
+            f"{CoinMarketCapAPI.BASE_URL}{path}",
+            headers={"X-CMC_PRO_API_KEY": CoinMarketCapAPI.API_KEY},
+            params=params,
+            timeout=10,
+        )
+        response.raise_for_status()
+        data = response.json()
         if data.get("status", {}).get("error_code") != 0:
-            logger.error(
-                f"Error from CoinMarketCap API: {data['status'].get('error_message', 'Unknown error')}"
+            message = data.get("status", {}).get(
+                "error_message", "Unknown error"
             )
-            raise ValueError(
-                f"CoinMarketCap API error: {data['status'].get('error_message', 'Unknown error')}"
+            logger.error(f"Error from CoinMarketCap API: {message}")
+            raise ValueError(f"CoinMarketCap API error: {message}")
+        return data["data"]
+
+    @staticmethod
+    def iter_listings(
+        page_size: int = MAX_LISTINGS_PER_REQUEST,
+        max_coins: Optional[int] = None,
+        **params: Any,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Page through ``/cryptocurrency/listings/latest`` with ``start``/``limit``.
+
+        Args:
+            page_size (int): Coins per request, at most 5000.
+            max_coins (Optional[int]): Stop after this many coins. All coins if None.
+            **params: Extra query parameters, e.g. ``convert="EUR"``,
+                ``sort="volume_24h"`` or ``aux="cmc_rank,circulating_supply"``
+                to limit the returned fields.
+
+        Yields:
+            List[Dict[str, Any]]: One page of listings at a time.
+
+        Raises:
+            ValueError: If the API response contains errors.
+            requests.RequestException: If the API request fails.
+        """
+        start = 1
+        while max_coins is None or start <= max_coins:
+            limit = page_size
+            if max_coins is not None:
+                limit = min(limit, max_coins - start + 1)
+            page = CoinMarketCapAPI._get(
+                "/cryptocurrency/listings/latest",
+                {**params, "start": start, "limit": limit},
             )
+            if page:
+                yield page
+            if len(page) < limit:
+                return
+            start += limit
+
+    @staticmethod
+    def fetch_coin_map(
+        max_age: float = 86400, force_refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the ``/cryptocurrency/map`` listing of active coins.
+
+        The map is kept in memory and on disk, and re-downloaded once the disk
+        copy is older than ``max_age``.
+
+        Args:
+            max_age (float): Seconds before the cached map is refreshed.
+            force_refresh (bool): Ignore any cached copy.
 
-        filtered_data = CoinMarketCapAPI._filter_data(
-            data["data"], coin_names
+        Returns:
+            List[Dict[str, Any]]: Entries with ``id``, ``name``, ``symbol``,
+            ``slug``, ``rank`` and ``platform``.
+
+        Raises:
+            ValueError: If the API response contains errors.
+            requests.RequestException: If the API request fails.
+        """
+        global _coin_map, _coin_index
+        path = get_cache_dir("coinmarketcap") / "map.json"
+        with _coin_map_lock:
+            fresh = (
+                not force_refresh
+                and path.exists()
+                and time.time() - path.stat().st_mtime < max_age
+            )
+            if fresh and _coin_map is not None:
+                return _coin_map
+            if fresh:
+                with open(path) as f:
+                    _coin_map = json.load(f)
+            else:
+                coin_map: List[Dict[str, Any]] = []
+                start = 1
+                while True:
+                    page = CoinMarketCapAPI._get(
+                        "/cryptocurrency/map",
+                        {
+                            "start": start,
+                            "limit": MAX_LISTINGS_PER_REQUEST,
+                        },
+                    )
+                    coin_map.extend(page)
+                    if len(page) < MAX_LISTINGS_PER_REQUEST:
+                        break
+                    start += MAX_LISTINGS_PER_REQUEST
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(coin_map, f)
+                os.replace(tmp_path, path)
+                _coin_map = coin_map
+                logger.info(
+                    f"Downloaded CoinMarketCap map: {len(coin_map)} coins"
+                )
+            _coin_index = None
+            return _coin_map
+
+    @staticmethod
+    def build_index(
+        coin_map: Optional[List[Dict[str, Any]]] = None,
+    ) -> CoinIndex:
+        """
+        Build a ``CoinIndex`` over the coin map.
+
+        Args:
+            coin_map (Optional[List[Dict[str, Any]]]): Map entries, defaults to
+                the cached ``fetch_coin_map()``.
+
+        Returns:
+            CoinIndex: Names, slugs, symbols and token addresses -> CoinMarketCap id.
+        """
+        if coin_map is None:
+            coin_map = CoinMarketCapAPI.fetch_coin_map()
+        return CoinIndex.from_coins(
+            {
+                "id": coin["id"],
+                "name": coin["name"],
+                "symbol": coin["symbol"],
+                "slug": coin["slug"],
+                "rank": coin.get("rank"),
+                "addresses": (
+                    [coin["platform"]["token_address"]]
+                    if coin.get("platform")
+                    else []
+                ),
+            }
+            for coin in coin_map
         )
-        logger.info(f"Filtered data: {filtered_data}")
-        return filtered_data
+
+    @staticmethod
+    def resolve_ids(
+        coins: List[str], fuzzy: bool = False
+    ) -> Dict[str, int]:
+        """
+        Map coin names, symbols, slugs or token addresses to CoinMarketCap ids.
+
+        Args:
+            coins (List[str]): E.g. ``["Bitcoin", "ETH", "tether"]``.
+            fuzzy (bool): Fall back to the closest coin name for unknown inputs.
+
+        Returns:
+            Dict[str, int]: Each resolvable input mapped to its id.
+        """
+        global _coin_index
+        coin_map = CoinMarketCapAPI.fetch_coin_map()
+        with _coin_map_lock:
+            if _coin_index is None:
+                _coin_index = CoinMarketCapAPI.build_index(coin_map)
+            index = _coin_index
+        resolved = {coin: index.get(coin, fuzzy=fuzzy) for coin in coins}
+        return {
+            coin: coin_id
+            for coin, coin_id in resolved.items()
+            if coin_id is not None
+        }
+
+    @staticmethod
+    def fetch_quotes(
+        ids: List[int], **params: Any
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch ``/cryptocurrency/quotes/latest`` for many ids in batched requests.
+
+        Args:
+            ids (List[int]): CoinMarketCap ids.
+            **params: Extra query parameters, e.g. ``convert="EUR"`` or
+                ``aux="cmc_rank"`` to limit the returned fields.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Quote data keyed by id (as a string).
+
+        Raises:
+            ValueError: If the API response contains errors.
+            requests.RequestException: If the API request fails.
+        """
+        quotes: Dict[str, Dict[str, Any]] = {}
+        unique_ids = list(dict.fromkeys(ids))
+        for i in range(0, len(unique_ids), MAX_IDS_PER_REQUEST):
+            batch = unique_ids[i : i + MAX_IDS_PER_REQUEST]
+            quotes.update(
+                CoinMarketCapAPI._get(
+                    "/cryptocurrency/quotes/latest",
+                    {**params, "id": ",".join(map(str, batch))},
+                )
+            )
+        return quotes
 
     @staticmethod
     def _filter_data(
@@ -88,11 +335,11 @@ class CoinMarketCapAPI:
         if not coin_names:
             return {coin["name"]: coin for coin in data}
 
+        wanted = {name.lower() for name in coin_names}
         filtered_data = {
             coin["name"]: coin
             for coin in data
-            if coin["name"].lower()
-            in {name.lower() for name in coin_names}
+            if coin["name"].lower() in wanted
         }
         if not filtered_data:
             logger.warning(
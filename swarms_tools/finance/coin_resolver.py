@@ -0,0 +1,277 @@
+"""
+Coin Identifier Resolver
+
+Maps whatever an agent passes for a coin ("BTC", "Bitcoin", "wrapped-bitcoin"
+or a contract address) to the id each data provider expects. The index is
+built once from the CoinGecko and CoinMarketCap coin lists, persisted in the
+cache directory and reloaded by later processes.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+from loguru import logger
+
+from swarms_tools.finance.coin_market_cap import CoinMarketCapAPI
+from swarms_tools.utils.cache import get_cache_dir
+from swarms_tools.utils.coin_index import (
+    CoinId,
+    CoinIndex,
+    normalize_key,
+)
+
+COINGECKO_COIN_LIST_URL = "https://api.coingecko.com/api/v3/coins/list"
+PROVIDERS = ("coingecko", "coinmarketcap")
+
+
+def fetch_coingecko_coins(
+    cmc_ranks: Optional[Dict[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Download CoinGecko's coin list as ``CoinIndex`` entries.
+
+    CoinGecko's list has no ranking, so symbol collisions (dozens of coins use
+    "btc") are broken with CoinMarketCap ranks matched by name, then by
+    preferring native coins over tokens.
+
+    Args:
+        cmc_ranks (Optional[Dict[str, int]]): Normalized coin name -> CoinMarketCap rank.
+
+    Returns:
+        List[Dict[str, Any]]: Entries with ``id``, ``name``, ``symbol``,
+        ``addresses`` and ``rank``.
+
+    Raises:
+        requests.RequestException: If the API request fails.
+    """
+    response = requests.get(
+        COINGECKO_COIN_LIST_URL,
+        params={"include_platform": "true"},
+        timeout=30,
+    )
+    response.raise_for_status()
+    cmc_ranks = cmc_ranks or {}
+    coins = []
+    for coin in response.json():
+        addresses = [
+            address
+            for address in (coin.get("platforms") or {}).values()
+            if address
+        ]
+        rank = cmc_ranks.get(normalize_key(coin["name"]))
+        if rank is None:
+            # Unranked coins sort after ranked ones; native coins first.
+            rank = 10**9 + (1 if addresses else 0)
+        coins.append(
+            {
+                "id": coin["id"],
+                "name": coin["name"],
+                "symbol": coin["symbol"],
+                "addresses": addresses,
+                "rank": rank,
+            }
+        )
+    return coins
+
+
+class CoinResolver:
+    """
+    Per-provider coin indexes with O(1) lookups and fuzzy fallback.
+    """
+
+    def __init__(self, indexes: Optional[Dict[str, CoinIndex]] = None):
+        """
+        Args:
+            indexes (Optional[Dict[str, CoinIndex]]): Provider name -> index.
+        """
+        self.indexes = indexes or {}
+
+    @classmethod
+    def build(cls) -> "CoinResolver":
+        """
+        Build indexes from the CoinMarketCap map and the CoinGecko coin list.
+
+        A provider that cannot be reached (e.g. no CoinMarketCap API key) is
+        logged and left out.
+
+        Returns:
+            CoinResolver: The resolver.
+        """
+        indexes: Dict[str, CoinIndex] = {}
+        cmc_ranks: Dict[str, int] = {}
+        try:
+            coin_map = CoinMarketCapAPI.fetch_coin_map()
+            indexes["coinmarketcap"] = CoinMarketCapAPI.build_index(
+                coin_map
+            )
+            for coin in coin_map:
+                if coin.get("rank"):
+                    cmc_ranks.setdefault(
+                        normalize_key(coin["name"]), coin["rank"]
+                    )
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Skipping CoinMarketCap coin index: {e}")
+
+        try:
+            indexes["coingecko"] = CoinIndex.from_coins(
+                fetch_coingecko_coins(cmc_ranks)
+            )
+        except requests.RequestException as e:
+            logger.warning(f"Skipping CoinGecko coin index: {e}")
+        return cls(indexes)
+
+    def resolve(
+        self, query: str, provider: str = "coingecko", fuzzy: bool = False
+    ) -> Optional[CoinId]:
+        """
+        Resolve a coin identifier to a provider id.
+
+        Args:
+            query (str): Id, name, slug, contract address or symbol.
+            provider (str): "coingecko" or "coinmarketcap".
+            fuzzy (bool): Fall back to the closest coin name on a miss.
+
+        Returns:
+            Optional[CoinId]: The provider id, or None if nothing matched or the
+            provider's index is unavailable.
+
+        Raises:
+            ValueError: If the provider is unknown.
+        """
+        if provider not in PROVIDERS:
+            raise ValueError(
+                f"Invalid provider: {provider}. Must be one of {list(PROVIDERS)}."
+            )
+        index = self.indexes.get(provider)
+        if index is None:
+            return None
+        return index.get(query, fuzzy=fuzzy)
+
+    def save(self, path: os.PathLike) -> None:
+        """Write the indexes to ``path`` as JSON (atomically)."""
+        tmp_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    provider: index.to_dict()
+                    for provider, index in self.indexes.items()
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: os.PathLike) -> "CoinResolver":
+        """Read indexes written by ``save``."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(
+            {
+                provider: CoinIndex.from_dict(index)
+                for provider, index in data.items()
+            }
+        )
+
+
+_resolver: Optional[CoinResolver] = None
+_resolver_lock = threading.Lock()
+# Wall-clock time the in-memory resolver was built or its file written.
+_resolver_refreshed_at: Optional[float] = None
+# Monotonic time of the last build attempt, for the retry cooldown.
+_resolver_attempted_at: Optional[float] = None
+
+
+def _load_cached_resolver(path: os.PathLike) -> Optional[CoinResolver]:
+    try:
+        return CoinResolver.load(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable coin index {path}: {e}")
+        return None
+
+
+def get_coin_resolver(
+    max_age: float = 86400,
+    force_refresh: bool = False,
+    retry_after: float = 300,
+) -> CoinResolver:
+    """
+    Return the shared resolver, loading it from disk or building it if needed.
+
+    A rebuild that fails or yields no indexes keeps the previous resolver
+    (or the stale on-disk index) and is not retried for ``retry_after``
+    seconds.
+
+    Args:
+        max_age (float): Seconds before the persisted index is rebuilt.
+        force_refresh (bool): Rebuild even if a fresh index exists.
+        retry_after (float): Seconds to wait before retrying a failed build.
+
+    Returns:
+        CoinResolver: The shared resolver.
+    """
+    global _resolver, _resolver_refreshed_at, _resolver_attempted_at
+    path = get_cache_dir("resolver") / "coin_index.json"
+    with _resolver_lock:
+        if not force_refresh:
+            if (
+                _resolver is not None
+                and _resolver_refreshed_at is not None
+                and time.time() - _resolver_refreshed_at < max_age
+            ):
+                return _resolver
+
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                mtime = None
+            if mtime is not None and time.time() - mtime < max_age:
+                loaded = _load_cached_resolver(path)
+                if loaded is not None:
+                    _resolver, _resolver_refreshed_at = loaded, mtime
+                    return _resolver
+
+            if (
+                _resolver_attempted_at is not None
+                and time.monotonic() - _resolver_attempted_at < retry_after
+            ):
+                if _resolver is None:
+                    _resolver = _load_cached_resolver(path) or CoinResolver()
+                return _resolver
+
+        _resolver_attempted_at = time.monotonic()
+        built = CoinResolver.build()
+        if not built.indexes:
+            logger.warning(
+                f"Coin index build returned nothing, retrying in {retry_after}s"
+            )
+            if _resolver is None:
+                _resolver = _load_cached_resolver(path) or built
+            return _resolver
+
+        _resolver, _resolver_refreshed_at = built, time.time()
+        try:
+            built.save(path)
+        except OSError as e:
+            logger.warning(f"Could not persist coin index: {e}")
+        return _resolver
+
+
+def resolve_coin_id(
+    query: str, provider: str = "coingecko", fuzzy: bool = False
+) -> Optional[CoinId]:
+    """
+    Resolve a coin name, symbol, slug or contract address to a provider id.
+
+    Args:
+        query (str): E.g. "BTC", "Bitcoin" or "0xa0b8...eb48".
+        provider (str): "coingecko" or "coinmarketcap".
+        fuzzy (bool): Fall back to the closest coin name on a miss.
+
+    Returns:
+        Optional[CoinId]: The provider id, or None if nothing matched.
+    """
+    return get_coin_resolver().resolve(query, provider, fuzzy)
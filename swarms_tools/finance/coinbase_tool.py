@@ -3,13 +3,18 @@ import hashlib
 import hmac
 import json
 import os
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from decimal import Decimal
-from typing import Any, Dict, Union
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 from swarms_tools.utils.formatted_string import (
     format_object_to_string,
 )
@@ -18,6 +23,190 @@ from swarms_tools.utils.formatted_string import (
 # Constants
 BASE_URL = "https://api.pro.coinbase.com"
 SANDBOX_URL = "https://api-public.sandbox.pro.coinbase.com"
+# Order statuses after which an order no longer changes.
+FINAL_ORDER_STATUSES = ("done", "rejected")
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return a pooled session shared by the Coinbase helpers."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=2, pool_maxsize=32),
+            )
+        return _session
+
+
+def _validate_symbol(symbol: str) -> None:
+    if "-" not in symbol:
+        raise ValueError(
+            f"Invalid symbol format: {symbol}. Expected format: 'BTC-USD'"
+        )
+
+
+def _fetch_json(url: str, timeout: float = 10) -> Dict[str, Any]:
+    response = _get_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def _build_coin_data(
+    symbol: str,
+    ticker: Dict[str, Any],
+    stats: Dict[str, Any],
+    as_float: bool = False,
+    include_raw: bool = True,
+) -> Dict[str, Any]:
+    """
+    Build the ``get_coin_data`` schema from ticker and 24h stats payloads.
+
+    Args:
+        symbol: Trading symbol
+        ticker: ``/products/{symbol}/ticker`` payload
+        stats: ``/products/{symbol}/stats`` payload
+        as_float: Convert numbers with ``float`` instead of ``Decimal``
+        include_raw: Embed the raw payloads under ``raw_data``
+
+    Returns:
+        Dictionary with price, volume and 24h market data
+    """
+
+    def number(data: Dict[str, Any], key: str) -> Union[float, Decimal]:
+        value = data.get(key) or "0"
+        return float(value) if as_float else Decimal(str(value))
+
+    coin_data = {
+        "symbol": symbol,
+        "price": {
+            "current": number(ticker, "price"),
+            "bid": number(ticker, "bid"),
+            "ask": number(ticker, "ask"),
+        },
+        "volume": {
+            "24h": number(stats, "volume"),
+            "last_trade": number(ticker, "volume"),
+        },
+        "market_data": {
+            "24h_high": number(stats, "high"),
+            "24h_low": number(stats, "low"),
+            "24h_open": number(stats, "open"),
+        },
+        "timestamp": datetime.now().isoformat(),
+    }
+    if include_raw:
+        coin_data["raw_data"] = {"ticker": ticker, "stats": stats}
+    return coin_data
+
+
+def fetch_products_data(
+    symbols: List[str],
+    sandbox: bool = False,
+    as_float: bool = False,
+    include_raw: bool = False,
+    max_workers: int = 32,
+    timeout: float = 10,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch ticker and 24h stats for many products in one concurrent round.
+
+    Every ticker and stats request is issued in parallel over a pooled
+    session, so refreshing 100 products costs roughly one round trip per
+    ``max_workers`` requests instead of two sequential requests per product.
+
+    Args:
+        symbols: Trading symbols (e.g., ['BTC-USD', 'ETH-USD'])
+        sandbox: Whether to use sandbox environment
+        as_float: Return floats instead of Decimals, for analytics consumers
+        include_raw: Embed the raw payloads under ``raw_data``
+        max_workers: Maximum number of concurrent requests
+        timeout: Timeout in seconds for each request
+
+    Returns:
+        Dictionary of ``get_coin_data`` structures keyed by symbol; products
+        that failed or returned malformed data map to ``{"error": ...}``.
+    """
+    base_url = SANDBOX_URL if sandbox else BASE_URL
+    results: Dict[str, Dict[str, Any]] = {}
+    valid_symbols = []
+    for symbol in dict.fromkeys(symbols):
+        try:
+            _validate_symbol(symbol)
+            valid_symbols.append(symbol)
+        except ValueError as e:
+            results[symbol] = {"error": str(e)}
+    if not valid_symbols:
+        return results
+
+    logger.info(f"Fetching data for {len(valid_symbols)} products")
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, 2 * len(valid_symbols))
+    ) as executor:
+        futures: Dict[str, Tuple[Any, Any]] = {
+            symbol: (
+                executor.submit(
+                    _fetch_json,
+                    f"{base_url}/products/{symbol}/ticker",
+                    timeout,
+                ),
+                executor.submit(
+                    _fetch_json,
+                    f"{base_url}/products/{symbol}/stats",
+                    timeout,
+                ),
+            )
+            for symbol in valid_symbols
+        }
+        for symbol, (ticker, stats) in futures.items():
+            try:
+                results[symbol] = _build_coin_data(
+                    symbol,
+                    ticker.result(),
+                    stats.result(),
+                    as_float=as_float,
+                    include_raw=include_raw,
+                )
+            except (ValueError, InvalidOperation) as e:
+                # Non-JSON body or a malformed numeric field. Checked first
+                # because requests' JSONDecodeError is also a RequestException.
+                logger.error(f"Invalid data for {symbol}: {e!r}")
+                results[symbol] = {"error": f"Invalid data: {e!r}"}
+            except requests.RequestException as e:
+                logger.error(
+                    f"API error fetching data for {symbol}: {str(e)}"
+                )
+                results[symbol] = {"error": str(e)}
+    return results
+
+
+def _is_ambiguous(error: requests.RequestException) -> bool:
+    """Whether a failed request may still have reached the exchange."""
+    response = getattr(error, "response", None)
+    return response is None or response.status_code >= 500
+
+
+@lru_cache(maxsize=4)
+def _decode_secret(api_secret: str) -> bytes:
+    return base64.b64decode(api_secret)
+
+
+def _sign(
+    hmac_key: bytes,
+    timestamp: str,
+    method: str,
+    request_path: str,
+    body: str = "",
+) -> str:
+    message = timestamp + method + request_path + (body or "")
+    signature = hmac.new(
+        hmac_key, message.encode("utf-8"), hashlib.sha256
+    )
+    return base64.b64encode(signature.digest()).decode("utf-8")
 
 
 def create_auth_headers(
@@ -38,24 +227,339 @@ def create_auth_headers(
     api_secret = os.getenv("COINBASE_API_SECRET")
     passphrase = os.getenv("COINBASE_API_PASSPHRASE")
     timestamp = str(time.time())
-    message = timestamp + method + request_path + (body or "")
-    hmac_key = base64.b64decode(api_secret)
-    signature = hmac.new(
-        hmac_key, message.encode("utf-8"), hashlib.sha256
-    )
-    signature_b64 = base64.b64encode(signature.digest()).decode(
-        "utf-8"
-    )
 
     return {
         "CB-ACCESS-KEY": api_key,
-        "CB-ACCESS-SIGN": signature_b64,
+        "CB-ACCESS-SIGN": _sign(
+            _decode_secret(api_secret),
+            timestamp,
+            method,
+            request_path,
+            body,
+        ),
         "CB-ACCESS-TIMESTAMP": timestamp,
         "CB-ACCESS-PASSPHRASE": passphrase,
         "Content-Type": "application/json",
     }
 
 
+class CoinbaseOrderManager:
+    """
+    Places and tracks Coinbase orders with idempotent client order IDs.
+
+    Credentials are read and the signing key decoded once per manager. Every
+    order carries a ``client_oid``; if a request fails without a clear answer
+    (timeout, dropped connection, 5xx), the manager looks the order up by that
+    id and only re-submits, with exponential backoff, once the lookup
+    definitively reports that the order does not exist. A retry therefore
+    never places the order twice.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        passphrase: Optional[str] = None,
+        sandbox: bool = False,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        max_workers: int = 16,
+        retry_delay: float = 0.5,
+    ):
+        """
+        Args:
+            api_key: Coinbase API key, defaults to ``COINBASE_API_KEY``
+            api_secret: Base64 API secret, defaults to ``COINBASE_API_SECRET``
+            passphrase: API passphrase, defaults to ``COINBASE_API_PASSPHRASE``
+            sandbox: Whether to use sandbox environment
+            base_url: Override the API URL, e.g. for a local stub server
+            session: Session to send requests with, defaults to the pooled one
+            max_workers: Maximum number of concurrent status requests
+            retry_delay: Initial delay in seconds between retries, doubled
+                after every attempt
+
+        Raises:
+            ValueError: If a credential is neither passed nor set in the environment
+        """
+        self.api_key = api_key or os.getenv("COINBASE_API_KEY")
+        self.passphrase = passphrase or os.getenv(
+            "COINBASE_API_PASSPHRASE"
+        )
+        api_secret = api_secret or os.getenv("COINBASE_API_SECRET")
+        missing = [
+            name
+            for name, value in (
+                ("COINBASE_API_KEY", self.api_key),
+                ("COINBASE_API_SECRET", api_secret),
+                ("COINBASE_API_PASSPHRASE", self.passphrase),
+            )
+            if not value
+        ]
+        if missing:
+            raise ValueError(
+                f"Missing Coinbase credentials: {', '.join(missing)}"
+            )
+        self._hmac_key = _decode_secret(api_secret)
+        self.base_url = base_url or (
+            SANDBOX_URL if sandbox else BASE_URL
+        )
+        self.session = session or _get_session()
+        self.max_workers = max_workers
+        self.retry_delay = retry_delay
+
+    def _headers(
+        self, method: str, request_path: str, body: str = ""
+    ) -> Dict[str, str]:
+        timestamp = str(time.time())
+        return {
+            "CB-ACCESS-KEY": self.api_key,
+            "CB-ACCESS-SIGN": _sign(
+                self._hmac_key, timestamp, method, request_path, body
+            ),
+            "CB-ACCESS-TIMESTAMP": timestamp,
+            "CB-ACCESS-PASSPHRASE": self.passphrase,
+            "Content-Type": "application/json",
+        }
+
+    def _request(
+        self,
+        method: str,
+        request_path: str,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        body = json.dumps(payload) if payload is not None else ""
+        response = self.session.request(
+            method,
+            f"{self.base_url}{request_path}",
+            headers=self._headers(method, request_path, body),
+            data=body or None,
+            timeout=10,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str = "market",
+        size: Optional[Union[str, float, Decimal]] = None,
+        funds: Optional[Union[str, float, Decimal]] = None,
+        price: Optional[Union[str, float, Decimal]] = None,
+        client_oid: Optional[str] = None,
+        max_retries: int = 2,
+    ) -> Dict[str, Any]:
+        """
+        Place an order, retrying safely on ambiguous failures.
+
+        Args:
+            symbol: Trading symbol (e.g., 'BTC-USD')
+            side: 'buy' or 'sell'
+            order_type: 'market' or 'limit'
+            size: Amount in base currency
+            funds: Amount in quote currency (market orders only)
+            price: Limit price (limit orders only)
+            client_oid: Client order ID, a new UUID if omitted
+            max_retries: Retries after a timeout, connection error or 5xx
+
+        Returns:
+            Order details from Coinbase, including ``client_oid``
+
+        Raises:
+            ValueError: If the symbol or side is invalid
+            requests.RequestException: If the order could not be placed, or
+                its state could not be determined after an ambiguous failure
+        """
+        _validate_symbol(symbol)
+        if side not in ("buy", "sell"):
+            raise ValueError(f"Invalid side: {side}")
+
+        order_data = {
+            "client_oid": client_oid or str(uuid.uuid4()),
+            "product_id": symbol,
+            "side": side,
+            "type": order_type,
+        }
+        for key, value in (
+            ("size", size),
+            ("funds", funds),
+            ("price", price),
+        ):
+            if value is not None:
+                order_data[key] = str(value)
+
+        logger.info(
+            f"Placing {side} order for {symbol} ({order_data['client_oid']})"
+        )
+        for attempt in range(max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                return self._request("POST", "/orders", order_data)
+            except requests.RequestException as e:
+                if not _is_ambiguous(e):
+                    raise
+                logger.warning(
+                    f"Order {order_data['client_oid']} failed ambiguously: {e}"
+                )
+                existing = self._find_order(
+                    order_data["client_oid"], e, max_retries
+                )
+                if existing is not None:
+                    return existing
+                if attempt == max_retries:
+                    raise
+
+    def _find_order(
+        self,
+        client_oid: str,
+        error: requests.RequestException,
+        max_retries: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up an order after an ambiguous failure.
+
+        Returns:
+            The order, or None if Coinbase reports that it does not exist
+
+        Raises:
+            requests.RequestException: ``error``, if every lookup failed and
+                the order's state is unknown
+        """
+        for attempt in range(max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                return self.get_order_by_client_oid(client_oid)
+            except requests.RequestException as e:
+                logger.warning(f"Lookup of order {client_oid} failed: {e}")
+                lookup_error = e
+        raise error from lookup_error
+
+    def place_market_buy(
+        self,
+        symbol: str,
+        funds: Union[str, float, Decimal],
+        client_oid: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Buy ``funds`` worth (in quote currency) of ``symbol`` at market."""
+        return self.place_order(
+            symbol, "buy", funds=funds, client_oid=client_oid
+        )
+
+    def place_market_sell(
+        self,
+        symbol: str,
+        size: Union[str, float, Decimal],
+        client_oid: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Sell ``size`` (in base currency) of ``symbol`` at market."""
+        return self.place_order(
+            symbol, "sell", size=size, client_oid=client_oid
+        )
+
+    def get_order(self, order_id: str) -> Dict[str, Any]:
+        """Fetch an order by its exchange ID."""
+        return self._request("GET", f"/orders/{order_id}")
+
+    def get_order_by_client_oid(
+        self, client_oid: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch an order by client order ID, or None if it does not exist."""
+        try:
+            return self._request("GET", f"/orders/client:{client_oid}")
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    def poll_orders(
+        self, order_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch the status of many orders in one concurrent sweep.
+
+        Args:
+            order_ids: Exchange order IDs
+
+        Returns:
+            Order details keyed by ID; failed lookups map to ``{"error": ...}``
+        """
+
+        def fetch(order_id: str) -> Dict[str, Any]:
+            try:
+                return self.get_order(order_id)
+            except requests.RequestException as e:
+                return {"error": str(e)}
+
+        if not order_ids:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(order_ids))
+        ) as executor:
+            return dict(zip(order_ids, executor.map(fetch, order_ids)))
+
+    def wait_for_orders(
+        self,
+        order_ids: List[str],
+        interval: float = 1.0,
+        timeout: float = 60.0,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Poll until every order is final or ``timeout`` expires.
+
+        An order is final once its status is in ``FINAL_ORDER_STATUSES`` or
+        its lookup returned an ``{"error": ...}`` entry.
+
+        Args:
+            order_ids: Exchange order IDs
+            interval: Seconds between sweeps
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The latest details of every order; check ``status`` for those still open
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = list(order_ids)
+        deadline = time.monotonic() + timeout
+        while pending:
+            results.update(self.poll_orders(pending))
+            pending = [
+                order_id
+                for order_id in pending
+                if "error" not in results[order_id]
+                and results[order_id].get("status")
+                not in FINAL_ORDER_STATUSES
+            ]
+            if not pending or time.monotonic() + interval > deadline:
+                break
+            time.sleep(interval)
+        return results
+
+
+_order_managers: Dict[
+    bool, Tuple[Tuple[Optional[str], ...], CoinbaseOrderManager]
+] = {}
+_order_managers_lock = threading.Lock()
+
+
+def _get_order_manager(sandbox: bool) -> CoinbaseOrderManager:
+    """Return the shared manager, rebuilt when the environment credentials change."""
+    credentials = (
+        os.getenv("COINBASE_API_KEY"),
+        os.getenv("COINBASE_API_SECRET"),
+        os.getenv("COINBASE_API_PASSPHRASE"),
+    )
+    with _order_managers_lock:
+        cached = _order_managers.get(sandbox)
+        if cached is None or cached[0] != credentials:
+            cached = _order_managers[sandbox] = (
+                credentials,
+                CoinbaseOrderManager(*credentials, sandbox=sandbox),
+            )
+        return cached[1]
+
+
 def get_coin_data(
     symbol: str, sandbox: bool = False
 ) -> Dict[str, Any]:
@@ -74,48 +578,22 @@ def get_coin_data(
         requests.RequestException: For API errors
     """
     try:
-        if "-" not in symbol:
-            raise ValueError(
-                f"Invalid symbol format: {symbol}. Expected format: 'BTC-USD'"
-            )
+        _validate_symbol(symbol)
 
         base_url = SANDBOX_URL if sandbox else BASE_URL
         logger.info(f"Fetching data for {symbol}")
 
-        # Get ticker data
-        ticker_response = requests.get(
-            f"{base_url}/products/{symbol}/ticker"
-        )
-        ticker_response.raise_for_status()
-        ticker = ticker_response.json()
+        # Get ticker data and 24h stats concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ticker, stats = executor.map(
+                _fetch_json,
+                [
+                    f"{base_url}/products/{symbol}/ticker",
+                    f"{base_url}/products/{symbol}/stats",
+                ],
+            )
 
-        # Get 24h stats
-        stats_response = requests.get(
-            f"{base_url}/products/{symbol}/stats"
-        )
-        stats_response.raise_for_status()
-        stats = stats_response.json()
-
-        # Format the response
-        coin_data = {
-            "symbol": symbol,
-            "price": {
-                "current": Decimal(str(ticker.get("price", "0"))),
-                "bid": Decimal(str(ticker.get("bid", "0"))),
-                "ask": Decimal(str(ticker.get("ask", "0"))),
-            },
-            "volume": {
-                "24h": Decimal(str(stats.get("volume", "0"))),
-                "last_trade": Decimal(str(ticker.get("volume", "0"))),
-            },
-            "market_data": {
-                "24h_high": Decimal(str(stats.get("high", "0"))),
-                "24h_low": Decimal(str(stats.get("low", "0"))),
-                "24h_open": Decimal(str(stats.get("open", "0"))),
-            },
-            "timestamp": datetime.now().isoformat(),
-            "raw_data": {"ticker": ticker, "stats": stats},
-        }
+        coin_data = _build_coin_data(symbol, ticker, stats)
 
         logger.success(f"Successfully fetched data for {symbol}")
         return format_object_to_string(coin_data)
@@ -130,6 +608,24 @@ def get_coin_data(
         raise
 
 
+def get_multiple_coin_data(
+    symbols: List[str], sandbox: bool = False
+) -> str:
+    """
+    Fetch price, volume and 24h market data for several products at once.
+
+    Args:
+        symbols: Trading symbols (e.g., ['BTC-USD', 'ETH-USD'])
+        sandbox: Whether to use sandbox environment
+
+    Returns:
+        Formatted coin data keyed by symbol; failed products contain an error
+    """
+    return format_object_to_string(
+        fetch_products_data(symbols, sandbox=sandbox, as_float=True)
+    )
+
+
 def place_buy_order(
     symbol: str,
     amount: Union[str, float, Decimal],
@@ -150,27 +646,10 @@ def place_buy_order(
         Order details from Coinbase
     """
     try:
-        base_url = SANDBOX_URL if sandbox else BASE_URL
-        endpoint = "/orders"
-
-        order_data = {
-            "product_id": symbol,
-            "side": "buy",
-            "type": "market",
-            "funds": str(amount),
-        }
-
-        headers = create_auth_headers(
-            "POST", endpoint, json.dumps(order_data)
-        )
-
         logger.info(f"Placing buy order for {amount} {symbol}")
-        response = requests.post(
-            f"{base_url}{endpoint}", headers=headers, json=order_data
+        order = _get_order_manager(sandbox).place_market_buy(
+            symbol, amount
         )
-        response.raise_for_status()
-
-        order = response.json()
         logger.success(f"Successfully placed buy order for {symbol}")
         return format_object_to_string(order)
 
@@ -203,27 +682,10 @@ def place_sell_order(
         Order details from Coinbase
     """
     try:
-        base_url = SANDBOX_URL if sandbox else BASE_URL
-        endpoint = "/orders"
-
-        order_data = {
-            "product_id": symbol,
-            "side": "sell",
-            "type": "market",
-            "size": str(amount),
-        }
-
-        headers = create_auth_headers(
-            "POST", endpoint, json.dumps(order_data)
-        )
-
         logger.info(f"Placing sell order for {amount} {symbol}")
-        response = requests.post(
-            f"{base_url}{endpoint}", headers=headers, json=order_data
+        order = _get_order_manager(sandbox).place_market_sell(
+            symbol, amount
         )
-        response.raise_for_status()
-
-        order = response.json()
         logger.success(f"Successfully placed sell order for {symbol}")
         return format_object_to_string(order)
 
@@ -1,12 +1,33 @@
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, List, Optional
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
+from swarms_tools.finance.coin_resolver import resolve_coin_id
 from swarms_tools.utils.formatted_string import (
     format_object_to_string,
 )
 
+MAX_IDS_PER_REQUEST = 250
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=8),
+            )
+            _session = session
+        return _session
+
 
 class CoinGeckoAPI:
     """
@@ -54,6 +75,147 @@ class CoinGeckoAPI:
         # logger.info(f"Formatted data for coin ID {coin_id}: {formatted_data}")
         return format_object_to_string(formatted_data)
 
+    @staticmethod
+    def _get(path: str, params: Dict[str, Any]) -> Any:
+        """
+        Perform a GET request over the pooled session.
+
+        Raises:
+            ValueError: If the API returns an error.
+            requests.RequestException: If the API request fails.
+        """
+        response = _get_session().get(
+            f"{CoinGeckoAPI.BASE_URL}{path}", params=params, timeout=10
+        )
+        response.raise_for_status()
+        data = response.json()
+        if isinstance(data, dict) and "error" in data:
+            logger.error(f"Error from CoinGecko API: {data['error']}")
+            raise ValueError(f"CoinGecko API error: {data['error']}")
+        return data
+
+    @staticmethod
+    def fetch_markets(
+        coin_ids: List[str], vs_currency: str = "usd"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch market data for many coins from ``/coins/markets``.
+
+        Up to 250 coins are fetched per request, instead of one heavy
+        ``/coins/{id}`` request per coin.
+
+        Args:
+            coin_ids (List[str]): CoinGecko ids (e.g., ['bitcoin', 'ethereum']).
+            vs_currency (str): Quote currency for prices and volumes.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Data in the ``_format_coin_data`` schema,
+            keyed by coin id. Unknown ids are omitted.
+
+        Raises:
+            ValueError: If the API returns an error.
+            requests.RequestException: If the API request fails.
+        """
+        unique_ids = list(dict.fromkeys(coin_ids))
+        markets: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(unique_ids), MAX_IDS_PER_REQUEST):
+            batch = unique_ids[i : i + MAX_IDS_PER_REQUEST]
+            for coin in CoinGeckoAPI._get(
+                "/coins/markets",
+                {
+                    "vs_currency": vs_currency,
+                    "ids": ",".join(batch),
+                    "per_page": MAX_IDS_PER_REQUEST,
+                    "page": 1,
+                },
+            ):
+                markets[coin["id"]] = CoinGeckoAPI._format_market_data(
+                    coin
+                )
+        logger.info(
+            f"Fetched markets for {len(markets)} of {len(unique_ids)} coins"
+        )
+        return markets
+
+    @staticmethod
+    def fetch_simple_prices(
+        coin_ids: List[str],
+        vs_currencies: Optional[List[str]] = None,
+        include_24hr_change: bool = False,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Fetch prices only, via the lightweight ``/simple/price`` endpoint.
+
+        Args:
+            coin_ids (List[str]): CoinGecko ids.
+            vs_currencies (Optional[List[str]]): Quote currencies, defaults to ["usd"].
+            include_24hr_change (bool): Also return ``<currency>_24h_change``.
+
+        Returns:
+            Dict[str, Dict[str, float]]: E.g. ``{"bitcoin": {"usd": 97000.0}}``.
+
+        Raises:
+            ValueError: If the API returns an error.
+            requests.RequestException: If the API request fails.
+        """
+        unique_ids = list(dict.fromkeys(coin_ids))
+        prices: Dict[str, Dict[str, float]] = {}
+        for i in range(0, len(unique_ids), MAX_IDS_PER_REQUEST):
+            batch = unique_ids[i : i + MAX_IDS_PER_REQUEST]
+            prices.update(
+                CoinGeckoAPI._get(
+                    "/simple/price",
+                    {
+                        "ids": ",".join(batch),
+                        "vs_currencies": ",".join(
+                            vs_currencies or ["usd"]
+                        ),
+                        "include_24hr_change": str(
+                            include_24hr_change
+                        ).lower(),
+                    },
+                )
+            )
+        return prices
+
+    @staticmethod
+    def _format_market_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Format a ``/coins/markets`` entry into the ``_format_coin_data`` schema.
+
+        The markets endpoint carries no description or links, so those keys
+        hold the same placeholders ``_format_coin_data`` uses for missing data.
+
+        Args:
+            data (Dict[str, Any]): One entry from ``/coins/markets``.
+
+        Returns:
+            Dict[str, Any]: Structured and formatted cryptocurrency data.
+        """
+
+        def value(key: str) -> Any:
+            return data.get(key) if data.get(key) is not None else "N/A"
+
+        return {
+            "id": data.get("id"),
+            "symbol": data.get("symbol"),
+            "name": data.get("name"),
+            "current_price": value("current_price"),
+            "market_cap": value("market_cap"),
+            "total_volume": value("total_volume"),
+            "high_24h": value("high_24h"),
+            "low_24h": value("low_24h"),
+            "price_change_percentage_24h": value(
+                "price_change_percentage_24h"
+            ),
+            "circulating_supply": value("circulating_supply"),
+            "total_supply": value("total_supply"),
+            "max_supply": value("max_supply"),
+            "last_updated": data.get("last_updated"),
+            "description": "No description available.",
+            "homepage": "No homepage available",
+        }
+
     @staticmethod
     def _format_coin_data(data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -106,18 +268,39 @@ class CoinGeckoAPI:
         }
 
 
-def coin_gecko_coin_api(coin: str) -> Dict[str, Any]:
+def _resolve_coingecko_id(coin: str, fuzzy: bool = False) -> str:
+    """
+    Resolve a name, symbol or address to a CoinGecko id, else return it as is.
+
+    Lookups are exact unless ``fuzzy`` is set, so an id that is newer than the
+    cached index is passed through instead of matching a similar coin.
+    """
+    try:
+        coin_id = resolve_coin_id(coin, "coingecko", fuzzy=fuzzy)
+    except Exception as e:
+        logger.warning(f"Could not resolve coin {coin}: {e}")
+        return coin
+    return coin_id or coin
+
+
+def coin_gecko_coin_api(
+    coin: str, fuzzy: bool = False
+) -> Dict[str, Any]:
     """
     Fetch and display data for a specified cryptocurrency.
 
     Args:
-        coin (str): The unique ID of the cryptocurrency (e.g., 'bitcoin').
+        coin (str): The CoinGecko ID (e.g., 'bitcoin'), name ('Bitcoin'),
+            symbol ('BTC') or contract address of the cryptocurrency.
+        fuzzy (bool): Match misspelled coin names to the closest coin.
 
     Returns:
         Dict[str, Any]: A formatted dictionary containing the cryptocurrency data.
     """
     try:
-        coin_data = CoinGeckoAPI.fetch_coin_data(coin)
+        coin_data = CoinGeckoAPI.fetch_coin_data(
+            _resolve_coingecko_id(coin, fuzzy)
+        )
         # print(f"Data for {coin}: {coin_data}")
         return coin_data
     except Exception as e:
@@ -125,6 +308,59 @@ def coin_gecko_coin_api(coin: str) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
+def coin_gecko_markets_api(
+    coins: List[str], vs_currency: str = "usd", fuzzy: bool = False
+) -> str:
+    """
+    Fetch market data for several cryptocurrencies in one request.
+
+    Args:
+        coins (List[str]): CoinGecko IDs, names, symbols or contract addresses
+            (e.g., ['bitcoin', 'ETH', 'Solana']).
+        vs_currency (str): Quote currency, e.g. 'usd' or 'eur'.
+        fuzzy (bool): Match misspelled coin names to the closest coin.
+
+    Returns:
+        str: The formatted market data keyed by CoinGecko id.
+    """
+    try:
+        markets = CoinGeckoAPI.fetch_markets(
+            [_resolve_coingecko_id(coin, fuzzy) for coin in coins], vs_currency
+        )
+        return format_object_to_string(markets)
+    except Exception as e:
+        logger.error(f"Error fetching markets for {coins}: {e}")
+        return {"error": str(e)}
+
+
+def coin_gecko_price_api(
+    coins: List[str],
+    vs_currencies: Optional[List[str]] = None,
+    fuzzy: bool = False,
+) -> str:
+    """
+    Fetch current prices for several cryptocurrencies.
+
+    Args:
+        coins (List[str]): CoinGecko IDs, names, symbols or contract addresses.
+        vs_currencies (Optional[List[str]]): Quote currencies, defaults to ['usd'].
+        fuzzy (bool): Match misspelled coin names to the closest coin.
+
+    Returns:
+        str: The formatted prices keyed by CoinGecko id.
+    """
+    try:
+        prices = CoinGeckoAPI.fetch_simple_prices(
+            [_resolve_coingecko_id(coin, fuzzy) for coin in coins],
+            vs_currencies,
+            include_24hr_change=True,
+        )
+        return format_object_to_string(prices)
+    except Exception as e:
+        logger.error(f"Error fetching prices for {coins}: {e}")
+        return {"error": str(e)}
+
+
 # if __name__ == "__main__":
 #     # Example: Fetch data for Bitcoin
 #     print(coin_gecko_coin_api("bitcoin"))
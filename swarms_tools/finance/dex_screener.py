@@ -5,9 +5,24 @@ This module provides a Python interface for the DexScreener API, allowing users
 token profiles, pairs, and perform token-related searches.
 """
 
-import httpx
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import httpx
 from loguru import logger
 
 from swarms_tools.utils.formatted_string import (
@@ -341,6 +356,408 @@ class DexScreenerAPI:
             self.client.close()
 
 
+def _pair_liquidity_usd(pair: TokenPairInfo) -> Optional[float]:
+    return pair.liquidity.usd if pair.liquidity else None
+
+
+def _pair_price_usd(pair: TokenPairInfo) -> Optional[float]:
+    return float(pair.price_usd) if pair.price_usd else None
+
+
+PairKey = Tuple[str, str]
+
+
+class TokenUniverse:
+    """
+    In-memory store of DexScreener pairs with secondary indexes.
+
+    Pairs are keyed by ``(chain_id, pair_address)``. Hash indexes cover the
+    chain, dex and base token address, and every numeric field listed in
+    ``NUMERIC_FIELDS`` is kept in a sorted index so range and top-k queries
+    are answered with binary searches instead of new API calls.
+
+    The universe can be kept fresh incrementally: queries and token
+    addresses registered with ``track_query`` / ``track_tokens`` are
+    re-fetched by ``refresh`` and only the returned pairs are re-indexed.
+    """
+
+    NUMERIC_FIELDS: Dict[
+        str, Callable[[TokenPairInfo], Optional[float]]
+    ] = {
+        "liquidity_usd": _pair_liquidity_usd,
+        "price_usd": _pair_price_usd,
+        "fdv": lambda pair: pair.fdv,
+        "market_cap": lambda pair: pair.market_cap,
+        "pair_created_at": lambda pair: pair.pair_created_at,
+    }
+
+    def __init__(self, api: Optional[DexScreenerAPI] = None):
+        """
+        Initialize an empty token universe.
+
+        Args:
+            api (Optional[DexScreenerAPI]): Client used by ``refresh``. A new
+                client is created lazily if omitted.
+        """
+        self._api = api
+        self._lock = threading.RLock()
+        self._pairs: Dict[PairKey, TokenPairInfo] = {}
+        self._updated_at: Dict[PairKey, float] = {}
+        self._by_chain: Dict[str, Set[PairKey]] = {}
+        self._by_dex: Dict[str, Set[PairKey]] = {}
+        self._by_base_token: Dict[str, Set[PairKey]] = {}
+        self._sorted: Dict[str, List[Tuple[float, PairKey]]] = {
+            field: [] for field in self.NUMERIC_FIELDS
+        }
+        self._values: Dict[PairKey, Dict[str, float]] = {}
+        self._tracked_queries: Set[str] = set()
+        self._tracked_tokens: Dict[str, Set[str]] = {}
+
+    @property
+    def api(self) -> DexScreenerAPI:
+        if self._api is None:
+            self._api = DexScreenerAPI()
+        return self._api
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pairs)
+
+    def __contains__(self, key: PairKey) -> bool:
+        with self._lock:
+            return key in self._pairs
+
+    def get(
+        self, chain_id: str, pair_address: str
+    ) -> Optional[TokenPairInfo]:
+        """Return the stored pair for ``chain_id``/``pair_address``."""
+        with self._lock:
+            return self._pairs.get((chain_id, pair_address))
+
+    def upsert(self, pairs: Iterable[TokenPairInfo]) -> int:
+        """
+        Insert or replace pairs and update every index.
+
+        Args:
+            pairs (Iterable[TokenPairInfo]): Pairs to store
+
+        Returns:
+            int: Number of pairs written
+        """
+        count = 0
+        now = time.time()
+        with self._lock:
+            for pair in pairs:
+                if pair is None:
+                    continue
+                key = (pair.chain_id, pair.pair_address)
+                self._unindex(key)
+                self._pairs[key] = pair
+                self._updated_at[key] = now
+                self._index(key, pair)
+                count += 1
+        logger.debug(f"Upserted {count} pairs into token universe")
+        return count
+
+    def remove(self, chain_id: str, pair_address: str) -> bool:
+        """
+        Remove a pair from the universe.
+
+        Returns:
+            bool: True if the pair was present
+        """
+        key = (chain_id, pair_address)
+        with self._lock:
+            if key not in self._pairs:
+                return False
+            self._unindex(key)
+            del self._pairs[key]
+            del self._updated_at[key]
+            return True
+
+    def evict_stale(self, max_age_seconds: float) -> int:
+        """
+        Drop pairs that have not been refreshed within ``max_age_seconds``.
+
+        Returns:
+            int: Number of pairs evicted
+        """
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            stale = [
+                key
+                for key, updated in self._updated_at.items()
+                if updated < cutoff
+            ]
+            for key in stale:
+                self.remove(*key)
+        return len(stale)
+
+    def by_chain(self, chain_id: str) -> List[TokenPairInfo]:
+        """Return all pairs on ``chain_id``."""
+        with self._lock:
+            return self._resolve(self._by_chain.get(chain_id, ()))
+
+    def by_dex(self, dex_id: str) -> List[TokenPairInfo]:
+        """Return all pairs traded on ``dex_id``."""
+        with self._lock:
+            return self._resolve(self._by_dex.get(dex_id, ()))
+
+    def by_base_token(self, address: str) -> List[TokenPairInfo]:
+        """Return all pairs whose base token is ``address``."""
+        with self._lock:
+            return self._resolve(self._by_base_token.get(address, ()))
+
+    def range(
+        self,
+        field: str,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+    ) -> List[TokenPairInfo]:
+        """
+        Return pairs whose ``field`` lies within ``[min_value, max_value]``.
+
+        Args:
+            field (str): One of ``NUMERIC_FIELDS``
+            min_value (Optional[float]): Inclusive lower bound
+            max_value (Optional[float]): Inclusive upper bound
+
+        Returns:
+            List[TokenPairInfo]: Matching pairs in ascending ``field`` order
+        """
+        with self._lock:
+            return self._resolve(
+                key
+                for _, key in self._range_slice(
+                    field, min_value, max_value
+                )
+            )
+
+    def top_k(
+        self, field: str, k: int = 10, ascending: bool = False
+    ) -> List[TokenPairInfo]:
+        """
+        Return the ``k`` pairs with the largest (or smallest) ``field``.
+
+        Args:
+            field (str): One of ``NUMERIC_FIELDS``
+            k (int): Number of pairs to return
+            ascending (bool): Return the smallest values instead
+
+        Returns:
+            List[TokenPairInfo]: Pairs ordered by ``field``
+        """
+        with self._lock:
+            index = self._get_sorted(field)
+            entries = index[:k] if ascending else index[::-1][:k]
+            return self._resolve(key for _, key in entries)
+
+    def screen(
+        self,
+        chain_id: Optional[str] = None,
+        dex_id: Optional[str] = None,
+        base_token: Optional[str] = None,
+        ranges: Optional[
+            Dict[str, Tuple[Optional[float], Optional[float]]]
+        ] = None,
+        created_within_seconds: Optional[float] = None,
+        sort_by: Optional[str] = None,
+        ascending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[TokenPairInfo]:
+        """
+        Combine categorical filters, numeric ranges and ordering in one query.
+
+        Args:
+            chain_id (Optional[str]): Restrict to a chain
+            dex_id (Optional[str]): Restrict to a dex
+            base_token (Optional[str]): Restrict to a base token address
+            ranges (Optional[Dict[str, Tuple[Optional[float], Optional[float]]]]):
+                Mapping of numeric field to inclusive ``(min, max)`` bounds,
+                e.g. ``{"liquidity_usd": (50_000, None)}``
+            created_within_seconds (Optional[float]): Only pairs created
+                within this many seconds
+            sort_by (Optional[str]): Numeric field to order results by; pairs
+                without a value for it come last
+            ascending (bool): Sort ascending instead of descending
+            limit (Optional[int]): Maximum number of pairs to return
+
+        Returns:
+            List[TokenPairInfo]: Matching pairs
+        """
+        ranges = dict(ranges or {})
+        if created_within_seconds is not None:
+            created_min = (time.time() - created_within_seconds) * 1000
+            low, high = ranges.get("pair_created_at", (None, None))
+            if low is not None:
+                created_min = max(created_min, low)
+            ranges["pair_created_at"] = (created_min, high)
+
+        with self._lock:
+            candidates: List[Set[PairKey]] = []
+            if chain_id is not None:
+                candidates.append(self._by_chain.get(chain_id, set()))
+            if dex_id is not None:
+                candidates.append(self._by_dex.get(dex_id, set()))
+            if base_token is not None:
+                candidates.append(
+                    self._by_base_token.get(base_token, set())
+                )
+            for field, (low, high) in ranges.items():
+                candidates.append(
+                    {
+                        key
+                        for _, key in self._range_slice(
+                            field, low, high
+                        )
+                    }
+                )
+
+            if candidates:
+                candidates.sort(key=len)
+                matched = set(candidates[0]).intersection(
+                    *candidates[1:]
+                )
+            else:
+                matched = set(self._pairs)
+
+            if sort_by is None:
+                keys: Iterable[PairKey] = matched
+            else:
+                index = self._get_sorted(sort_by)
+                ordered = index if ascending else reversed(index)
+                ranked = [key for _, key in ordered if key in matched]
+                unranked = sorted(matched.difference(ranked))
+                keys = ranked + unranked
+
+            result = []
+            for key in keys:
+                if limit is not None and len(result) >= limit:
+                    break
+                result.append(self._pairs[key])
+            return result
+
+    def track_query(self, query: str) -> None:
+        """Register a search query to be re-run by ``refresh``."""
+        with self._lock:
+            self._tracked_queries.add(query)
+
+    def track_tokens(
+        self, chain_id: str, token_addresses: Iterable[str]
+    ) -> None:
+        """Register token addresses to be re-fetched by ``refresh``."""
+        with self._lock:
+            self._tracked_tokens.setdefault(chain_id, set()).update(
+                token_addresses
+            )
+
+    def refresh(self, max_age_seconds: Optional[float] = None) -> int:
+        """
+        Re-fetch tracked queries and tokens and upsert the results.
+
+        Args:
+            max_age_seconds (Optional[float]): When set, tracked tokens whose
+                pairs were all refreshed more recently than this are skipped
+
+        Returns:
+            int: Number of pairs written
+        """
+        with self._lock:
+            queries = sorted(self._tracked_queries)
+
+        count = 0
+        for query in queries:
+            count += self.upsert(self.api.search_pairs(query))
+
+        with self._lock:
+            tokens = {
+                chain_id: sorted(
+                    address
+                    for address in addresses
+                    if max_age_seconds is None
+                    or self._is_stale(address, max_age_seconds)
+                )
+                for chain_id, addresses in self._tracked_tokens.items()
+            }
+
+        for chain_id, pending in tokens.items():
+            for start in range(0, len(pending), 30):
+                count += self.upsert(
+                    self.api.get_token_pairs(
+                        chain_id, pending[start : start + 30]
+                    )
+                )
+
+        logger.info(f"Token universe refreshed {count} pairs")
+        return count
+
+    def _is_stale(self, address: str, max_age_seconds: float) -> bool:
+        keys = self._by_base_token.get(address)
+        if not keys:
+            return True
+        cutoff = time.time() - max_age_seconds
+        return any(self._updated_at[key] < cutoff for key in keys)
+
+    def _get_sorted(self, field: str) -> List[Tuple[float, PairKey]]:
+        if field not in self._sorted:
+            raise ValueError(
+                f"Unknown numeric field: {field}. Expected one of {list(self.NUMERIC_FIELDS)}"
+            )
+        return self._sorted[field]
+
+    def _range_slice(
+        self,
+        field: str,
+        min_value: Optional[float],
+        max_value: Optional[float],
+    ) -> List[Tuple[float, PairKey]]:
+        index = self._get_sorted(field)
+        start = (
+            0
+            if min_value is None
+            else bisect_left(index, min_value, key=itemgetter(0))
+        )
+        end = (
+            len(index)
+            if max_value is None
+            else bisect_right(index, max_value, key=itemgetter(0))
+        )
+        return index[start:end]
+
+    def _resolve(self, keys: Iterable[PairKey]) -> List[TokenPairInfo]:
+        return [self._pairs[key] for key in keys]
+
+    def _index(self, key: PairKey, pair: TokenPairInfo) -> None:
+        self._by_chain.setdefault(pair.chain_id, set()).add(key)
+        self._by_dex.setdefault(pair.dex_id, set()).add(key)
+        self._by_base_token.setdefault(
+            pair.base_token.address, set()
+        ).add(key)
+
+        values = {}
+        for field, extract in self.NUMERIC_FIELDS.items():
+            value = extract(pair)
+            if value is None:
+                continue
+            values[field] = value
+            insort(self._sorted[field], (value, key))
+        self._values[key] = values
+
+    def _unindex(self, key: PairKey) -> None:
+        pair = self._pairs.get(key)
+        if pair is None:
+            return
+        self._by_chain[pair.chain_id].discard(key)
+        self._by_dex[pair.dex_id].discard(key)
+        self._by_base_token[pair.base_token.address].discard(key)
+
+        for field, value in self._values.pop(key, {}).items():
+            index = self._sorted[field]
+            position = bisect_left(index, (value, key))
+            if position < len(index) and index[position][1] == key:
+                del index[position]
+
+
 # Example usage
 def fetch_dex_screener_profiles():
     """
@@ -1,10 +1,33 @@
+import asyncio
+import os
+import threading
+import weakref
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import backoff
 import httpx
+import numpy as np
+import pandas as pd
 from loguru import logger
 
+from swarms_tools.utils.cache import get_cache_dir
+from swarms_tools.utils.ohlcv import OHLCV_DTYPE, ohlcv_to_frame
+from swarms_tools.utils.rate_limiter import AsyncRateLimiter
+
+BASE_URL = "https://api.geckoterminal.com/api/v2"
+HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "SwarmTools/1.0",
+}
+MAX_ADDRESSES_PER_REQUEST = 30
+CALLS_PER_MINUTE = 30
+MAX_OHLCV_PER_REQUEST = 1000
+
+# Event loop -> AsyncRateLimiter, see ``get_rate_limiter``.
+_rate_limiters = weakref.WeakKeyDictionary()
+_rate_limiters_lock = threading.Lock()
+
 
 class GeckoTerminalAPIError(Exception):
     """Custom exception for GeckoTerminal API errors"""
@@ -12,6 +35,45 @@ class GeckoTerminalAPIError(Exception):
     pass
 
 
+def get_rate_limiter() -> AsyncRateLimiter:
+    """
+    Returns the ``CALLS_PER_MINUTE`` limiter shared by calls on the running loop.
+
+    One limiter is kept per event loop, since its lock is bound to the loop
+    it is first used on.
+
+    Returns:
+        AsyncRateLimiter: The shared limiter.
+    """
+    loop = asyncio.get_running_loop()
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(loop)
+        if limiter is None:
+            limiter = AsyncRateLimiter(CALLS_PER_MINUTE)
+            _rate_limiters[loop] = limiter
+        return limiter
+
+
+def _process_token_attributes(
+    token_data: Dict[str, Any], network: str, token_address: str
+) -> Dict[str, Any]:
+    """Structure GeckoTerminal token attributes into the tool's output schema."""
+    return {
+        "name": token_data.get("name"),
+        "symbol": token_data.get("symbol"),
+        "price_usd": token_data.get("price_usd"),
+        "price_24h_change": token_data.get("price_24h_change"),
+        "volume_24h": token_data.get("volume_24h"),
+        "market_cap": token_data.get("market_cap"),
+        "fully_diluted_valuation": token_data.get("fdv"),
+        "liquidity_usd": token_data.get("liquidity_usd"),
+        "created_at": token_data.get("created_at"),
+        "updated_at": datetime.utcnow().isoformat(),
+        "network": network,
+        "contract_address": token_address,
+    }
+
+
 @backoff.on_exception(
     backoff.expo,
     (httpx.HTTPError, GeckoTerminalAPIError),
@@ -69,22 +131,9 @@ async def fetch_token_data(
             token_data = data["data"]["attributes"]
 
             # Structure the response data
-            processed_data = {
-                "name": token_data.get("name"),
-                "symbol": token_data.get("symbol"),
-                "price_usd": token_data.get("price_usd"),
-                "price_24h_change": token_data.get(
-                    "price_24h_change"
-                ),
-                "volume_24h": token_data.get("volume_24h"),
-                "market_cap": token_data.get("market_cap"),
-                "fully_diluted_valuation": token_data.get("fdv"),
-                "liquidity_usd": token_data.get("liquidity_usd"),
-                "created_at": token_data.get("created_at"),
-                "updated_at": datetime.utcnow().isoformat(),
-                "network": network,
-                "contract_address": token_address,
-            }
+            processed_data = _process_token_attributes(
+                token_data, network, token_address
+            )
 
             logger.debug(
                 f"Successfully fetched data for {token_address}"
@@ -101,6 +150,242 @@ async def fetch_token_data(
         )
 
 
+async def fetch_tokens_data(
+    token_addresses: List[str],
+    network: str = "eth",
+    client: Optional[httpx.AsyncClient] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+    timeout: int = 30,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetches data for many tokens using GeckoTerminal's multi-address endpoint.
+
+    Addresses are split into pages of ``MAX_ADDRESSES_PER_REQUEST``, requested
+    concurrently over one shared client and throttled to the public API limit.
+
+    Args:
+        token_addresses (List[str]): Contract addresses of the tokens
+        network (str, optional): GeckoTerminal network id. Defaults to "eth"
+        client (Optional[httpx.AsyncClient]): Client to reuse; one is created if omitted
+        rate_limiter (Optional[AsyncRateLimiter]): Limiter shared with other calls.
+            Defaults to the module limiter from ``get_rate_limiter``.
+        timeout (int, optional): Request timeout in seconds. Defaults to 30
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Token data keyed by the requested address, in
+        the same format as ``fetch_token_data``. Addresses that were not found or
+        whose page failed map to ``{"error": ...}``.
+    """
+    unique = list(dict.fromkeys(token_addresses))
+    pages = [
+        unique[i : i + MAX_ADDRESSES_PER_REQUEST]
+        for i in range(0, len(unique), MAX_ADDRESSES_PER_REQUEST)
+    ]
+    rate_limiter = rate_limiter or get_rate_limiter()
+    owns_client = client is None
+    client = client or httpx.AsyncClient(timeout=timeout, headers=HEADERS)
+
+    logger.info(
+        f"Fetching data for {len(unique)} tokens on {network} in {len(pages)} requests"
+    )
+
+    @backoff.on_exception(
+        backoff.expo,
+        (httpx.HTTPError, GeckoTerminalAPIError),
+        max_tries=3,
+    )
+    async def fetch_page(page: List[str]) -> List[Dict[str, Any]]:
+        async with rate_limiter:
+            response = await client.get(
+                f"{BASE_URL}/networks/{network}/tokens/multi/{','.join(page)}",
+                headers=HEADERS,
+            )
+        response.raise_for_status()
+        data = response.json()
+        if "data" not in data:
+            raise GeckoTerminalAPIError("Invalid API response format")
+        return data["data"]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        responses = await asyncio.gather(
+            *(fetch_page(page) for page in pages),
+            return_exceptions=True,
+        )
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    for page, response in zip(pages, responses):
+        if isinstance(response, Exception):
+            logger.error(f"Error fetching token page: {response}")
+            for address in page:
+                results[address] = {"error": str(response)}
+            continue
+
+        by_address = {
+            item["attributes"].get("address", "").lower(): item[
+                "attributes"
+            ]
+            for item in response
+        }
+        for address in page:
+            attributes = by_address.get(address.lower())
+            results[address] = (
+                _process_token_attributes(attributes, network, address)
+                if attributes
+                else {"error": "Token not found"}
+            )
+
+    return results
+
+
+def _ohlcv_cache_path(
+    network: str, pool_address: str, timeframe: str, aggregate: int
+):
+    return get_cache_dir("geckoterminal", "ohlcv") / (
+        f"{network}_{pool_address}_{timeframe}_{aggregate}.bin"
+    )
+
+
+def load_cached_ohlcv(
+    network: str, pool_address: str, timeframe: str, aggregate: int
+) -> np.ndarray:
+    """
+    Loads cached candles for a pool, oldest first.
+
+    If a bar appears more than once (e.g. in a cache written by an older
+    version that appended on every refresh), the last copy wins.
+
+    Returns:
+        np.ndarray: Structured array with ``OHLCV_DTYPE`` fields.
+    """
+    path = _ohlcv_cache_path(network, pool_address, timeframe, aggregate)
+    if not path.exists():
+        return np.empty(0, dtype=OHLCV_DTYPE)
+    return _dedupe_ohlcv(np.fromfile(path, dtype=OHLCV_DTYPE))
+
+
+def _dedupe_ohlcv(candles: np.ndarray) -> np.ndarray:
+    # Keep the last occurrence of each timestamp, then sort by time.
+    _, last_index = np.unique(
+        candles["timestamp"][::-1], return_index=True
+    )
+    return candles[len(candles) - 1 - last_index]
+
+
+async def fetch_pool_ohlcv(
+    pool_address: str,
+    network: str = "eth",
+    timeframe: str = "day",
+    aggregate: int = 1,
+    max_bars: int = 1000,
+    currency: str = "usd",
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: int = 30,
+) -> pd.DataFrame:
+    """
+    Fetches OHLCV candles for a pool, backed by a local cache file.
+
+    Only bars at or after the last cached timestamp are requested (the last
+    cached bar is re-fetched since it may have still been open), paging back
+    with ``before_timestamp`` until the cache is reached. With an empty cache,
+    up to ``max_bars`` bars of history are downloaded.
+
+    Args:
+        pool_address (str): The pool contract address
+        network (str, optional): GeckoTerminal network id. Defaults to "eth"
+        timeframe (str, optional): "day", "hour" or "minute". Defaults to "day"
+        aggregate (int, optional): Bars per candle, e.g. 4 for 4h candles. Defaults to 1
+        max_bars (int, optional): History to download when nothing is cached. Defaults to 1000
+        currency (str, optional): "usd" or "token". Defaults to "usd"
+        client (Optional[httpx.AsyncClient]): Client to reuse; one is created if omitted
+        timeout (int, optional): Request timeout in seconds. Defaults to 30
+
+    Returns:
+        pd.DataFrame: All cached candles, oldest first, indexed by UTC timestamp
+        with Open, High, Low, Close and Volume columns.
+
+    Raises:
+        GeckoTerminalAPIError: If the API returns an invalid response
+        httpx.HTTPError: If a request keeps failing after retries
+    """
+    cached = load_cached_ohlcv(network, pool_address, timeframe, aggregate)
+    last_timestamp = (
+        int(cached["timestamp"][-1]) if len(cached) else None
+    )
+    endpoint = f"{BASE_URL}/networks/{network}/pools/{pool_address}/ohlcv/{timeframe}"
+    owns_client = client is None
+    client = client or httpx.AsyncClient(timeout=timeout, headers=HEADERS)
+
+    @backoff.on_exception(
+        backoff.expo,
+        (httpx.HTTPError, GeckoTerminalAPIError),
+        max_tries=3,
+    )
+    async def fetch_page(before: Optional[int], limit: int) -> list:
+        params = {
+            "aggregate": aggregate,
+            "limit": limit,
+            "currency": currency,
+        }
+        if before is not None:
+            params["before_timestamp"] = before
+        response = await client.get(endpoint, params=params)
+        response.raise_for_status()
+        try:
+            return response.json()["data"]["attributes"]["ohlcv_list"]
+        except (KeyError, TypeError):
+            raise GeckoTerminalAPIError("Invalid API response format")
+
+    bars: list = []
+    before = None
+    try:
+        while True:
+            limit = MAX_OHLCV_PER_REQUEST
+            if last_timestamp is None:
+                limit = min(limit, max_bars - len(bars))
+            page = await fetch_page(before, limit)
+            new = [
+                bar
+                for bar in page
+                if last_timestamp is None or bar[0] >= last_timestamp
+            ]
+            bars.extend(new)
+
+            oldest = min((bar[0] for bar in page), default=None)
+            if (
+                len(page) < limit
+                or len(new) < len(page)
+                or (last_timestamp is not None and oldest <= last_timestamp)
+                or (last_timestamp is None and len(bars) >= max_bars)
+            ):
+                break
+            before = oldest
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    if bars:
+        fresh = np.array(
+            [tuple(bar[:6]) for bar in bars], dtype=OHLCV_DTYPE
+        )
+        # Re-fetched bars replace their cached copies, and the merged
+        # candles are rewritten so the file does not grow with overlaps.
+        cached = _dedupe_ohlcv(np.concatenate([cached, fresh]))
+        path = _ohlcv_cache_path(
+            network, pool_address, timeframe, aggregate
+        )
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        cached.tofile(tmp_path)
+        os.replace(tmp_path, path)
+
+    logger.info(
+        f"Fetched {len(bars)} new {aggregate}{timeframe} candles for pool {pool_address}"
+    )
+    return ohlcv_to_frame(cached)
+
+
 # Example usage
 if __name__ == "__main__":
     import asyncio
@@ -1,8 +1,23 @@
 import os
-from typing import Any, Dict
-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import backoff
+import httpx
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+
+from swarms_tools.utils.pagination import prefetch_pages
 
 
 class HeliusAPI:
@@ -12,6 +27,31 @@ class HeliusAPI:
 
     BASE_URL = "https://api.helius.xyz/v0"
     API_KEY = os.getenv("HELIUS_API_KEY")
+    MAX_BATCH_SIZE = 100
+    MAX_WORKERS = 10
+
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    @staticmethod
+    def get_session() -> requests.Session:
+        """
+        Return the pooled session shared by the batch methods.
+
+        Returns:
+            requests.Session: A session sized for ``MAX_WORKERS`` connections.
+        """
+        with HeliusAPI._session_lock:
+            if HeliusAPI._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HeliusAPI.MAX_WORKERS,
+                    pool_maxsize=HeliusAPI.MAX_WORKERS,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                HeliusAPI._session = session
+            return HeliusAPI._session
 
     @staticmethod
     @logger.catch
@@ -134,6 +174,224 @@ class HeliusAPI:
 
         return data
 
+    @staticmethod
+    def _post_batch(
+        path: str,
+        body_key: str,
+        identifiers: List[str],
+        extract_id: Callable[[Dict[str, Any]], Optional[str]],
+        extra_body: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        POST identifiers to a Helius multi-item endpoint in chunks of
+        ``MAX_BATCH_SIZE`` and key each returned item back to its identifier.
+        """
+        unique = list(dict.fromkeys(identifiers))
+        chunks = [
+            unique[i : i + HeliusAPI.MAX_BATCH_SIZE]
+            for i in range(0, len(unique), HeliusAPI.MAX_BATCH_SIZE)
+        ]
+        endpoint = (
+            f"{HeliusAPI.BASE_URL}/{path}?api-key={HeliusAPI.API_KEY}"
+        )
+        session = HeliusAPI.get_session()
+
+        def fetch_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            try:
+                response = session.post(
+                    endpoint,
+                    json={body_key: chunk, **(extra_body or {})},
+                    timeout=30,
+                )
+                response.raise_for_status()
+                data = response.json()
+                if isinstance(data, dict) and "error" in data:
+                    raise ValueError(f"Helius API error: {data['error']}")
+            except (requests.RequestException, ValueError) as e:
+                logger.error(f"Failed Helius batch request to {path}: {e}")
+                return {identifier: {"error": str(e)} for identifier in chunk}
+
+            results = {
+                extract_id(item): item
+                for item in data
+                if isinstance(item, dict)
+            }
+            return {
+                identifier: results.get(
+                    identifier, {"error": "No data returned"}
+                )
+                for identifier in chunk
+            }
+
+        results: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(
+            max_workers=HeliusAPI.MAX_WORKERS
+        ) as executor:
+            for chunk_results in executor.map(fetch_chunk, chunks):
+                results.update(chunk_results)
+        return results
+
+    @staticmethod
+    def fetch_accounts_data(
+        accounts: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch data for many accounts concurrently over the pooled session.
+
+        Args:
+            accounts (List[str]): The blockchain account addresses.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Account data keyed by address, or
+            ``{"error": ...}`` for accounts that could not be fetched.
+        """
+        session = HeliusAPI.get_session()
+        logger.info(f"Fetching account data for {len(accounts)} accounts")
+
+        def fetch(account: str) -> Dict[str, Any]:
+            endpoint = f"{HeliusAPI.BASE_URL}/accounts/{account}?api-key={HeliusAPI.API_KEY}"
+            try:
+                response = session.get(endpoint, timeout=10)
+                response.raise_for_status()
+                data = response.json()
+            except (requests.RequestException, ValueError) as e:
+                logger.error(
+                    f"Failed to fetch account data for {account}: {e}"
+                )
+                return {"error": str(e)}
+            if "error" in data:
+                return {"error": f"Helius API error: {data['error']}"}
+            return data
+
+        unique = list(dict.fromkeys(accounts))
+        with ThreadPoolExecutor(
+            max_workers=HeliusAPI.MAX_WORKERS
+        ) as executor:
+            return dict(zip(unique, executor.map(fetch, unique)))
+
+    @staticmethod
+    def fetch_transactions_data(
+        tx_signatures: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch parsed transactions for many signatures.
+
+        Signatures are POSTed to the multi-transaction endpoint in chunks of
+        ``MAX_BATCH_SIZE``, with chunks sent concurrently.
+
+        Args:
+            tx_signatures (List[str]): The blockchain transaction signatures.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Transaction data keyed by signature, or
+            ``{"error": ...}`` for signatures that could not be fetched.
+        """
+        logger.info(
+            f"Fetching transaction data for {len(tx_signatures)} signatures"
+        )
+        return HeliusAPI._post_batch(
+            "transactions",
+            "transactions",
+            tx_signatures,
+            lambda item: item.get("signature"),
+        )
+
+    @staticmethod
+    def fetch_tokens_data(
+        mint_addresses: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch token metadata for many mint addresses.
+
+        Mints are POSTed to the token metadata endpoint in chunks of
+        ``MAX_BATCH_SIZE``, with chunks sent concurrently.
+
+        Args:
+            mint_addresses (List[str]): The blockchain mint addresses.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Token metadata keyed by mint address, or
+            ``{"error": ...}`` for mints that could not be fetched.
+        """
+        logger.info(
+            f"Fetching token data for {len(mint_addresses)} mint addresses"
+        )
+        return HeliusAPI._post_batch(
+            "token-metadata",
+            "mintAccounts",
+            mint_addresses,
+            lambda item: item.get("account"),
+            extra_body={"includeOffChain": True},
+        )
+
+
+async def iter_address_transactions(
+    address: str,
+    before: Optional[str] = None,
+    until: Optional[str] = None,
+    page_size: int = 100,
+    tx_type: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream an address's parsed transaction history, newest first.
+
+    Pages are requested with the ``before`` cursor and the next page is
+    prefetched while the caller processes the current one. To resume an
+    interrupted backfill, store the ``signature`` of the last transaction
+    processed and pass it back as ``before``.
+
+    Args:
+        address (str): The blockchain account address.
+        before (Optional[str]): Only return transactions older than this signature.
+        until (Optional[str]): Stop once this signature is reached (exclusive).
+        page_size (int): Transactions per request (Helius allows up to 100).
+        tx_type (Optional[str]): Only return transactions of this Helius type, e.g. 'SWAP'.
+        client (Optional[httpx.AsyncClient]): Client to reuse; one is created if omitted.
+
+    Yields:
+        Dict[str, Any]: One parsed transaction at a time.
+
+    Raises:
+        ValueError: If the Helius API returns an error.
+        httpx.HTTPError: If a request keeps failing after retries.
+    """
+    endpoint = f"{HeliusAPI.BASE_URL}/addresses/{address}/transactions"
+    owns_client = client is None
+    client = client or httpx.AsyncClient(timeout=30)
+
+    @backoff.on_exception(backoff.expo, httpx.HTTPError, max_tries=3)
+    async def fetch_page(
+        cursor: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        params = {"api-key": HeliusAPI.API_KEY, "limit": page_size}
+        if cursor:
+            params["before"] = cursor
+        if until:
+            params["until"] = until
+        if tx_type:
+            params["type"] = tx_type
+
+        response = await client.get(endpoint, params=params)
+        response.raise_for_status()
+        data = response.json()
+        if isinstance(data, dict) and "error" in data:
+            logger.error(f"Error from Helius API: {data['error']}")
+            raise ValueError(f"Helius API error: {data['error']}")
+
+        logger.debug(
+            f"Fetched {len(data)} transactions for {address} before {cursor}"
+        )
+        return data, data[-1]["signature"] if data else None
+
+    try:
+        async for page in prefetch_pages(fetch_page, before):
+            for transaction in page:
+                yield transaction
+    finally:
+        if owns_client:
+            await client.aclose()
+
 
 def helius_api_tool(action: str, identifier: str) -> Dict[str, Any]:
     """
@@ -167,6 +425,39 @@ def helius_api_tool(action: str, identifier: str) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
+def helius_api_batch_tool(
+    action: str, identifiers: List[str]
+) -> Dict[str, Any]:
+    """
+    Batch version of ``helius_api_tool`` for many identifiers at once.
+
+    Args:
+        action (str): The type of action to perform ('account', 'transaction', or 'token').
+        identifiers (List[str]): Account addresses, transaction signatures or mint addresses.
+
+    Returns:
+        Dict[str, Any]: Results keyed by identifier. Items that failed contain an
+        ``error`` message; an invalid action returns a top-level ``error``.
+    """
+    batch_methods = {
+        "account": HeliusAPI.fetch_accounts_data,
+        "transaction": HeliusAPI.fetch_transactions_data,
+        "token": HeliusAPI.fetch_tokens_data,
+    }
+    if action not in batch_methods:
+        logger.error(f"Invalid batch action: {action}")
+        return {
+            "error": f"Invalid action: {action}. Must be 'account', 'transaction', or 'token'."
+        }
+    try:
+        return batch_methods[action](identifiers)
+    except Exception as e:
+        logger.error(
+            f"Error performing batch action '{action}' for {len(identifiers)} identifiers: {e}"
+        )
+        return {"error": str(e)}
+
+
 # if __name__ == "__main__":
 #     # Set up logging
 #     logger.add("helius_api.log", rotation="500 MB", level="INFO")
@@ -1,5 +1,11 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
 import loguru
 import requests
+from requests.adapters import HTTPAdapter
+
 from swarms_tools.utils.formatted_string import (
     format_object_to_string,
 )
@@ -7,158 +13,390 @@ from swarms_tools.utils.formatted_string import (
 # Configure logging
 loguru.logger.add("htx_tool.log", rotation="10 MB")
 
+BASE_URL = "https://api.huobi.pro"
+HTX_SECTIONS = ("ticker", "depth", "trades", "kline")
+_SECTION_LABELS = {
+    "ticker": "ticker",
+    "depth": "order book",
+    "trades": "trade",
+    "kline": "kline",
+}
 
-def fetch_htx_data(coin_name: str) -> str:
-    """
-    Fetches and formats financial data for a given cryptocurrency from Huobi API.
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
 
-    Parameters:
-    coin_name (str): The name of the cryptocurrency to fetch data for.
 
-    Returns:
-    dict: A dictionary containing formatted data for the specified coin, including ticker, order book, recent trades, and kline data.
+def _get_session() -> requests.Session:
+    """Return a pooled session shared by the concurrent HTX helpers."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=16, pool_maxsize=16),
+            )
+        return _session
+
+
+def _build_htx_requests(
+    coin_name: str,
+    sections: Optional[List[str]] = None,
+    depth_type: str = "step0",
+    depth: Optional[int] = None,
+    trade_size: int = 200,
+    kline_period: str = "1day",
+    kline_size: int = 200,
+) -> Dict[str, Tuple[str, Dict[str, Any]]]:
     """
-    base_url = "https://api.huobi.pro"
+    Build the endpoint and params for each requested section of ``fetch_htx_data``.
 
-    # Fetch market ticker data for the coin
-    ticker_endpoint = "/market/detail/merged"
-    ticker_params = {
-        "symbol": f"{coin_name.lower()}usdt"
-    }  # Assuming USDT pairing
+    Sections are returned in the order they are reported on failure.
 
-    try:
-        ticker_response = requests.get(
-            base_url + ticker_endpoint, params=ticker_params
+    Raises:
+        ValueError: If no section or an unknown section is requested.
+    """
+    sections = HTX_SECTIONS if sections is None else sections
+    if not sections:
+        raise ValueError(
+            f"No sections requested. Must be any of {list(HTX_SECTIONS)}."
+        )
+    unknown = set(sections) - set(HTX_SECTIONS)
+    if unknown:
+        raise ValueError(
+            f"Invalid sections: {sorted(unknown)}. Must be any of {list(HTX_SECTIONS)}."
         )
-        ticker_data = ticker_response.json()
 
-        if ticker_data["status"] != "ok":
+    symbol = f"{coin_name.lower()}usdt"  # Assuming USDT pairing
+    depth_params = {"symbol": symbol, "type": depth_type}
+    if depth is not None:
+        depth_params["depth"] = depth
+
+    requests_by_section = {
+        "ticker": ("/market/detail/merged", {"symbol": symbol}),
+        "depth": ("/market/depth", depth_params),
+        "trades": (
+            "/market/history/trade",
+            {"symbol": symbol, "size": trade_size},
+        ),
+        "kline": (
+            "/market/history/kline",
+            {"symbol": symbol, "period": kline_period, "size": kline_size},
+        ),
+    }
+    return {
+        section: requests_by_section[section]
+        for section in HTX_SECTIONS
+        if section in sections
+    }
+
+
+def _check_htx_responses(
+    coin_name: str, responses: Dict[str, Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Return the error dict for the first failed section, if any."""
+    for section, data in responses.items():
+        if data.get("status") != "ok":
+            label = _SECTION_LABELS[section]
             loguru.logger.error(
-                "Unable to fetch ticker data for coin: {}", coin_name
+                "Unable to fetch {} data for coin: {}", label, coin_name
             )
             return {
-                "error": "Unable to fetch ticker data",
-                "details": ticker_data,
+                "error": f"Unable to fetch {label} data",
+                "details": data,
             }
+    return None
+
 
-        # Fetch order book data for the coin
-        order_book_endpoint = "/market/depth"
-        order_book_params = {
-            "symbol": f"{coin_name.lower()}usdt",
-            "type": "step0",
+def _invalid_response_error(
+    coin_name: str, error: ValueError
+) -> Dict[str, Any]:
+    """Return the error dict for a response body that is not valid JSON."""
+    loguru.logger.error(
+        "Invalid JSON response from HTX for coin: {}: {}", coin_name, error
+    )
+    return {"error": "Invalid response from HTX", "details": str(error)}
+
+
+def _format_htx_data(
+    coin_name: str, responses: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Format the raw section responses into the ``fetch_htx_data`` schema."""
+    formatted_data: Dict[str, Any] = {"coin": coin_name.upper()}
+
+    if "ticker" in responses:
+        tick = responses["ticker"]["tick"]
+        formatted_data["ticker"] = {
+            "current_price": tick.get("close"),
+            "high": tick.get("high"),
+            "low": tick.get("low"),
+            "open": tick.get("open"),
+            "volume": tick.get("vol"),
+            "amount": tick.get("amount"),
+            "count": tick.get("count"),
+            "bid": tick["bid"][0] if tick.get("bid") else None,
+            "ask": tick["ask"][0] if tick.get("ask") else None,
         }
 
-        order_book_response = requests.get(
-            base_url + order_book_endpoint, params=order_book_params
-        )
-        order_book_data = order_book_response.json()
+    if "depth" in responses:
+        tick = responses["depth"]["tick"]
+        formatted_data["order_book"] = {
+            "bids": [
+                {"price": bid[0], "amount": bid[1]}
+                for bid in tick.get("bids", [])
+            ],
+            "asks": [
+                {"price": ask[0], "amount": ask[1]}
+                for ask in tick.get("asks", [])
+            ],
+        }
 
-        if order_book_data["status"] != "ok":
-            loguru.logger.error(
-                "Unable to fetch order book data for coin: {}",
-                coin_name,
-            )
-            return {
-                "error": "Unable to fetch order book data",
-                "details": order_book_data,
+    if "trades" in responses:
+        formatted_data["recent_trades"] = [
+            {
+                "price": trade["data"][0].get("price"),
+                "amount": trade["data"][0].get("amount"),
+                "direction": trade["data"][0].get("direction"),
+                "trade_id": trade["data"][0].get("id"),
+                "timestamp": trade["data"][0].get("ts"),
             }
+            for trade in responses["trades"].get("data", [])
+        ]
 
-        # Fetch recent trades for the coin
-        trades_endpoint = "/market/history/trade"
-        trades_params = {
-            "symbol": f"{coin_name.lower()}usdt",
-            "size": 200,
-        }
+    if "kline" in responses:
+        formatted_data["kline_data"] = [
+            {
+                "timestamp": kline["id"],
+                "open": kline["open"],
+                "close": kline["close"],
+                "high": kline["high"],
+                "low": kline["low"],
+                "volume": kline["vol"],
+                "amount": kline.get("amount"),
+            }
+            for kline in responses["kline"].get("data", [])
+        ]
 
-        trades_response = requests.get(
-            base_url + trades_endpoint, params=trades_params
+    return formatted_data
+
+
+def fetch_htx_data(
+    coin_name: str,
+    sections: Optional[List[str]] = None,
+    depth_type: str = "step0",
+    depth: Optional[int] = None,
+    trade_size: int = 200,
+    kline_period: str = "1day",
+    kline_size: int = 200,
+) -> str:
+    """
+    Fetches and formats financial data for a given cryptocurrency from Huobi API.
+
+    Parameters:
+    coin_name (str): The name of the cryptocurrency to fetch data for.
+    sections (Optional[List[str]]): Which of "ticker", "depth", "trades" and "kline"
+        to fetch. Defaults to all of them; ["ticker"] is a single small request.
+    depth_type (str): Order book aggregation level, "step0" (none) to "step5".
+    depth (Optional[int]): Number of order book levels per side (5, 10 or 20).
+        Defaults to the full book.
+    trade_size (int): Number of recent trades to fetch (1-2000).
+    kline_period (str): Kline period, e.g. "1min", "60min", "1day".
+    kline_size (int): Number of klines to fetch (1-2000).
+
+    Returns:
+    dict: A dictionary containing formatted data for the specified coin, including ticker, order book, recent trades, and kline data.
+    """
+    try:
+        requests_by_section = _build_htx_requests(
+            coin_name,
+            sections,
+            depth_type,
+            depth,
+            trade_size,
+            kline_period,
+            kline_size,
         )
-        trades_data = trades_response.json()
+    except ValueError as e:
+        loguru.logger.error("Invalid HTX request: {}", e)
+        return {"error": str(e)}
 
-        if trades_data["status"] != "ok":
-            loguru.logger.error(
-                "Unable to fetch trade data for coin: {}", coin_name
+    try:
+        responses = {}
+        for section, (endpoint, params) in requests_by_section.items():
+            responses[section] = requests.get(
+                BASE_URL + endpoint, params=params
+            ).json()
+
+            error = _check_htx_responses(
+                coin_name, {section: responses[section]}
             )
-            return {
-                "error": "Unable to fetch trade data",
-                "details": trades_data,
-            }
+            if error:
+                return error
 
-        # Fetch Kline (Candlestick) data
-        kline_endpoint = "/market/history/kline"
-        kline_params = {
-            "symbol": f"{coin_name.lower()}usdt",
-            "period": "1day",
-            "size": 200,
-        }
+        return format_object_to_string(
+            _format_htx_data(coin_name, responses)
+        )
 
-        kline_response = requests.get(
-            base_url + kline_endpoint, params=kline_params
+    except ValueError as e:
+        # Undecodable body; checked before RequestException because newer
+        # requests versions raise a JSONDecodeError that is both.
+        return _invalid_response_error(coin_name, e)
+    except requests.exceptions.RequestException as e:
+        loguru.logger.error(
+            "HTTP request failed for coin: {}", coin_name, exc_info=e
         )
-        kline_data = kline_response.json()
+        return {"error": "HTTP request failed", "details": str(e)}
 
-        if kline_data["status"] != "ok":
-            loguru.logger.error(
-                "Unable to fetch kline data for coin: {}", coin_name
-            )
-            return {
-                "error": "Unable to fetch kline data",
-                "details": kline_data,
-            }
 
-        # Format and prepare data for a single coin
-        formatted_data = {
-            "coin": coin_name.upper(),
-            "ticker": {
-                "current_price": ticker_data["tick"].get("close"),
-                "high": ticker_data["tick"].get("high"),
-                "low": ticker_data["tick"].get("low"),
-                "open": ticker_data["tick"].get("open"),
-                "volume": ticker_data["tick"].get("vol"),
-                "amount": ticker_data["tick"].get("amount"),
-                "count": ticker_data["tick"].get("count"),
-            },
-            "order_book": {
-                "bids": [
-                    {"price": bid[0], "amount": bid[1]}
-                    for bid in order_book_data["tick"].get("bids", [])
-                ],
-                "asks": [
-                    {"price": ask[0], "amount": ask[1]}
-                    for ask in order_book_data["tick"].get("asks", [])
-                ],
-            },
-            "recent_trades": [
-                {
-                    "price": trade["data"][0].get("price"),
-                    "amount": trade["data"][0].get("amount"),
-                    "direction": trade["data"][0].get("direction"),
-                    "trade_id": trade["data"][0].get("id"),
-                    "timestamp": trade["data"][0].get("ts"),
-                }
-                for trade in trades_data.get("data", [])
-            ],
-            "kline_data": [
-                {
-                    "timestamp": kline["id"],
-                    "open": kline["open"],
-                    "close": kline["close"],
-                    "high": kline["high"],
-                    "low": kline["low"],
-                    "volume": kline["vol"],
-                    "amount": kline.get("amount"),
-                }
-                for kline in kline_data.get("data", [])
-            ],
-        }
+def fetch_htx_market_data(
+    coin_name: str,
+    sections: Optional[List[str]] = None,
+    depth_type: str = "step0",
+    depth: Optional[int] = None,
+    trade_size: int = 200,
+    kline_period: str = "1day",
+    kline_size: int = 200,
+    executor: Optional[ThreadPoolExecutor] = None,
+    timeout: float = 10,
+) -> Dict[str, Any]:
+    """
+    Fetches the requested sections for a coin concurrently.
+
+    All requests are issued in parallel over a pooled session, so the latency
+    is one round trip instead of one per section.
+
+    Parameters:
+    coin_name (str): The name of the cryptocurrency to fetch data for.
+    sections, depth_type, depth, trade_size, kline_period, kline_size:
+        See ``fetch_htx_data``.
+    executor (Optional[ThreadPoolExecutor]): Executor to submit requests to.
+        A temporary one is created if omitted.
+    timeout (float): Timeout in seconds for each request.
+
+    Returns:
+    dict: The structured data returned by ``fetch_htx_data``, or a dict with
+    ``error`` and ``details`` keys if a request failed.
+    """
+    try:
+        requests_by_section = _build_htx_requests(
+            coin_name,
+            sections,
+            depth_type,
+            depth,
+            trade_size,
+            kline_period,
+            kline_size,
+        )
+    except ValueError as e:
+        loguru.logger.error("Invalid HTX request: {}", e)
+        return {"error": str(e)}
+
+    session = _get_session()
 
-        return format_object_to_string(formatted_data)
+    def fetch(section: str) -> Dict[str, Any]:
+        endpoint, params = requests_by_section[section]
+        return session.get(
+            BASE_URL + endpoint, params=params, timeout=timeout
+        ).json()
 
+    try:
+        if len(requests_by_section) == 1:
+            responses = {
+                section: fetch(section) for section in requests_by_section
+            }
+        elif executor is not None:
+            responses = dict(
+                zip(
+                    requests_by_section,
+                    executor.map(fetch, requests_by_section),
+                )
+            )
+        else:
+            with ThreadPoolExecutor(
+                max_workers=len(requests_by_section)
+            ) as pool:
+                responses = dict(
+                    zip(
+                        requests_by_section,
+                        pool.map(fetch, requests_by_section),
+                    )
+                )
+    except ValueError as e:
+        return _invalid_response_error(coin_name, e)
     except requests.exceptions.RequestException as e:
         loguru.logger.error(
             "HTTP request failed for coin: {}", coin_name, exc_info=e
         )
         return {"error": "HTTP request failed", "details": str(e)}
 
+    error = _check_htx_responses(coin_name, responses)
+    if error:
+        return error
+    return _format_htx_data(coin_name, responses)
+
+
+def fetch_htx_data_concurrent(
+    coin_name: str, sections: Optional[List[str]] = None, **options
+) -> str:
+    """
+    Concurrent version of ``fetch_htx_data``.
+
+    Parameters:
+    coin_name (str): The name of the cryptocurrency to fetch data for.
+    sections (Optional[List[str]]): Sections to fetch, see ``fetch_htx_data``.
+    **options: Depth, trade and kline options, see ``fetch_htx_data``.
+
+    Returns:
+    str: The formatted data for the coin, or an error dict.
+    """
+    data = fetch_htx_market_data(coin_name, sections, **options)
+    if "error" in data:
+        return data
+    return format_object_to_string(data)
+
+
+def fetch_multiple_htx_data(
+    coin_names: List[str],
+    sections: Optional[List[str]] = None,
+    max_workers: int = 16,
+    **options,
+) -> str:
+    """
+    Fetches and formats data for many coins at once.
+
+    Every section request for every coin shares one pool of ``max_workers``
+    threads, which bounds the number of requests in flight.
+
+    Parameters:
+    coin_names (List[str]): The names of the cryptocurrencies to fetch data for.
+    sections (Optional[List[str]]): Sections to fetch, see ``fetch_htx_data``.
+    max_workers (int): Maximum number of concurrent requests.
+    **options: Depth, trade and kline options, see ``fetch_htx_data``.
+
+    Returns:
+    str: The formatted data keyed by coin; coins that failed contain an error.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Coin-level tasks run on their own small pool so they never wait on
+        # request slots they are holding themselves.
+        with ThreadPoolExecutor(
+            max_workers=min(len(coin_names), max_workers) or 1
+        ) as coin_executor:
+            results = dict(
+                zip(
+                    (name.upper() for name in coin_names),
+                    coin_executor.map(
+                        lambda name: fetch_htx_market_data(
+                            name,
+                            sections,
+                            executor=executor,
+                            **options,
+                        ),
+                        coin_names,
+                    ),
+                )
+            )
+    return format_object_to_string(results)
+
 
 # print(fetch_htx_data("swarms"))
@@ -1,8 +1,15 @@
-from typing import Dict, Any, Optional
-from loguru import logger
-import aiohttp
 import asyncio
+import atexit
+import copy
+import time
+from collections import OrderedDict
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+from loguru import logger
+
+from swarms_tools.utils.background_loop import get_background_loop
 
 
 class JupiterAPI:
@@ -14,10 +21,26 @@ class JupiterAPI:
         session (Optional[aiohttp.ClientSession]): Aiohttp session for making requests
     """
 
-    def __init__(self):
-        """Initialize the Jupiter API client."""
+    # Default price-impact ladder, in whole input tokens.
+    DEFAULT_IMPACT_TOKEN_AMOUNTS = (0.001, 0.01, 0.1, 1, 10, 100, 1000)
+
+    def __init__(
+        self, curve_cache_ttl: float = 15.0, curve_cache_size: int = 256
+    ):
+        """
+        Initialize the Jupiter API client.
+
+        Args:
+            curve_cache_ttl (float): Seconds a price-impact curve stays cached
+            curve_cache_size (int): Maximum number of cached curves
+        """
         self.base_url = "https://quote-api.jup.ag/v6"
         self.session: Optional[aiohttp.ClientSession] = None
+        self.curve_cache_ttl = curve_cache_ttl
+        self.curve_cache_size = curve_cache_size
+        self._curve_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -30,7 +53,11 @@ class JupiterAPI:
             await self.session.close()
 
     async def get_price(
-        self, input_mint: str, output_mint: str
+        self,
+        input_mint: str,
+        output_mint: str,
+        amount: int = 1000000000,
+        slippage_bps: int = 50,
     ) -> Dict[str, Any]:
         """
         Fetch real-time price data for token pairs from Jupiter.
@@ -38,6 +65,8 @@ class JupiterAPI:
         Args:
             input_mint (str): Input token mint address
             output_mint (str): Output token mint address
+            amount (int): Input amount to quote, in the input token's base units
+            slippage_bps (int): Allowed slippage in basis points
 
         Returns:
             Dict[str, Any]: Dictionary containing price data with the following structure:
@@ -46,6 +75,9 @@ class JupiterAPI:
                         'price': float,
                         'input_mint': str,
                         'output_mint': str,
+                        'in_amount': int,
+                        'out_amount': int,
+                        'price_impact_pct': float,
                         'timestamp': str,
                     },
                     'success': bool
@@ -61,7 +93,7 @@ class JupiterAPI:
                     "Session not initialized. Use async context manager."
                 )
 
-            endpoint = f"/quote?inputMint={input_mint}&outputMint={output_mint}&amount=1000000000&slippageBps=50"
+            endpoint = f"/quote?inputMint={input_mint}&outputMint={output_mint}&amount={amount}&slippageBps={slippage_bps}"
             url = f"{self.base_url}{endpoint}"
 
             logger.debug(f"Fetching price data from Jupiter: {url}")
@@ -81,6 +113,11 @@ class JupiterAPI:
                         / float(data["inAmount"]),
                         "input_mint": input_mint,
                         "output_mint": output_mint,
+                        "in_amount": int(data["inAmount"]),
+                        "out_amount": int(data["outAmount"]),
+                        "price_impact_pct": float(
+                            data.get("priceImpactPct") or 0
+                        ),
                         "timestamp": datetime.utcnow().isoformat(),
                     },
                     "success": True,
@@ -105,6 +142,199 @@ class JupiterAPI:
             )
             raise
 
+    async def get_prices(
+        self,
+        pairs: List[Tuple[str, str]],
+        max_concurrency: int = 10,
+        amount: int = 1000000000,
+        slippage_bps: int = 50,
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Fetch prices for many token pairs concurrently over this client's session.
+
+        Args:
+            pairs (List[Tuple[str, str]]): (input_mint, output_mint) pairs
+            max_concurrency (int): Maximum number of quotes in flight at once
+            amount (int): Input amount to quote, in the input token's base units
+            slippage_bps (int): Allowed slippage in basis points
+
+        Returns:
+            Dict[Tuple[str, str], Dict[str, Any]]: Price data keyed by pair, in the
+            same format as ``get_price``. Failed pairs have ``success`` set to
+            False and an ``error`` message.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def quote(pair: Tuple[str, str]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.get_price(
+                        pair[0], pair[1], amount, slippage_bps
+                    )
+                except Exception as e:
+                    return {"success": False, "error": str(e)}
+
+        unique = list(dict.fromkeys(pairs))
+        results = await asyncio.gather(*(quote(pair) for pair in unique))
+        logger.info(
+            f"Fetched {sum(r['success'] for r in results)}/{len(unique)} Jupiter prices"
+        )
+        return dict(zip(unique, results))
+
+    async def get_price_impact_curve(
+        self,
+        input_mint: str,
+        output_mint: str,
+        sizes: Optional[Sequence[int]] = None,
+        slippage_bps: int = 50,
+        max_concurrency: int = 10,
+        input_decimals: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Quote a ladder of input sizes concurrently and return the price-impact curve.
+
+        Curves are cached per pair, size ladder and slippage for
+        ``curve_cache_ttl`` seconds; at most ``curve_cache_size`` curves are
+        kept, least recently used first out. Callers get their own copy.
+
+        Args:
+            input_mint (str): Input token mint address
+            output_mint (str): Output token mint address
+            sizes (Optional[Sequence[int]]): Input amounts to quote, in the input
+                token's base units. Required unless ``input_decimals`` is given.
+            slippage_bps (int): Allowed slippage in basis points
+            max_concurrency (int): Maximum number of quotes in flight at once
+            input_decimals (Optional[int]): Decimals of the input token; without
+                ``sizes`` the ladder is ``DEFAULT_IMPACT_TOKEN_AMOUNTS`` whole
+                tokens converted to base units
+
+        Returns:
+            Dict[str, Any]: Dictionary with the following structure:
+                {
+                    'input_mint': str,
+                    'output_mint': str,
+                    'points': [
+                        {
+                            'amount': int,
+                            'out_amount': int,
+                            'price': float,
+                            'price_impact_pct': float,
+                            'impact_vs_best': float,
+                        },
+                        ...
+                    ],
+                    'errors': {amount: str},
+                    'timestamp': str,
+                }
+            ``impact_vs_best`` is the fractional price shortfall relative to the
+            best quoted price on the curve.
+
+        Raises:
+            ValueError: If neither ``sizes`` nor ``input_decimals`` is given
+        """
+        if not sizes:
+            if input_decimals is None:
+                raise ValueError(
+                    "Pass sizes in base units or the input token's decimals"
+                )
+            sizes = [
+                max(1, round(amount * 10**input_decimals))
+                for amount in self.DEFAULT_IMPACT_TOKEN_AMOUNTS
+            ]
+        sizes = tuple(sorted(set(sizes)))
+        key = (input_mint, output_mint, sizes, slippage_bps)
+        cached = self._curve_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.curve_cache_ttl:
+            logger.debug(
+                f"Using cached price-impact curve for {input_mint}/{output_mint}"
+            )
+            self._curve_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def quote(amount: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_price(
+                    input_mint, output_mint, amount, slippage_bps
+                )
+
+        results = await asyncio.gather(
+            *(quote(amount) for amount in sizes),
+            return_exceptions=True,
+        )
+
+        points, errors = [], {}
+        for amount, result in zip(sizes, results):
+            if isinstance(result, Exception):
+                errors[amount] = str(result)
+                continue
+            data = result["data"]
+            points.append(
+                {
+                    "amount": amount,
+                    "out_amount": data["out_amount"],
+                    "price": data["price"],
+                    "price_impact_pct": data["price_impact_pct"],
+                }
+            )
+
+        best_price = max((p["price"] for p in points), default=0)
+        for point in points:
+            point["impact_vs_best"] = (
+                1 - point["price"] / best_price if best_price else 0.0
+            )
+
+        curve = {
+            "input_mint": input_mint,
+            "output_mint": output_mint,
+            "points": points,
+            "errors": errors,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+        if points:
+            self._curve_cache[key] = (time.monotonic(), curve)
+            self._curve_cache.move_to_end(key)
+            while len(self._curve_cache) > self.curve_cache_size:
+                self._curve_cache.popitem(last=False)
+            return copy.deepcopy(curve)
+        return curve
+
+
+_shared_jupiter: Optional[JupiterAPI] = None
+_shared_jupiter_lock: Optional[asyncio.Lock] = None
+_shared_jupiter_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_jupiter_lock() -> asyncio.Lock:
+    """Return the lock guarding the shared client, bound to the running loop."""
+    global _shared_jupiter_lock, _shared_jupiter_lock_loop
+    loop = asyncio.get_running_loop()
+    if _shared_jupiter_lock is None or _shared_jupiter_lock_loop is not loop:
+        _shared_jupiter_lock = asyncio.Lock()
+        _shared_jupiter_lock_loop = loop
+    return _shared_jupiter_lock
+
+
+async def _get_shared_jupiter() -> JupiterAPI:
+    """Return a JupiterAPI whose session lives on the background loop."""
+    global _shared_jupiter
+    async with _get_shared_jupiter_lock():
+        if _shared_jupiter is None or _shared_jupiter.session.closed:
+            _shared_jupiter = await JupiterAPI().__aenter__()
+    return _shared_jupiter
+
+
+async def _close_shared_jupiter() -> None:
+    if _shared_jupiter is not None:
+        await _shared_jupiter.__aexit__(None, None, None)
+
+
+@atexit.register
+def _shutdown_shared_jupiter() -> None:
+    if _shared_jupiter is not None:
+        get_background_loop().run(_close_shared_jupiter(), timeout=5)
+
 
 async def get_jupiter_price_async(
     input_mint: str, output_mint: str
@@ -126,9 +356,96 @@ async def get_jupiter_price_async(
 def get_jupiter_price(
     input_mint: str, output_mint: str
 ) -> Dict[str, Any]:
-    return asyncio.run(
-        get_jupiter_price_async(input_mint, output_mint)
-    )
+    """
+    Synchronous wrapper around ``JupiterAPI.get_price``.
+
+    Runs on a shared background event loop and session instead of starting a
+    new loop and session per call.
+
+    Args:
+        input_mint (str): Input token mint address
+        output_mint (str): Output token mint address
+
+    Returns:
+        Dict[str, Any]: Price data dictionary
+    """
+
+    async def fetch() -> Dict[str, Any]:
+        jupiter = await _get_shared_jupiter()
+        return await jupiter.get_price(input_mint, output_mint)
+
+    return get_background_loop().run(fetch())
+
+
+def get_jupiter_prices(
+    pairs: List[Tuple[str, str]],
+    max_concurrency: int = 10,
+    timeout: Optional[float] = None,
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Synchronous wrapper around ``JupiterAPI.get_prices``.
+
+    Quotes all pairs concurrently over one shared session on the background
+    event loop.
+
+    Args:
+        pairs (List[Tuple[str, str]]): (input_mint, output_mint) pairs
+        max_concurrency (int): Maximum number of quotes in flight at once
+        timeout (Optional[float]): Seconds before the quotes in flight are
+            cancelled
+
+    Returns:
+        Dict[Tuple[str, str], Dict[str, Any]]: Price data keyed by pair
+
+    Raises:
+        asyncio.TimeoutError: If ``timeout`` expires
+    """
+
+    async def fetch() -> Dict[Tuple[str, str], Dict[str, Any]]:
+        jupiter = await _get_shared_jupiter()
+        return await asyncio.wait_for(
+            jupiter.get_prices(pairs, max_concurrency), timeout
+        )
+
+    return get_background_loop().run(fetch())
+
+
+def get_jupiter_price_impact_curve(
+    input_mint: str,
+    output_mint: str,
+    sizes: Optional[Sequence[int]] = None,
+    slippage_bps: int = 50,
+    input_decimals: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Synchronous wrapper around ``JupiterAPI.get_price_impact_curve``.
+
+    Uses the shared client, so repeated calls for the same pair within the
+    cache TTL are answered without new quotes.
+
+    Args:
+        input_mint (str): Input token mint address
+        output_mint (str): Output token mint address
+        sizes (Optional[Sequence[int]]): Input amounts to quote, in base units
+        slippage_bps (int): Allowed slippage in basis points
+        input_decimals (Optional[int]): Decimals of the input token, used to
+            build the default ladder when ``sizes`` is omitted
+
+    Returns:
+        Dict[str, Any]: The price-impact curve
+    """
+
+    async def fetch() -> Dict[str, Any]:
+        jupiter = await _get_shared_jupiter()
+        return await jupiter.get_price_impact_curve(
+            input_mint,
+            output_mint,
+            sizes,
+            slippage_bps,
+            input_decimals=input_decimals,
+        )
+
+    return get_background_loop().run(fetch())
 
 
 # # Example usage:
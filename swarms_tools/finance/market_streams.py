@@ -0,0 +1,655 @@
+"""
+Real-time Market Data Streams
+
+This module provides async WebSocket clients for HTX (Huobi) and OKX public
+market data. Streams subscribe to tickers, trades and order book depth,
+reconnect automatically, handle each venue's heartbeat protocol and feed a
+shared in-memory ``MarketState`` that tools can read without any network
+round trip.
+
+Channels: "ticker", "trades", "depth" (top levels, pushed as snapshots) and
+the opt-in "full_depth" (OKX ``books`` incremental updates, HTX 20-level MBP
+refresh). Both depth channels feed the same per-symbol book, so only one of
+them can be subscribed at a time.
+"""
+
+import asyncio
+import gzip
+import itertools
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import aiohttp
+from loguru import logger
+
+from swarms_tools.finance.order_book import OrderBook
+from swarms_tools.utils.background_loop import (
+    BackgroundEventLoop,
+    get_background_loop,
+)
+
+HTX_WS_URL = "wss://api.huobi.pro/ws"
+OKX_WS_URL = "wss://ws.okx.com:8443/ws/v5/public"
+STREAM_CHANNELS = ("ticker", "trades", "depth", "full_depth")
+DEFAULT_CHANNELS = ("ticker", "trades", "depth")
+
+
+class MarketState:
+    """
+    Thread-safe in-memory view of the latest streamed market data.
+
+    Data is keyed by venue ("htx" or "okx") and the venue's own symbol format
+    (e.g. "btcusdt" on HTX, "BTC-USDT" on OKX).
+    """
+
+    def __init__(self, max_trades: int = 500):
+        """
+        Args:
+            max_trades (int): Number of recent trades kept per symbol.
+        """
+        self.max_trades = max_trades
+        self._lock = threading.Lock()
+        self._tickers: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._trades: Dict[Tuple[str, str], deque] = {}
+        self._books: Dict[Tuple[str, str], OrderBook] = {}
+
+    def update_ticker(
+        self, venue: str, symbol: str, ticker: Dict[str, Any]
+    ) -> None:
+        """Replace the ticker for a symbol."""
+        with self._lock:
+            self._tickers[(venue, symbol)] = ticker
+
+    def add_trades(
+        self, venue: str, symbol: str, trades: Iterable[Dict[str, Any]]
+    ) -> None:
+        """Append trades for a symbol, keeping the most recent ``max_trades``."""
+        with self._lock:
+            self._trades.setdefault(
+                (venue, symbol), deque(maxlen=self.max_trades)
+            ).extend(trades)
+
+    def update_book(
+        self,
+        venue: str,
+        symbol: str,
+        bids: Iterable[List[Any]],
+        asks: Iterable[List[Any]],
+        timestamp: Optional[int] = None,
+        snapshot: bool = True,
+    ) -> None:
+        """
+        Replace (``snapshot=True``) or incrementally update a symbol's book.
+
+        Levels are ``[price, size, ...]``; in updates a size of zero removes
+        the level.
+        """
+        with self._lock:
+            book = self._books.get((venue, symbol))
+            if book is None:
+                book = self._books[(venue, symbol)] = OrderBook(symbol)
+            if snapshot:
+                book.apply_snapshot(bids, asks, timestamp)
+            else:
+                book.apply_update(bids, asks, timestamp)
+
+    def get_ticker(
+        self, venue: str, symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the latest ticker for a symbol, if any."""
+        with self._lock:
+            return self._tickers.get((venue, symbol))
+
+    def get_trades(
+        self, venue: str, symbol: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Return recent trades for a symbol, oldest first."""
+        with self._lock:
+            trades = list(self._trades.get((venue, symbol), ()))
+        return trades[-limit:] if limit else trades
+
+    def get_book(
+        self, venue: str, symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the current order book for a symbol as plain data, if any."""
+        with self._lock:
+            book = self._books.get((venue, symbol))
+            return book.to_dict() if book is not None else None
+
+    def get_order_book(
+        self, venue: str, symbol: str
+    ) -> Optional[OrderBook]:
+        """Return a private copy of a symbol's ``OrderBook`` for local queries."""
+        with self._lock:
+            book = self._books.get((venue, symbol))
+            return book.copy() if book is not None else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of all tickers and books, keyed by "venue:symbol"."""
+        with self._lock:
+            return {
+                "tickers": {
+                    f"{venue}:{symbol}": ticker
+                    for (venue, symbol), ticker in self._tickers.items()
+                },
+                "books": {
+                    f"{venue}:{symbol}": book.to_dict()
+                    for (venue, symbol), book in self._books.items()
+                },
+            }
+
+
+class MarketDataStream(ABC):
+    """
+    Base class for a reconnecting WebSocket market data subscription.
+
+    Subclasses define the venue's subscription messages, frame decoding and
+    message handling. ``run`` keeps the connection alive until ``stop`` is
+    called, reconnecting with exponential backoff and re-subscribing after
+    every drop. Frames that fail to decode or handle are logged and skipped.
+    """
+
+    venue: str = ""
+    default_url: str = ""
+
+    def __init__(
+        self,
+        symbols: List[str],
+        channels: Iterable[str] = DEFAULT_CHANNELS,
+        state: Optional[MarketState] = None,
+        url: Optional[str] = None,
+        idle_timeout: float = 25.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """
+        Args:
+            symbols (List[str]): Symbols in the venue's format.
+            channels (Iterable[str]): Any of "ticker", "trades", "depth" and
+                "full_depth", where "depth" and "full_depth" are exclusive.
+            state (Optional[MarketState]): State to update; a new one is created if omitted.
+            url (Optional[str]): WebSocket URL, defaults to the venue's public endpoint.
+            idle_timeout (float): Seconds without a message before the heartbeat
+                logic kicks in.
+            reconnect_delay (float): Initial delay between reconnection attempts.
+            max_reconnect_delay (float): Upper bound for the reconnection delay.
+        """
+        unknown = set(channels) - set(STREAM_CHANNELS)
+        if unknown:
+            raise ValueError(
+                f"Invalid channels: {sorted(unknown)}. Must be any of {list(STREAM_CHANNELS)}."
+            )
+        if {"depth", "full_depth"} <= set(channels):
+            raise ValueError(
+                "The depth and full_depth channels both write the symbol's "
+                "order book; subscribe to only one of them."
+            )
+        self.symbols = list(symbols)
+        self.channels = list(channels)
+        self.state = state or MarketState()
+        self.url = url or self.default_url
+        self.idle_timeout = idle_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.connected = asyncio.Event()
+        self.connections = 0
+        self._stopping = False
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+
+    @abstractmethod
+    def _subscription_messages(self) -> List[Any]:
+        """Messages sent after every (re)connect to subscribe."""
+
+    @abstractmethod
+    def _decode(self, message: aiohttp.WSMessage) -> Any:
+        """Decode a frame, returning None for frames that carry no payload."""
+
+    @abstractmethod
+    async def _handle(
+        self, ws: aiohttp.ClientWebSocketResponse, payload: Any
+    ) -> None:
+        """Process a decoded payload."""
+
+    async def _on_idle(self, ws: aiohttp.ClientWebSocketResponse) -> bool:
+        """
+        Called when no message arrived within ``idle_timeout``.
+
+        Returns:
+            bool: True to keep waiting on this connection, False to reconnect.
+        """
+        return False
+
+    async def run(self) -> None:
+        """Connect, subscribe and process messages until ``stop`` is called."""
+        self._stopping = False
+        delay = self.reconnect_delay
+        async with aiohttp.ClientSession() as session:
+            while not self._stopping:
+                try:
+                    async with session.ws_connect(self.url) as ws:
+                        self._ws = ws
+                        self.connections += 1
+                        for message in self._subscription_messages():
+                            await ws.send_str(json.dumps(message))
+                        logger.info(
+                            f"{self.venue} stream connected to {self.url}"
+                        )
+                        self.connected.set()
+                        delay = self.reconnect_delay
+                        await self._read_loop(ws)
+                except (
+                    aiohttp.ClientError,
+                    asyncio.TimeoutError,
+                    ConnectionError,
+                    ValueError,
+                ) as e:
+                    logger.warning(f"{self.venue} stream error: {e}")
+                except Exception:
+                    logger.exception(
+                        f"{self.venue} stream failed unexpectedly"
+                    )
+                finally:
+                    self._ws = None
+                    self.connected.clear()
+
+                if self._stopping:
+                    break
+                logger.info(
+                    f"{self.venue} stream reconnecting in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _read_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        while True:
+            try:
+                message = await ws.receive(timeout=self.idle_timeout)
+            except asyncio.TimeoutError:
+                if await self._on_idle(ws):
+                    continue
+                raise
+
+            if message.type in (
+                aiohttp.WSMsgType.CLOSE,
+                aiohttp.WSMsgType.CLOSING,
+                aiohttp.WSMsgType.CLOSED,
+                aiohttp.WSMsgType.ERROR,
+            ):
+                return
+
+            try:
+                payload = self._decode(message)
+                if payload is not None:
+                    await self._handle(ws, payload)
+            except (aiohttp.ClientError, ConnectionError):
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"{self.venue} stream skipped a malformed frame: {e!r}"
+                )
+
+    async def stop(self) -> None:
+        """Stop the stream and close the current connection."""
+        self._stopping = True
+        if self._ws is not None:
+            await self._ws.close()
+
+
+class HTXMarketStream(MarketDataStream):
+    """
+    HTX (Huobi) public market data stream.
+
+    Frames are gzip-compressed JSON. The server sends ``{"ping": ts}`` every few
+    seconds and drops clients that do not answer with ``{"pong": ts}``; a
+    connection that goes silent for ``idle_timeout`` is re-established.
+    """
+
+    venue = "htx"
+    default_url = HTX_WS_URL
+
+    _TOPICS = {
+        "ticker": "market.{}.ticker",
+        "trades": "market.{}.trade.detail",
+        "depth": "market.{}.depth.step0",
+        "full_depth": "market.{}.mbp.refresh.20",
+    }
+
+    def _subscription_messages(self) -> List[Dict[str, Any]]:
+        ids = itertools.count(1)
+        return [
+            {
+                "sub": self._TOPICS[channel].format(symbol.lower()),
+                "id": str(next(ids)),
+            }
+            for symbol in self.symbols
+            for channel in self.channels
+        ]
+
+    def _decode(self, message: aiohttp.WSMessage) -> Any:
+        if message.type == aiohttp.WSMsgType.BINARY:
+            return json.loads(gzip.decompress(message.data))
+        if message.type == aiohttp.WSMsgType.TEXT:
+            return json.loads(message.data)
+        return None
+
+    async def _handle(
+        self, ws: aiohttp.ClientWebSocketResponse, payload: Dict[str, Any]
+    ) -> None:
+        if "ping" in payload:
+            await ws.send_str(json.dumps({"pong": payload["ping"]}))
+            return
+        if payload.get("status") == "error":
+            logger.error(f"HTX stream error: {payload.get('err-msg')}")
+            return
+
+        channel = payload.get("ch")
+        tick = payload.get("tick")
+        if not channel or tick is None:
+            return
+
+        _, symbol, topic = channel.split(".", 2)
+        if topic == "ticker":
+            self.state.update_ticker(
+                self.venue,
+                symbol,
+                {
+                    "last": tick.get("lastPrice", tick.get("close")),
+                    "bid": tick.get("bid"),
+                    "ask": tick.get("ask"),
+                    "bid_size": tick.get("bidSize"),
+                    "ask_size": tick.get("askSize"),
+                    "open": tick.get("open"),
+                    "high": tick.get("high"),
+                    "low": tick.get("low"),
+                    "volume": tick.get("amount"),
+                    "timestamp": payload.get("ts"),
+                },
+            )
+        elif topic == "trade.detail":
+            self.state.add_trades(
+                self.venue,
+                symbol,
+                (
+                    {
+                        "price": trade["price"],
+                        "amount": trade["amount"],
+                        "side": trade.get("direction"),
+                        "trade_id": trade.get("tradeId", trade.get("id")),
+                        "timestamp": trade.get("ts"),
+                    }
+                    for trade in tick.get("data", [])
+                ),
+            )
+        elif topic.startswith(("depth.", "mbp.refresh.")):
+            self.state.update_book(
+                self.venue,
+                symbol,
+                tick.get("bids", []),
+                tick.get("asks", []),
+                tick.get("ts", payload.get("ts")),
+            )
+
+
+class OKXMarketStream(MarketDataStream):
+    """
+    OKX public market data stream.
+
+    OKX closes connections that are silent for 30 seconds, so after
+    ``idle_timeout`` seconds without a message the client sends ``"ping"`` and
+    reconnects if nothing (normally ``"pong"``) arrives in the next window.
+
+    Incremental ``books`` updates are checked against the previous update's
+    ``seqId``; on a gap the symbol's book channel is resubscribed, which makes
+    OKX send a fresh snapshot.
+    """
+
+    venue = "okx"
+    default_url = OKX_WS_URL
+
+    _CHANNELS = {
+        "ticker": "tickers",
+        "trades": "trades",
+        "depth": "books5",
+        "full_depth": "books",
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._awaiting_pong = False
+        self._book_seq: Dict[str, int] = {}
+        self._resyncing: Set[str] = set()
+
+    def _subscription_messages(self) -> List[Dict[str, Any]]:
+        self._book_seq.clear()
+        self._resyncing.clear()
+        return [
+            {
+                "op": "subscribe",
+                "args": [
+                    {"channel": self._CHANNELS[channel], "instId": symbol}
+                    for symbol in self.symbols
+                    for channel in self.channels
+                ],
+            }
+        ]
+
+    def _decode(self, message: aiohttp.WSMessage) -> Any:
+        if message.type != aiohttp.WSMsgType.TEXT:
+            return None
+        self._awaiting_pong = False
+        if message.data == "pong":
+            return None
+        return json.loads(message.data)
+
+    async def _on_idle(self, ws: aiohttp.ClientWebSocketResponse) -> bool:
+        if self._awaiting_pong:
+            return False
+        self._awaiting_pong = True
+        await ws.send_str("ping")
+        return True
+
+    async def _handle(
+        self, ws: aiohttp.ClientWebSocketResponse, payload: Dict[str, Any]
+    ) -> None:
+        if payload.get("event") == "error":
+            logger.error(f"OKX stream error: {payload.get('msg')}")
+            return
+
+        arg = payload.get("arg", {})
+        channel, symbol = arg.get("channel"), arg.get("instId")
+        data = payload.get("data")
+        if not channel or not data:
+            return
+
+        if channel == "tickers":
+            ticker = data[-1]
+            self.state.update_ticker(
+                self.venue,
+                symbol,
+                {
+                    "last": float(ticker["last"]),
+                    "bid": float(ticker["bidPx"] or 0),
+                    "ask": float(ticker["askPx"] or 0),
+                    "bid_size": float(ticker["bidSz"] or 0),
+                    "ask_size": float(ticker["askSz"] or 0),
+                    "open": float(ticker["open24h"]),
+                    "high": float(ticker["high24h"]),
+                    "low": float(ticker["low24h"]),
+                    "volume": float(ticker["vol24h"]),
+                    "timestamp": int(ticker["ts"]),
+                },
+            )
+        elif channel == "trades":
+            self.state.add_trades(
+                self.venue,
+                symbol,
+                (
+                    {
+                        "price": float(trade["px"]),
+                        "amount": float(trade["sz"]),
+                        "side": trade["side"],
+                        "trade_id": trade["tradeId"],
+                        "timestamp": int(trade["ts"]),
+                    }
+                    for trade in data
+                ),
+            )
+        elif channel.startswith("books"):
+            # "books" sends a snapshot followed by incremental updates;
+            # "books5" always pushes full snapshots without an action.
+            incremental = payload.get("action") == "update"
+            if channel == "books":
+                # Updates still in flight after a gap are dropped until the
+                # resubscription's snapshot arrives.
+                if incremental and symbol in self._resyncing:
+                    return
+                if not self._check_sequence(symbol, data, incremental):
+                    self._resyncing.add(symbol)
+                    await self._resubscribe_book(ws, symbol)
+                    return
+                self._resyncing.discard(symbol)
+            for book in data if incremental else data[-1:]:
+                self.state.update_book(
+                    self.venue,
+                    symbol,
+                    book.get("bids", []),
+                    book.get("asks", []),
+                    int(book["ts"]) if book.get("ts") else None,
+                    snapshot=not incremental,
+                )
+
+    def _check_sequence(
+        self, symbol: str, data: List[Dict[str, Any]], incremental: bool
+    ) -> bool:
+        """Track ``seqId`` for a symbol's ``books`` channel; False on a gap."""
+        expected = self._book_seq.get(symbol)
+        for book in data:
+            if incremental and int(book["prevSeqId"]) != expected:
+                logger.warning(
+                    f"OKX books sequence gap for {symbol}: expected "
+                    f"prevSeqId {expected}, got {book['prevSeqId']}"
+                )
+                self._book_seq.pop(symbol, None)
+                return False
+            expected = int(book["seqId"])
+        self._book_seq[symbol] = expected
+        return True
+
+    async def _resubscribe_book(
+        self, ws: aiohttp.ClientWebSocketResponse, symbol: str
+    ) -> None:
+        args = [{"channel": "books", "instId": symbol}]
+        for op in ("unsubscribe", "subscribe"):
+            await ws.send_str(json.dumps({"op": op, "args": args}))
+
+
+_market_state = MarketState()
+_streams: Dict[str, Tuple[MarketDataStream, asyncio.Future]] = {}
+_streams_lock = threading.Lock()
+
+
+def start_market_streams(
+    htx_symbols: Optional[List[str]] = None,
+    okx_symbols: Optional[List[str]] = None,
+    channels: Iterable[str] = DEFAULT_CHANNELS,
+) -> MarketState:
+    """
+    Start HTX and/or OKX streams on the shared background event loop.
+
+    There is at most one stream per venue. Calling this again with the same
+    symbols and channels leaves the running stream alone; different symbols
+    or channels replace the venue's stream.
+
+    Args:
+        htx_symbols (Optional[List[str]]): HTX symbols, e.g. ["btcusdt"].
+        okx_symbols (Optional[List[str]]): OKX instrument ids, e.g. ["BTC-USDT"].
+        channels (Iterable[str]): Any of "ticker", "trades", "depth" and
+            "full_depth", where "depth" and "full_depth" are exclusive.
+
+    Returns:
+        MarketState: The shared state the streams write into.
+    """
+    loop = get_background_loop()
+    channels = list(channels)
+
+    async def start(stream: MarketDataStream) -> asyncio.Future:
+        return asyncio.ensure_future(stream.run())
+
+    with _streams_lock:
+        for stream_class, symbols in (
+            (HTXMarketStream, htx_symbols),
+            (OKXMarketStream, okx_symbols),
+        ):
+            if not symbols:
+                continue
+            running = _streams.get(stream_class.venue)
+            if running is not None:
+                stream, task = running
+                if (
+                    not task.done()
+                    and stream.symbols == list(symbols)
+                    and stream.channels == channels
+                ):
+                    continue
+                _stop_stream(loop, stream_class.venue)
+
+            stream = stream_class(
+                symbols, channels=channels, state=_market_state
+            )
+            _streams[stream_class.venue] = (stream, loop.run(start(stream)))
+    return _market_state
+
+
+def _stop_stream(
+    loop: BackgroundEventLoop, venue: str, timeout: float = 5.0
+) -> None:
+    stream, task = _streams.pop(venue)
+
+    async def stop() -> None:
+        await stream.stop()
+        try:
+            # Cancels the task if it does not finish in time.
+            await asyncio.wait_for(task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"{venue} stream did not stop in {timeout}s")
+
+    loop.run(stop())
+
+
+def stop_market_streams() -> None:
+    """Stop every stream started with ``start_market_streams``."""
+    loop = get_background_loop()
+    with _streams_lock:
+        for venue in list(_streams):
+            _stop_stream(loop, venue)
+
+
+def get_streamed_market_data(venue: str, symbol: str) -> Dict[str, Any]:
+    """
+    Read the latest streamed ticker, order book and trades for a symbol.
+
+    Requires ``start_market_streams`` to have been called; no network request
+    is made.
+
+    Args:
+        venue (str): "htx" or "okx".
+        symbol (str): Symbol in the venue's format.
+
+    Returns:
+        Dict[str, Any]: ``ticker``, ``order_book`` and ``recent_trades`` (each
+        empty if nothing has been received yet) and the read ``timestamp``.
+    """
+    return {
+        "venue": venue,
+        "symbol": symbol,
+        "ticker": _market_state.get_ticker(venue, symbol),
+        "order_book": _market_state.get_book(venue, symbol),
+        "recent_trades": _market_state.get_trades(
+            venue, symbol, limit=50
+        ),
+        "timestamp": int(time.time() * 1000),
+    }
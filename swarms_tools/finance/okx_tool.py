@@ -1,10 +1,221 @@
 import os
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
+import numpy as np
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from swarms_tools.utils.ohlcv import OHLCV_DTYPE, ohlcv_to_frame
 from swarms_tools.utils.formatted_string import (
     format_object_to_string,
 )
+from swarms_tools.utils.rate_limiter import RateLimiter
+
+# Bar sizes accepted by /market/history-candles, in seconds.
+BAR_SECONDS = {
+    "1m": 60,
+    "3m": 180,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1H": 3600,
+    "2H": 7200,
+    "4H": 14400,
+    "6H": 21600,
+    "12H": 43200,
+    "1D": 86400,
+    "1W": 604800,
+}
+MAX_CANDLES_PER_REQUEST = 100
+# OKX allows 20 history-candles requests per 2 seconds per IP.
+_candles_rate_limiter = RateLimiter(20, 2.0)
+
+
+class OKXTickerSnapshot:
+    """
+    Cached, instId-indexed view of OKX tickers.
+
+    Full-market snapshots come from ``/market/tickers`` and are indexed by
+    ``instId``. Lookups for a few symbols whose entries are stale go to the
+    single-instrument ``/market/ticker`` endpoint instead of downloading the
+    whole market again.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5.0,
+        inst_type: str = "SPOT",
+        max_single_requests: int = 5,
+        session: Optional[requests.Session] = None,
+        base_url: str = "https://www.okx.com/api/v5",
+    ):
+        """
+        Args:
+            ttl (float): Seconds a cached ticker is considered fresh.
+            inst_type (str): Instrument type of the full snapshot.
+            max_single_requests (int): Largest number of stale symbols fetched
+                individually; more than this triggers one full refresh.
+            session (Optional[requests.Session]): Session to use; a pooled one is
+                created if omitted.
+            base_url (str): OKX REST API base URL.
+        """
+        self.ttl = ttl
+        self.inst_type = inst_type
+        self.max_single_requests = max_single_requests
+        self.base_url = base_url
+        if session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=16),
+            )
+        self.session = session
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+        self._stop_event: Optional[threading.Event] = None
+
+    def _request(
+        self, path: str, params: Dict[str, str], timeout: float = 10
+    ) -> Dict[str, Any]:
+        response = self.session.get(
+            f"{self.base_url}{path}", params=params, timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def refresh(self, timeout: float = 10) -> None:
+        """
+        Download the full ticker snapshot and rebuild the index.
+
+        Args:
+            timeout (float): Request timeout in seconds.
+
+        Raises:
+            ValueError: If the OKX API returns an error.
+            requests.RequestException: If the API request fails.
+        """
+        data = self._request(
+            "/market/tickers", {"instType": self.inst_type}, timeout
+        )
+        if data.get("code") != "0":
+            raise ValueError(
+                f"OKX API error: {data.get('msg', 'Unknown error')}"
+            )
+        now = time.monotonic()
+        tickers = {coin["instId"]: coin for coin in data["data"]}
+        with self._lock:
+            self._tickers = tickers
+            self._fetched_at = dict.fromkeys(tickers, now)
+            self._refreshed_at = now
+        logger.debug(f"Refreshed OKX snapshot: {len(tickers)} tickers")
+
+    def _fetch_single(
+        self, inst_id: str, timeout: float = 10
+    ) -> Optional[Dict[str, Any]]:
+        data = self._request(
+            "/market/ticker", {"instId": inst_id}, timeout
+        )
+        if data.get("code") != "0" or not data.get("data"):
+            logger.warning(
+                f"No OKX ticker for {inst_id}: {data.get('msg', 'empty response')}"
+            )
+            return None
+        return data["data"][0]
+
+    def get(
+        self,
+        inst_ids: Optional[Iterable[str]] = None,
+        timeout: float = 10,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return tickers keyed by instId, refreshing stale entries first.
+
+        Args:
+            inst_ids (Optional[Iterable[str]]): Instruments to return. All
+                instruments of the snapshot if None.
+            timeout (float): Timeout in seconds for each refresh request.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Raw OKX tickers; unknown instruments are
+            omitted.
+
+        Raises:
+            ValueError: If the OKX API returns an error.
+            requests.RequestException: If the API request fails.
+        """
+        now = time.monotonic()
+        if inst_ids is None:
+            if now - self._refreshed_at >= self.ttl:
+                self.refresh(timeout)
+            return dict(self._tickers)
+
+        wanted = set(inst_ids)
+        fetched_at = self._fetched_at
+        stale = [
+            inst_id
+            for inst_id in wanted
+            if now - fetched_at.get(inst_id, 0.0) >= self.ttl
+        ]
+        if len(stale) > self.max_single_requests:
+            self.refresh(timeout)
+        elif stale:
+            with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+                results = list(
+                    pool.map(
+                        lambda inst_id: self._fetch_single(
+                            inst_id, timeout
+                        ),
+                        stale,
+                    )
+                )
+            now = time.monotonic()
+            with self._lock:
+                for inst_id, ticker in zip(stale, results):
+                    if ticker is not None:
+                        self._tickers[inst_id] = ticker
+                        self._fetched_at[inst_id] = now
+
+        tickers = self._tickers
+        return {
+            inst_id: tickers[inst_id]
+            for inst_id in wanted
+            if inst_id in tickers
+        }
+
+    def start_auto_refresh(self, interval: Optional[float] = None) -> None:
+        """
+        Refresh the full snapshot every ``interval`` seconds in a daemon thread.
+
+        Args:
+            interval (Optional[float]): Seconds between refreshes, defaults to ``ttl``.
+        """
+        if self._stop_event is not None:
+            return
+        interval = interval or self.ttl
+        stop_event = self._stop_event = threading.Event()
+
+        def loop() -> None:
+            while not stop_event.is_set():
+                try:
+                    self.refresh()
+                except (ValueError, requests.RequestException) as e:
+                    logger.warning(f"OKX snapshot refresh failed: {e}")
+                stop_event.wait(interval)
+
+        threading.Thread(
+            target=loop, name="okx-ticker-snapshot", daemon=True
+        ).start()
+
+    def stop_auto_refresh(self) -> None:
+        """Stop the background refresh thread, if running."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
 
 
 class OKXAPI:
@@ -20,6 +231,7 @@ class OKXAPI:
     PASSPHRASE = os.getenv(
         "OKX_PASSPHRASE"
     )  # Fetch passphrase from environment variable
+    snapshot = OKXTickerSnapshot(base_url=BASE_URL)
 
     @staticmethod
     @logger.catch
@@ -40,38 +252,25 @@ class OKXAPI:
             ValueError: If the API response contains errors or the coin symbols are invalid.
             requests.RequestException: If the API request fails.
         """
-        endpoint = f"{OKXAPI.BASE_URL}/market/tickers"
-        params = {"instType": "SPOT"}
         logger.info(
             f"Fetching coin data for: {coin_symbols or 'all available coins'}"
         )
 
         try:
-            response = requests.get(
-                endpoint, params=params, timeout=10
-            )
-            response.raise_for_status()
+            tickers = OKXAPI.snapshot.get(coin_symbols or None)
         except requests.RequestException as e:
             logger.error(
                 f"Failed to fetch coin data from OKX API: {e}"
             )
             raise
-
-        data = response.json()
-        logger.debug(f"Raw data received: {data}")
-
-        if data.get("code") != "0":
-            logger.error(
-                f"Error from OKX API: {data.get('msg', 'Unknown error')}"
-            )
-            raise ValueError(
-                f"OKX API error: {data.get('msg', 'Unknown error')}"
-            )
+        except ValueError as e:
+            logger.error(f"Error from OKX API: {e}")
+            raise
 
         filtered_data = OKXAPI._filter_data(
-            data["data"], coin_symbols
+            list(tickers.values()), coin_symbols
         )
-        logger.info(f"Filtered data: {filtered_data}")
+        logger.info(f"Returning data for {len(filtered_data)} coins")
         return filtered_data
 
     @staticmethod
@@ -91,10 +290,11 @@ class OKXAPI:
         if not coin_symbols:
             return {coin["instId"]: coin for coin in data}
 
+        wanted = set(coin_symbols)
         filtered_data = {
             coin["instId"]: coin
             for coin in data
-            if coin["instId"] in coin_symbols
+            if coin["instId"] in wanted
         }
         if not filtered_data:
             logger.warning(
@@ -103,6 +303,171 @@ class OKXAPI:
         return filtered_data
 
 
+def _to_epoch_seconds(value: Union[datetime, int, float]) -> int:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return int(value)
+
+
+def _fetch_candle_window(
+    session: requests.Session,
+    rate_limiter: RateLimiter,
+    inst_id: str,
+    bar: str,
+    window: Tuple[int, int],
+) -> List[List[str]]:
+    """Fetch every candle in ``[start_ms, end_ms)``, newest first."""
+    start_ms, end_ms = window
+    rows: List[List[str]] = []
+    after = end_ms
+    while after > start_ms:
+        with rate_limiter:
+            response = session.get(
+                f"{OKXAPI.BASE_URL}/market/history-candles",
+                params={
+                    "instId": inst_id,
+                    "bar": bar,
+                    # Both bounds are exclusive.
+                    "after": str(after),
+                    "before": str(start_ms - 1),
+                    "limit": str(MAX_CANDLES_PER_REQUEST),
+                },
+                timeout=10,
+            )
+        response.raise_for_status()
+        data = response.json()
+        if data.get("code") != "0":
+            raise ValueError(
+                f"OKX API error: {data.get('msg', 'Unknown error')}"
+            )
+        page = data["data"]
+        rows.extend(page)
+        if len(page) < MAX_CANDLES_PER_REQUEST:
+            break
+        after = int(page[-1][0])
+    return rows
+
+
+def fetch_history_candles(
+    inst_id: str,
+    start: Union[datetime, int, float],
+    end: Union[datetime, int, float],
+    bar: str = "1m",
+    max_workers: int = 8,
+    rate_limiter: Optional[RateLimiter] = None,
+    session: Optional[requests.Session] = None,
+) -> np.ndarray:
+    """
+    Backfill OKX candles for a date range with parallel windowed requests.
+
+    The range is split into windows of ``MAX_CANDLES_PER_REQUEST`` bars that
+    are fetched concurrently, throttled by a rate limiter shared by all callers
+    in the process, and stitched into one sorted array without duplicates.
+
+    Args:
+        inst_id (str): Instrument id, e.g. "BTC-USDT".
+        start (Union[datetime, int, float]): Range start (inclusive); a datetime
+            (naive values are UTC) or epoch seconds.
+        end (Union[datetime, int, float]): Range end (exclusive).
+        bar (str): Bar size, one of ``BAR_SECONDS``.
+        max_workers (int): Maximum number of concurrent requests.
+        rate_limiter (Optional[RateLimiter]): Limiter to throttle requests with.
+            Defaults to OKX's public limit of 20 requests per 2 seconds.
+        session (Optional[requests.Session]): Session to use, defaults to the
+            pooled session of ``OKXAPI.snapshot``.
+
+    Returns:
+        np.ndarray: Structured array with ``OHLCV_DTYPE`` fields (timestamps in
+        epoch seconds, volume in base currency), sorted by time. Use
+        ``ohlcv_to_frame`` for a DataFrame.
+
+    Raises:
+        ValueError: If ``bar`` is unknown or the OKX API returns an error.
+        requests.RequestException: If a request fails.
+    """
+    if bar not in BAR_SECONDS:
+        raise ValueError(
+            f"Invalid bar: {bar}. Must be one of {list(BAR_SECONDS)}."
+        )
+    start_ms = _to_epoch_seconds(start) * 1000
+    end_ms = _to_epoch_seconds(end) * 1000
+    if end_ms <= start_ms:
+        return np.empty(0, dtype=OHLCV_DTYPE)
+
+    rate_limiter = rate_limiter or _candles_rate_limiter
+    session = session or OKXAPI.snapshot.session
+    step = BAR_SECONDS[bar] * 1000 * MAX_CANDLES_PER_REQUEST
+    windows = [
+        (window_start, min(window_start + step, end_ms))
+        for window_start in range(start_ms, end_ms, step)
+    ]
+    logger.info(
+        f"Backfilling {inst_id} {bar} candles in {len(windows)} windows"
+    )
+
+    def fetch(window: Tuple[int, int]) -> List[List[str]]:
+        return _fetch_candle_window(
+            session, rate_limiter, inst_id, bar, window
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(windows))
+    ) as pool:
+        pages = list(pool.map(fetch, windows))
+
+    rows = [row for page in pages for row in page]
+    candles = np.array(
+        [
+            (
+                int(row[0]) // 1000,
+                float(row[1]),
+                float(row[2]),
+                float(row[3]),
+                float(row[4]),
+                float(row[5]),
+            )
+            for row in rows
+        ],
+        dtype=OHLCV_DTYPE,
+    )
+    # Windows are disjoint, but drop any duplicate bars a page boundary or a
+    # retried request may have produced; np.unique also sorts by time.
+    _, first_index = np.unique(candles["timestamp"], return_index=True)
+    return candles[first_index]
+
+
+def okx_history_candles_tool(
+    inst_id: str, days: float = 1, bar: str = "1H"
+) -> str:
+    """
+    Fetch recent OKX candle history for an instrument.
+
+    Args:
+        inst_id (str): Instrument id, e.g. "BTC-USDT".
+        days (float): How many days of history to fetch, ending now.
+        bar (str): Bar size, e.g. "1m", "1H" or "1D".
+
+    Returns:
+       String: Open/High/Low/Close/Volume keyed by bar open time.
+    """
+    try:
+        end = time.time()
+        candles = fetch_history_candles(
+            inst_id, end - days * 86400, end, bar=bar
+        )
+        return format_object_to_string(
+            ohlcv_to_frame(candles).to_dict(orient="index")
+        )
+    except ValueError as ve:
+        logger.error(f"ValueError occurred: {ve}")
+        return {"error": str(ve)}
+    except Exception as e:
+        logger.error(f"Unexpected error occurred: {e}")
+        return {"error": str(e)}
+
+
 def okx_api_tool(coin_symbols: Optional[List[str]] = None) -> str:
     """
     Fetch and display data for one or more coins using the OKX API.
@@ -0,0 +1,295 @@
+"""
+Local L2 Order Book
+
+A price-level order book kept in sorted arrays so execution logic can query
+liquidity locally instead of re-fetching and re-parsing depth snapshots.
+Books can be seeded from HTX ``/market/depth`` or OKX ``/market/books``
+responses and kept current with incremental updates from the WebSocket
+streams in ``market_streams``.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Level = Tuple[float, float]
+
+
+class _BookSide:
+    """One side of the book: ascending price array plus price -> size map."""
+
+    __slots__ = ("prices", "sizes")
+
+    def __init__(self):
+        self.prices: List[float] = []
+        self.sizes: Dict[float, float] = {}
+
+    def set(self, price: float, size: float) -> None:
+        if size <= 0:
+            if self.sizes.pop(price, None) is not None:
+                del self.prices[bisect_left(self.prices, price)]
+        else:
+            if price not in self.sizes:
+                insort(self.prices, price)
+            self.sizes[price] = size
+
+    def copy(self) -> "_BookSide":
+        side = _BookSide()
+        side.prices = self.prices.copy()
+        side.sizes = self.sizes.copy()
+        return side
+
+
+def _parse_levels(levels: Iterable[Sequence[Any]]) -> List[Level]:
+    # OKX levels carry extra fields ([price, size, "0", orders]) and strings.
+    return [(float(level[0]), float(level[1])) for level in levels]
+
+
+class OrderBook:
+    """
+    Level-2 order book with incremental updates.
+
+    Each side keeps its prices in an ascending list maintained with ``bisect``,
+    so best prices are O(1), level updates are O(log n) plus a list shift, and
+    range queries only touch the levels they return.
+    """
+
+    def __init__(self, symbol: Optional[str] = None):
+        """
+        Args:
+            symbol (Optional[str]): Symbol the book belongs to, for reference only.
+        """
+        self.symbol = symbol
+        self.timestamp: Optional[int] = None
+        self._bids = _BookSide()
+        self._asks = _BookSide()
+
+    @classmethod
+    def from_htx_depth(
+        cls, depth: Dict[str, Any], symbol: Optional[str] = None
+    ) -> "OrderBook":
+        """
+        Builds a book from an HTX ``/market/depth`` response or its ``tick``.
+
+        Args:
+            depth (Dict[str, Any]): The full response or just its ``tick``.
+            symbol (Optional[str]): Symbol the book belongs to.
+
+        Returns:
+            OrderBook: The seeded book.
+        """
+        tick = depth.get("tick", depth)
+        book = cls(symbol)
+        book.apply_snapshot(
+            tick.get("bids", []),
+            tick.get("asks", []),
+            tick.get("ts", depth.get("ts")),
+        )
+        return book
+
+    @classmethod
+    def from_okx_books(
+        cls, books: Dict[str, Any], symbol: Optional[str] = None
+    ) -> "OrderBook":
+        """
+        Builds a book from an OKX ``/market/books`` response or one ``data`` entry.
+
+        Args:
+            books (Dict[str, Any]): The full response or one of its ``data`` items.
+            symbol (Optional[str]): Symbol the book belongs to.
+
+        Returns:
+            OrderBook: The seeded book.
+        """
+        if "data" in books:
+            books = books["data"][0] if books["data"] else {}
+        book = cls(symbol)
+        book.apply_snapshot(
+            books.get("bids", []),
+            books.get("asks", []),
+            int(books["ts"]) if books.get("ts") else None,
+        )
+        return book
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Sequence[Any]],
+        asks: Iterable[Sequence[Any]],
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """
+        Replaces the whole book.
+
+        Args:
+            bids (Iterable[Sequence[Any]]): ``[price, size, ...]`` levels, any order.
+            asks (Iterable[Sequence[Any]]): ``[price, size, ...]`` levels, any order.
+            timestamp (Optional[int]): Exchange timestamp of the snapshot.
+        """
+        for side, levels in ((self._bids, bids), (self._asks, asks)):
+            parsed = {
+                price: size
+                for price, size in _parse_levels(levels)
+                if size > 0
+            }
+            side.sizes = parsed
+            side.prices = sorted(parsed)
+        self.timestamp = timestamp
+
+    def apply_update(
+        self,
+        bids: Iterable[Sequence[Any]] = (),
+        asks: Iterable[Sequence[Any]] = (),
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """
+        Applies incremental level changes; a size of zero removes the level.
+
+        Args:
+            bids (Iterable[Sequence[Any]]): Changed ``[price, size, ...]`` bid levels.
+            asks (Iterable[Sequence[Any]]): Changed ``[price, size, ...]`` ask levels.
+            timestamp (Optional[int]): Exchange timestamp of the update.
+        """
+        for side, levels in ((self._bids, bids), (self._asks, asks)):
+            for price, size in _parse_levels(levels):
+                side.set(price, size)
+        if timestamp is not None:
+            self.timestamp = timestamp
+
+    def best_bid(self) -> Optional[Level]:
+        """Highest bid as ``(price, size)``, or None if there are no bids."""
+        if not self._bids.prices:
+            return None
+        price = self._bids.prices[-1]
+        return price, self._bids.sizes[price]
+
+    def best_ask(self) -> Optional[Level]:
+        """Lowest ask as ``(price, size)``, or None if there are no asks."""
+        if not self._asks.prices:
+            return None
+        price = self._asks.prices[0]
+        return price, self._asks.sizes[price]
+
+    def spread(self) -> Optional[float]:
+        """Best ask minus best bid, or None if either side is empty."""
+        if not self._bids.prices or not self._asks.prices:
+            return None
+        return self._asks.prices[0] - self._bids.prices[-1]
+
+    def mid(self) -> Optional[float]:
+        """Midpoint of the best bid and ask, or None if either side is empty."""
+        if not self._bids.prices or not self._asks.prices:
+            return None
+        return (self._asks.prices[0] + self._bids.prices[-1]) / 2
+
+    def bids(self, limit: Optional[int] = None) -> List[Level]:
+        """Bid levels from best to worst."""
+        prices = self._bids.prices
+        selected = prices[-limit:] if limit else prices
+        return [(p, self._bids.sizes[p]) for p in reversed(selected)]
+
+    def asks(self, limit: Optional[int] = None) -> List[Level]:
+        """Ask levels from best to worst."""
+        prices = self._asks.prices
+        selected = prices[:limit] if limit else prices
+        return [(p, self._asks.sizes[p]) for p in selected]
+
+    def depth_within(self, pct: float) -> Dict[str, float]:
+        """
+        Total size resting within ``pct`` percent of the mid price.
+
+        Args:
+            pct (float): Distance from mid in percent, e.g. 1.0 for ±1%.
+
+        Returns:
+            Dict[str, float]: ``bids`` and ``asks`` base size and their
+            ``bids_notional`` / ``asks_notional`` quote value. All zero if the
+            book has no mid price.
+        """
+        result = {
+            "bids": 0.0,
+            "asks": 0.0,
+            "bids_notional": 0.0,
+            "asks_notional": 0.0,
+        }
+        mid = self.mid()
+        if mid is None:
+            return result
+
+        low, high = mid * (1 - pct / 100), mid * (1 + pct / 100)
+        bid_prices = self._bids.prices[
+            bisect_left(self._bids.prices, low) :
+        ]
+        ask_prices = self._asks.prices[
+            : bisect_right(self._asks.prices, high)
+        ]
+        for name, side, prices in (
+            ("bids", self._bids, bid_prices),
+            ("asks", self._asks, ask_prices),
+        ):
+            for price in prices:
+                size = side.sizes[price]
+                result[name] += size
+                result[f"{name}_notional"] += price * size
+        return result
+
+    def vwap(self, size: float, side: str = "buy") -> Optional[float]:
+        """
+        Average fill price for a market order of ``size`` base units.
+
+        Args:
+            size (float): Base quantity to fill.
+            side (str): "buy" walks the asks, "sell" walks the bids.
+
+        Returns:
+            Optional[float]: The volume-weighted fill price, or None if the book
+            does not hold enough liquidity to fill ``size``.
+
+        Raises:
+            ValueError: If ``side`` is not "buy" or "sell" or size is not positive.
+        """
+        if side not in ("buy", "sell"):
+            raise ValueError("side must be 'buy' or 'sell'")
+        if size <= 0:
+            raise ValueError("size must be positive")
+
+        book_side = self._asks if side == "buy" else self._bids
+        prices = (
+            book_side.prices
+            if side == "buy"
+            else reversed(book_side.prices)
+        )
+        remaining, cost = size, 0.0
+        for price in prices:
+            filled = min(remaining, book_side.sizes[price])
+            cost += filled * price
+            remaining -= filled
+            if remaining <= 0:
+                return cost / size
+        return None
+
+    def copy(self) -> "OrderBook":
+        """Returns an independent copy of the book."""
+        book = OrderBook(self.symbol)
+        book.timestamp = self.timestamp
+        book._bids = self._bids.copy()
+        book._asks = self._asks.copy()
+        return book
+
+    def to_dict(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Returns the book as plain data.
+
+        Args:
+            limit (Optional[int]): Maximum levels per side.
+
+        Returns:
+            Dict[str, Any]: ``bids`` and ``asks`` as ``(price, size)`` lists from
+            best to worst, and the ``timestamp``.
+        """
+        return {
+            "bids": self.bids(limit),
+            "asks": self.asks(limit),
+            "timestamp": self.timestamp,
+        }
+
+    def __len__(self) -> int:
+        return len(self._bids.prices) + len(self._asks.prices)
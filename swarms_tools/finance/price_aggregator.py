@@ -0,0 +1,256 @@
+"""
+Multi-Venue Best Price Aggregator
+
+Queries Coinbase, OKX, HTX and Jupiter for the same asset concurrently,
+normalizes every venue's quote into one schema and reports the best bid, the
+best ask and the cross-venue spread. Each venue has its own timeout, so one
+slow venue only drops out of the answer instead of delaying it.
+
+Quotes are in each venue's USD leg: USD on Coinbase, USDT on OKX and HTX and
+USDC on Jupiter. Stablecoins are treated as USD when comparing venues.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from swarms_tools.finance.coinbase_tool import fetch_products_data
+from swarms_tools.finance.htx_tool import fetch_htx_market_data
+from swarms_tools.finance.jupiter import get_jupiter_prices
+from swarms_tools.finance.okx_tool import OKXAPI
+from swarms_tools.utils.formatted_string import (
+    format_object_to_string,
+)
+
+# Solana mints and decimals for assets quoted on Jupiter.
+SOLANA_TOKENS: Dict[str, Tuple[str, int]] = {
+    "SOL": ("So11111111111111111111111111111111111111112", 9),
+    "USDC": ("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v", 6),
+    "USDT": ("Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB", 6),
+    "JUP": ("JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN", 6),
+    "BONK": ("DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263", 5),
+    "WIF": ("EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm", 6),
+}
+
+DEFAULT_TIMEOUTS: Dict[str, float] = {
+    "coinbase": 3.0,
+    "okx": 3.0,
+    "htx": 3.0,
+    "jupiter": 5.0,
+}
+
+_executor = ThreadPoolExecutor(
+    max_workers=16, thread_name_prefix="price-aggregator"
+)
+
+
+def _quote(
+    venue: str,
+    pair: str,
+    bid: Optional[float],
+    ask: Optional[float],
+    last: Optional[float],
+) -> Dict[str, Any]:
+    return {
+        "venue": venue,
+        "pair": pair,
+        "bid": bid,
+        "ask": ask,
+        "last": last,
+        "timestamp": int(time.time() * 1000),
+    }
+
+
+def _float(value: Any) -> Optional[float]:
+    return float(value) if value not in (None, "") else None
+
+
+def _coinbase_quote(base: str, timeout: float) -> Dict[str, Any]:
+    pair = f"{base}-USD"
+    data = fetch_products_data([pair], as_float=True, timeout=timeout)[
+        pair
+    ]
+    if "error" in data:
+        raise ValueError(data["error"])
+    price = data["price"]
+    return _quote(
+        "coinbase", pair, price["bid"], price["ask"], price["current"]
+    )
+
+
+def _okx_quote(base: str, timeout: float) -> Dict[str, Any]:
+    pair = f"{base}-USDT"
+    ticker = OKXAPI.snapshot.get([pair], timeout=timeout).get(pair)
+    if ticker is None:
+        raise ValueError(f"No OKX ticker for {pair}")
+    return _quote(
+        "okx",
+        pair,
+        _float(ticker.get("bidPx")),
+        _float(ticker.get("askPx")),
+        _float(ticker.get("last")),
+    )
+
+
+def _htx_quote(base: str, timeout: float) -> Dict[str, Any]:
+    data = fetch_htx_market_data(
+        base, sections=["ticker"], timeout=timeout
+    )
+    if "error" in data:
+        raise ValueError(data["error"])
+    ticker = data["ticker"]
+    return _quote(
+        "htx",
+        f"{base.lower()}usdt",
+        _float(ticker.get("bid")),
+        _float(ticker.get("ask")),
+        _float(ticker.get("current_price")),
+    )
+
+
+def _jupiter_quote(base: str, timeout: float) -> Dict[str, Any]:
+    if base not in SOLANA_TOKENS:
+        raise ValueError(f"No Solana mint known for {base}")
+    base_mint, base_decimals = SOLANA_TOKENS[base]
+    usdc_mint, usdc_decimals = SOLANA_TOKENS["USDC"]
+    sell, buy = (base_mint, usdc_mint), (usdc_mint, base_mint)
+    results = get_jupiter_prices([sell, buy], timeout=timeout)
+    for result in results.values():
+        if not result.get("success"):
+            raise ValueError(result.get("error", "Jupiter quote failed"))
+
+    # Quote prices are in base units; rescale to whole tokens.
+    scale = 10 ** (base_decimals - usdc_decimals)
+    bid = results[sell]["data"]["price"] * scale
+    ask = scale / results[buy]["data"]["price"]
+    return _quote("jupiter", f"{base}/USDC", bid, ask, (bid + ask) / 2)
+
+
+# Fetchers take the base asset and the venue's timeout, which is passed down
+# to the HTTP requests so a hung venue releases its worker thread.
+VENUE_FETCHERS: Dict[str, Callable[[str, float], Dict[str, Any]]] = {
+    "coinbase": _coinbase_quote,
+    "okx": _okx_quote,
+    "htx": _htx_quote,
+    "jupiter": _jupiter_quote,
+}
+
+
+def get_best_price(
+    symbol: str,
+    venues: Optional[List[str]] = None,
+    timeouts: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch quotes for an asset from every venue concurrently and find the best prices.
+
+    Args:
+        symbol (str): Base asset, e.g. "BTC" (a pair such as "BTC-USD" or
+            "SOL/USDC" is reduced to its base asset).
+        venues (Optional[List[str]]): Venues to query, defaults to all of
+            ``VENUE_FETCHERS``.
+        timeouts (Optional[Dict[str, float]]): Per-venue timeouts in seconds,
+            merged over ``DEFAULT_TIMEOUTS``. Each timeout is also passed to
+            the venue's HTTP requests.
+
+    Returns:
+        Dict[str, Any]: ``quotes`` (normalized quote per venue that answered),
+        ``best_bid`` and ``best_ask`` (``{"venue", "price"}`` or None),
+        ``spread`` and ``spread_pct`` (negative when a venue's bid is above
+        another's ask), ``errors`` per venue that failed or timed out, and
+        ``timestamp``.
+
+    Raises:
+        ValueError: If an unknown venue is requested.
+    """
+    base = symbol.replace("/", "-").split("-")[0].upper()
+    venues = list(venues or VENUE_FETCHERS)
+    unknown = set(venues) - set(VENUE_FETCHERS)
+    if unknown:
+        raise ValueError(
+            f"Invalid venues: {sorted(unknown)}. Must be any of {list(VENUE_FETCHERS)}."
+        )
+    timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+
+    start = time.monotonic()
+    futures = {
+        venue: _executor.submit(
+            VENUE_FETCHERS[venue], base, timeouts.get(venue, 5.0)
+        )
+        for venue in venues
+    }
+    quotes: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+    for venue in sorted(venues, key=lambda v: timeouts.get(v, 5.0)):
+        remaining = start + timeouts.get(venue, 5.0) - time.monotonic()
+        try:
+            quotes[venue] = futures[venue].result(
+                timeout=max(remaining, 0)
+            )
+        except FutureTimeoutError:
+            errors[venue] = "timeout"
+        except Exception as e:
+            errors[venue] = str(e)
+    if errors:
+        logger.warning(f"Venues without a {base} quote: {errors}")
+
+    bids = [
+        (quote["bid"], venue)
+        for venue, quote in quotes.items()
+        if quote["bid"]
+    ]
+    asks = [
+        (quote["ask"], venue)
+        for venue, quote in quotes.items()
+        if quote["ask"]
+    ]
+    best_bid = max(bids) if bids else None
+    best_ask = min(asks) if asks else None
+    spread = spread_pct = None
+    if best_bid and best_ask:
+        spread = best_ask[0] - best_bid[0]
+        spread_pct = spread / ((best_ask[0] + best_bid[0]) / 2) * 100
+
+    return {
+        "symbol": base,
+        "quotes": quotes,
+        "best_bid": (
+            {"venue": best_bid[1], "price": best_bid[0]}
+            if best_bid
+            else None
+        ),
+        "best_ask": (
+            {"venue": best_ask[1], "price": best_ask[0]}
+            if best_ask
+            else None
+        ),
+        "spread": spread,
+        "spread_pct": spread_pct,
+        "errors": errors,
+        "timestamp": int(time.time() * 1000),
+    }
+
+
+def best_price_tool(
+    symbol: str, venues: Optional[List[str]] = None
+) -> str:
+    """
+    Compare an asset's price across Coinbase, OKX, HTX and Jupiter.
+
+    Args:
+        symbol (str): Base asset, e.g. "BTC" or "SOL".
+        venues (Optional[List[str]]): Subset of "coinbase", "okx", "htx" and
+            "jupiter" to query.
+
+    Returns:
+        str: Per-venue quotes, the best bid and ask and the cross-venue spread,
+        or the error.
+    """
+    try:
+        return format_object_to_string(get_best_price(symbol, venues))
+    except Exception as e:
+        logger.error(f"Error comparing prices for {symbol}: {e}")
+        return format_object_to_string({"error": str(e)})
@@ -0,0 +1,260 @@
+"""
+Solana Token List Utilities
+
+Streams the Solana token list into a compact mint -> symbol table without
+decoding the whole JSON document, and persists that table in a sorted,
+memory-mappable binary file so several worker processes can share one copy
+through the OS page cache.
+"""
+
+import codecs
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+MAGIC = b"STST"
+VERSION = 1
+_HEADER = struct.Struct("<4sIII")
+_OFFSET = struct.Struct("<I")
+
+
+class _JSONStream:
+    """Incremental reader that decodes one JSON value at a time from byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += self._decoder.decode(chunk)
+                return True
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def peek(self) -> str:
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos].isspace()
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(
+                f"Expected {char!r} at offset {self._pos}, found {self._buffer[self._pos]!r}"
+            )
+        self._pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(
+                    self._buffer, self._pos
+                )
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A value ending exactly at the buffer end may be truncated
+            # (e.g. a number split across chunks).
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_token_symbols(
+    chunks: Iterable[bytes],
+) -> Iterator[Tuple[str, str]]:
+    """
+    Streams ``(address, symbol)`` pairs out of a Solana token list document.
+
+    Only one token object is decoded at a time; other top-level values are
+    decoded and discarded.
+
+    Args:
+        chunks (Iterable[bytes]): Raw document bytes, e.g. ``response.iter_content()``.
+
+    Yields:
+        Tuple[str, str]: Mint address and token symbol.
+
+    Raises:
+        ValueError: If the document is not a token list.
+    """
+    stream = _JSONStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key != "tokens":
+            stream.value()
+        else:
+            stream.expect("[")
+            if stream.peek() != "]":
+                while True:
+                    token = stream.value()
+                    if "address" in token and "symbol" in token:
+                        yield token["address"], token["symbol"]
+                    if stream.peek() == "]":
+                        break
+                    stream.expect(",")
+            stream.expect("]")
+
+        if stream.peek() == "}":
+            return
+        stream.expect(",")
+
+
+def write_token_symbol_table(
+    path: Union[str, os.PathLike], mapping: Dict[str, str]
+) -> None:
+    """
+    Writes a mint -> symbol mapping as a sorted binary table.
+
+    The file is written to a temporary path and atomically renamed, so readers
+    that already mapped the previous version are unaffected.
+
+    Layout: header (magic, version, count, keys blob size), key offsets,
+    value offsets, keys blob, values blob. Offsets are little-endian uint32.
+
+    Args:
+        path (Union[str, os.PathLike]): Destination file.
+        mapping (Dict[str, str]): Mint address -> symbol.
+    """
+    keys = sorted(mapping)
+    key_offsets, value_offsets = [0], [0]
+    key_blob, value_blob = bytearray(), bytearray()
+    for key in keys:
+        key_blob += key.encode("utf-8")
+        value_blob += mapping[key].encode("utf-8")
+        key_offsets.append(len(key_blob))
+        value_offsets.append(len(value_blob))
+
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(keys), len(key_blob)))
+        f.write(struct.pack(f"<{len(key_offsets)}I", *key_offsets))
+        f.write(struct.pack(f"<{len(value_offsets)}I", *value_offsets))
+        f.write(key_blob)
+        f.write(value_blob)
+    os.replace(tmp_path, path)
+
+
+class TokenSymbolTable(Mapping):
+    """
+    Read-only mint -> symbol mapping backed by a memory-mapped binary table.
+
+    Lookups binary-search the sorted keys directly in the mapped file, so the
+    table costs no per-process heap beyond the mapping itself.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """
+        Opens a table written by ``write_token_symbol_table``.
+
+        Args:
+            path (Union[str, os.PathLike]): Path of the table file.
+
+        Raises:
+            ValueError: If the file is not a token symbol table.
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = len(self._mm)
+        if size < _HEADER.size:
+            self._invalid("truncated header")
+        magic, version, count, keys_size = _HEADER.unpack_from(
+            self._mm, 0
+        )
+        if magic != MAGIC or version != VERSION:
+            self._invalid("bad magic or version")
+        self._count = count
+        self._key_offsets = _HEADER.size
+        self._value_offsets = self._key_offsets + (count + 1) * 4
+        self._keys = self._value_offsets + (count + 1) * 4
+        self._values = self._keys + keys_size
+        if size < self._values or (
+            size
+            < self._values + self._offset(self._value_offsets, count)
+        ):
+            self._invalid("truncated table")
+
+    def _invalid(self, reason: str) -> None:
+        self._mm.close()
+        raise ValueError(
+            f"Not a token symbol table ({reason}): {self.path}"
+        )
+
+    def _offset(self, base: int, index: int) -> int:
+        return _OFFSET.unpack_from(self._mm, base + index * 4)[0]
+
+    def _key(self, index: int) -> bytes:
+        start = self._keys + self._offset(self._key_offsets, index)
+        end = self._keys + self._offset(self._key_offsets, index + 1)
+        return self._mm[start:end]
+
+    def _value(self, index: int) -> str:
+        start = self._values + self._offset(self._value_offsets, index)
+        end = self._values + self._offset(
+            self._value_offsets, index + 1
+        )
+        return self._mm[start:end].decode("utf-8")
+
+    def _find(self, key: str) -> int:
+        target = key.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._key(mid) < target:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self._count and self._key(low) == target:
+            return low
+        return -1
+
+    def __getitem__(self, key: str) -> str:
+        index = self._find(key) if isinstance(key, str) else -1
+        if index < 0:
+            raise KeyError(key)
+        return self._value(index)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._key(index).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Unmaps the table file."""
+        self._mm.close()
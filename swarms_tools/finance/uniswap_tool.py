@@ -1,5 +1,15 @@
 import subprocess
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 try:
     from web3 import Web3
@@ -7,34 +17,259 @@ except ImportError:
     subprocess.run(["pip", "install", "web3"])
     from web3 import Web3
 
+import backoff
+import httpx
 from loguru import logger
 import requests
+from requests.adapters import HTTPAdapter
+
+from swarms_tools.utils.pagination import prefetch_pages
 
 RPC_URL = "https://mainnet.infura.io/v3/YOUR_INFURA_PROJECT_ID"
 UNISWAP_SUBGRAPH_URL = (
     "https://api.thegraph.com/subgraphs/name/uniswap/uniswap-v2"
 )
+PAIR_FIELDS = "id reserve0 reserve1 totalSupply volumeToken0 volumeToken1"
+TOKEN_FIELDS = "id symbol name decimals totalSupply"
+LIQUIDITY_POSITION_FIELDS = (
+    "id liquidityTokenBalance "
+    "pair { id token0 { symbol } token1 { symbol } }"
+)
+# The Graph caps ``first`` at 1000 entities per collection query.
+MAX_SUBGRAPH_PAGE_SIZE = 1000
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="uniswap")
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=8),
+            )
+            _session = session
+        return _session
+
+
+def _chunks(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _collection_query(
+    collection: str, fields: str, filter_type: Optional[str] = None
+) -> str:
+    """Build an id-ordered collection query taking ``$first`` and ``$where``."""
+    filter_type = (
+        filter_type or f"{collection[0].upper()}{collection[1:-1]}_filter"
+    )
+    return f"""
+    query ($first: Int!, $where: {filter_type}) {{
+        {collection}(first: $first, orderBy: id, orderDirection: asc, where: $where) {{
+            {fields}
+        }}
+    }}
+    """
 
 
 class UniswapDataFetcher:
-    def __init__(self, rpc_url: str, uniswap_subgraph_url: str):
+    def __init__(
+        self,
+        rpc_url: str,
+        uniswap_subgraph_url: str,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initialize the UniswapDataFetcher.
 
+        The Ethereum node is only connected to on first use of ``web3``; the
+        subgraph methods never need it.
+
         Args:
             rpc_url (str): The RPC URL of the Ethereum node.
             uniswap_subgraph_url (str): The URL of the Uniswap subgraph API.
+            session (Optional[requests.Session]): Session for subgraph
+                requests, defaults to a pooled module-level session.
         """
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.rpc_url = rpc_url
         self.subgraph_url = uniswap_subgraph_url
+        self.session = session or _get_session()
+        self._web3: Optional[Web3] = None
+        self._web3_lock = threading.Lock()
+
+    @property
+    def web3(self) -> Web3:
+        """
+        The connected Web3 client, created on first access.
+
+        Raises:
+            ConnectionError: If the Ethereum node is unreachable.
+        """
+        with self._web3_lock:
+            if self._web3 is None:
+                web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+                is_connected = getattr(
+                    web3, "is_connected", None
+                ) or web3.isConnected
+                if not is_connected():
+                    logger.error("Failed to connect to Ethereum node.")
+                    raise ConnectionError(
+                        "Unable to connect to Ethereum node."
+                    )
+                logger.info("Connected to Ethereum node.")
+                self._web3 = web3
+        return self._web3
+
+    def _post(self, payload: Dict[str, Any]) -> requests.Response:
+        return self.session.post(
+            self.subgraph_url, json=payload, timeout=30
+        )
+
+    def _query(
+        self, query: str, variables: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run a GraphQL query against the subgraph.
+
+        Args:
+            query (str): The GraphQL query.
+            variables (Dict[str, Any]): The query variables.
+
+        Returns:
+            Optional[Dict[str, Any]]: The ``data`` of the response, or None if
+            the request failed.
+        """
+        response = self._post({"query": query, "variables": variables})
+
+        if response.status_code != 200:
+            logger.error("Subgraph request failed: {}", response.text)
+            return None
+
+        data = response.json()
+        if data.get("errors"):
+            logger.error("Subgraph query errors: {}", data["errors"])
+        return data.get("data")
+
+    def fetch_tokens_data(
+        self, token_addresses: List[str], batch_size: int = 500
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch data for many tokens with ``id_in`` queries.
+
+        Args:
+            token_addresses (List[str]): The token addresses.
+            batch_size (int): Addresses per request (at most 1000).
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Token data keyed by lowercase address;
+            tokens not found are omitted.
+        """
+        query = f"""
+        query ($ids: [String!]!, $first: Int!) {{
+            tokens(first: $first, where: {{id_in: $ids}}) {{
+                {TOKEN_FIELDS}
+            }}
+        }}
+        """
+        ids = list(dict.fromkeys(a.lower() for a in token_addresses))
+        logger.info("Fetching token data for {} tokens", len(ids))
+
+        tokens: Dict[str, Dict[str, Any]] = {}
+        for batch in _chunks(ids, batch_size):
+            data = self._query(query, {"ids": batch, "first": len(batch)})
+            for token in (data or {}).get("tokens") or []:
+                tokens[token["id"]] = token
+        return tokens
+
+    def fetch_pools_volume(
+        self, pool_addresses: List[str], batch_size: int = 500
+    ) -> Dict[str, float]:
+        """
+        Fetch the volume of many pools with ``id_in`` queries.
+
+        Args:
+            pool_addresses (List[str]): The pool addresses.
+            batch_size (int): Addresses per request (at most 1000).
+
+        Returns:
+            Dict[str, float]: Volume in USD keyed by lowercase pool address;
+            pools not found are omitted.
+        """
+        query = """
+        query ($ids: [String!]!, $first: Int!) {
+            pairs(first: $first, where: {id_in: $ids}) {
+                id
+                volumeUSD
+            }
+        }
+        """
+        ids = list(dict.fromkeys(a.lower() for a in pool_addresses))
+        logger.info("Fetching pool volume for {} pools", len(ids))
+
+        volumes: Dict[str, float] = {}
+        for batch in _chunks(ids, batch_size):
+            data = self._query(query, {"ids": batch, "first": len(batch)})
+            for pair in (data or {}).get("pairs") or []:
+                if pair.get("volumeUSD"):
+                    volumes[pair["id"]] = float(pair["volumeUSD"])
+        return volumes
+
+    def fetch_pairs_data(
+        self, token_pairs: List[Tuple[str, str]], batch_size: int = 100
+    ) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """
+        Fetch pair data for many token pairs with aliased GraphQL queries.
 
-        if not self.web3.isConnected():
-            logger.error("Failed to connect to Ethereum node.")
-            raise ConnectionError(
-                "Unable to connect to Ethereum node."
+        Each request carries one aliased ``pairs`` selection per token pair, so
+        ``batch_size`` pairs cost a single round trip.
+
+        Args:
+            token_pairs (List[Tuple[str, str]]): (token0, token1) addresses.
+            batch_size (int): Pairs per request.
+
+        Returns:
+            Dict[Tuple[str, str], Optional[Dict[str, Any]]]: Pair data keyed by
+            the given (token0, token1) tuple, None where no pair exists. Pairs
+            whose request or selection failed are omitted.
+        """
+        unique_pairs = list(dict.fromkeys(map(tuple, token_pairs)))
+        logger.info("Fetching pair data for {} pairs", len(unique_pairs))
+
+        pairs: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        for batch in _chunks(unique_pairs, batch_size):
+            params, selections, variables = [], [], {}
+            for i, (token0, token1) in enumerate(batch):
+                params.append(f"$t0_{i}: String!, $t1_{i}: String!")
+                selections.append(
+                    f"p{i}: pairs(first: 1, where: "
+                    f"{{token0: $t0_{i}, token1: $t1_{i}}}) "
+                    f"{{ {PAIR_FIELDS} }}"
+                )
+                variables[f"t0_{i}"] = token0.lower()
+                variables[f"t1_{i}"] = token1.lower()
+            query = (
+                f"query ({', '.join(params)}) "
+                f"{{ {' '.join(selections)} }}"
             )
 
-        logger.info("Connected to Ethereum node.")
+            data = self._query(query, variables)
+            if data is None:
+                logger.warning(
+                    "Skipping {} pairs after a failed subgraph request",
+                    len(batch),
+                )
+                continue
+            for i, pair in enumerate(batch):
+                found = data.get(f"p{i}")
+                if found is None:
+                    continue
+                pairs[pair] = found[0] if found else None
+        return pairs
 
     def fetch_pair_data(
         self, token0: str, token1: str
@@ -73,7 +308,7 @@ class UniswapDataFetcher:
             token0,
             token1,
         )
-        response = requests.post(self.subgraph_url, json=query)
+        response = self._post(query)
 
         if response.status_code != 200:
             logger.error(
@@ -82,7 +317,8 @@ class UniswapDataFetcher:
             return None
 
         data = response.json()
-        return data.get("data", {}).get("pairs", [None])[0]
+        pairs = (data.get("data") or {}).get("pairs") or [None]
+        return pairs[0]
 
     def fetch_token_data(
         self, token_address: str
@@ -114,7 +350,7 @@ class UniswapDataFetcher:
         logger.info(
             "Fetching token data for address: {}", token_address
         )
-        response = requests.post(self.subgraph_url, json=query)
+        response = self._post(query)
 
         if response.status_code != 200:
             logger.error(
@@ -149,7 +385,7 @@ class UniswapDataFetcher:
         logger.info(
             "Fetching pool volume for address: {}", pool_address
         )
-        response = requests.post(self.subgraph_url, json=query)
+        response = self._post(query)
 
         if response.status_code != 200:
             logger.error(
@@ -162,57 +398,192 @@ class UniswapDataFetcher:
         return float(volume) if volume else None
 
     def fetch_liquidity_positions(
-        self, user_address: str
+        self,
+        user_address: str,
+        page_size: int = MAX_SUBGRAPH_PAGE_SIZE,
     ) -> Optional[List[Dict[str, Any]]]:
         """
-        Fetch liquidity positions of a user.
+        Fetch all liquidity positions of a user.
+
+        Positions are paged through with ``id_gt`` cursors over the fetcher's
+        session, so users with more than one page of positions get all of them.
 
         Args:
             user_address (str): The address of the user.
+            page_size (int): Positions per request (at most 1000).
 
         Returns:
-            Optional[List[Dict[str, Any]]]: A list of liquidity positions if available, otherwise None.
+            Optional[List[Dict[str, Any]]]: A list of liquidity positions, or None if the request failed.
         """
-        query = {
-            "query": """
-            query ($address: String!) {
-                user(id: $address) {
-                    liquidityPositions {
-                        id
-                        pair {
-                            id
-                            token0 {
-                                symbol
-                            }
-                            token1 {
-                                symbol
-                            }
-                        }
-                        liquidityTokenBalance
-                    }
-                }
-            }
-            """,
-            "variables": {"address": user_address.lower()},
-        }
-
         logger.info(
             "Fetching liquidity positions for user: {}", user_address
         )
-        response = requests.post(self.subgraph_url, json=query)
-
-        if response.status_code != 200:
-            logger.error(
-                "Failed to fetch liquidity positions: {}",
-                response.text,
-            )
+        query = _collection_query(
+            "liquidityPositions", LIQUIDITY_POSITION_FIELDS
+        )
+        where = {"user": user_address.lower()}
+
+        positions: List[Dict[str, Any]] = []
+        cursor = ""
+        try:
+            while True:
+                data = self._query(
+                    query,
+                    {
+                        "first": page_size,
+                        "where": {**where, "id_gt": cursor},
+                    },
+                )
+                if data is None:
+                    return None
+                items = data.get("liquidityPositions") or []
+                positions.extend(items)
+                if len(items) < page_size:
+                    return positions
+                cursor = items[-1]["id"]
+        except (
+            requests.RequestException,
+            ValueError,
+            KeyError,
+            TypeError,
+        ) as e:
+            logger.error("Failed to fetch liquidity positions: {}", e)
             return None
 
+
+async def iter_subgraph_collection(
+    collection: str,
+    fields: str,
+    where: Optional[Dict[str, Any]] = None,
+    after_id: Optional[str] = None,
+    page_size: int = MAX_SUBGRAPH_PAGE_SIZE,
+    subgraph_url: str = UNISWAP_SUBGRAPH_URL,
+    filter_type: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream every entity of a subgraph collection, paging with ``id_gt`` cursors.
+
+    Entities are ordered by id and each page asks for ids greater than the
+    last one seen, which stays fast at any depth (unlike ``skip``, which The
+    Graph caps at 5000). The next page is prefetched while the caller
+    processes the current one, and only two pages are held in memory.
+
+    Args:
+        collection (str): Collection field, e.g. "pairs" or "liquidityPositions".
+        fields (str): GraphQL selection for each entity; must include ``id``.
+        where (Optional[Dict[str, Any]]): Filter, e.g. ``{"reserveUSD_gt": "1000"}``.
+        after_id (Optional[str]): Resume after this entity id.
+        page_size (int): Entities per request (at most 1000).
+        subgraph_url (str): The URL of the subgraph API.
+        filter_type (Optional[str]): GraphQL type of ``where``, derived from the
+            collection name (e.g. "pairs" -> "Pair_filter") if omitted.
+        client (Optional[httpx.AsyncClient]): Client to reuse; one is created if omitted.
+
+    Yields:
+        Dict[str, Any]: One entity at a time.
+
+    Raises:
+        ValueError: If the subgraph returns errors.
+        httpx.HTTPError: If a request keeps failing after retries.
+    """
+    query = _collection_query(collection, fields, filter_type)
+    owns_client = client is None
+    client = client or httpx.AsyncClient(timeout=30)
+
+    @backoff.on_exception(backoff.expo, httpx.HTTPError, max_tries=3)
+    async def fetch_page(
+        cursor: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        variables = {
+            "first": page_size,
+            "where": {**(where or {}), "id_gt": cursor or ""},
+        }
+        response = await client.post(
+            subgraph_url, json={"query": query, "variables": variables}
+        )
+        response.raise_for_status()
         data = response.json()
-        user_data = data.get("data", {}).get("user")
-        return (
-            user_data.get("liquidityPositions") if user_data else None
+        if data.get("errors"):
+            logger.error("Subgraph query errors: {}", data["errors"])
+            raise ValueError(f"Subgraph error: {data['errors']}")
+
+        items = (data.get("data") or {}).get(collection) or []
+        logger.debug(
+            "Fetched {} {} after {}", len(items), collection, cursor
         )
+        # A short page is the last one; skip the empty request after it.
+        last_page = len(items) < page_size
+        return items, None if last_page else items[-1]["id"]
+
+    try:
+        async for page in prefetch_pages(fetch_page, after_id):
+            for item in page:
+                yield item
+    finally:
+        if owns_client:
+            await client.aclose()
+
+
+def iter_pairs(
+    where: Optional[Dict[str, Any]] = None,
+    fields: str = PAIR_FIELDS,
+    **kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream Uniswap pairs, e.g. for a full scan of all pools.
+
+    Args:
+        where (Optional[Dict[str, Any]]): Pair filter, e.g. ``{"token0": "0x..."}``.
+        fields (str): GraphQL selection for each pair.
+        **kwargs: Passed to ``iter_subgraph_collection``.
+
+    Returns:
+        AsyncIterator[Dict[str, Any]]: The pairs, ordered by id.
+    """
+    return iter_subgraph_collection("pairs", fields, where, **kwargs)
+
+
+def iter_liquidity_positions(
+    user_address: str,
+    fields: str = LIQUIDITY_POSITION_FIELDS,
+    **kwargs: Any,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream the liquidity positions of a user.
+
+    Args:
+        user_address (str): The address of the user.
+        fields (str): GraphQL selection for each position.
+        **kwargs: Passed to ``iter_subgraph_collection``.
+
+    Returns:
+        AsyncIterator[Dict[str, Any]]: The positions, ordered by id.
+    """
+    return iter_subgraph_collection(
+        "liquidityPositions",
+        fields,
+        {"user": user_address.lower()},
+        **kwargs,
+    )
+
+
+_fetcher: Optional[UniswapDataFetcher] = None
+_fetcher_lock = threading.Lock()
+
+
+def get_uniswap_fetcher() -> UniswapDataFetcher:
+    """
+    Return the shared ``UniswapDataFetcher`` for ``RPC_URL`` and ``UNISWAP_SUBGRAPH_URL``.
+
+    Returns:
+        UniswapDataFetcher: The shared fetcher.
+    """
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = UniswapDataFetcher(RPC_URL, UNISWAP_SUBGRAPH_URL)
+        return _fetcher
 
 
 def fetch_token_data(token: str) -> Optional[Dict[str, Any]]:
@@ -226,7 +597,7 @@ def fetch_token_data(token: str) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: Token data if found, otherwise None.
     """
     try:
-        fetcher = UniswapDataFetcher(RPC_URL, UNISWAP_SUBGRAPH_URL)
+        fetcher = get_uniswap_fetcher()
         token_data = fetcher.fetch_token_data(token)
         return token_data
     except Exception as e:
@@ -248,7 +619,7 @@ def fetch_pair_data(
         Optional[Dict[str, Any]]: Pair data if found, otherwise None.
     """
     try:
-        fetcher = UniswapDataFetcher(RPC_URL, UNISWAP_SUBGRAPH_URL)
+        fetcher = get_uniswap_fetcher()
         pair_data = fetcher.fetch_pair_data(token0, token1)
         return pair_data
     except Exception as e:
@@ -267,7 +638,7 @@ def fetch_pool_volume(pool_address: str) -> Optional[float]:
         Optional[float]: The volume of the pool if found, otherwise None.
     """
     try:
-        fetcher = UniswapDataFetcher(RPC_URL, UNISWAP_SUBGRAPH_URL)
+        fetcher = get_uniswap_fetcher()
         pool_volume = fetcher.fetch_pool_volume(pool_address)
         return pool_volume
     except Exception as e:
@@ -288,7 +659,7 @@ def fetch_liquidity_positions(
         Optional[List[Dict[str, Any]]]: A list of liquidity positions if found, otherwise None.
     """
     try:
-        fetcher = UniswapDataFetcher(RPC_URL, UNISWAP_SUBGRAPH_URL)
+        fetcher = get_uniswap_fetcher()
         liquidity_positions = fetcher.fetch_liquidity_positions(
             user_address
         )
@@ -298,6 +669,63 @@ def fetch_liquidity_positions(
         return None
 
 
+def fetch_tokens_data(tokens: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetches data for many tokens from the Uniswap subgraph in batched requests.
+
+    Args:
+        tokens (List[str]): The token addresses.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Token data keyed by lowercase address.
+    """
+    try:
+        fetcher = get_uniswap_fetcher()
+        return fetcher.fetch_tokens_data(tokens)
+    except Exception as e:
+        logger.error("Failed to fetch tokens data: {}", e)
+        return {}
+
+
+def fetch_pairs_data(
+    token_pairs: List[Tuple[str, str]],
+) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+    """
+    Fetches data for many token pairs from the Uniswap subgraph in batched requests.
+
+    Args:
+        token_pairs (List[Tuple[str, str]]): (token0, token1) addresses.
+
+    Returns:
+        Dict[Tuple[str, str], Optional[Dict[str, Any]]]: Pair data keyed by
+        pair, None where no pair exists; pairs that failed to fetch are omitted.
+    """
+    try:
+        fetcher = get_uniswap_fetcher()
+        return fetcher.fetch_pairs_data(token_pairs)
+    except Exception as e:
+        logger.error("Failed to fetch pairs data: {}", e)
+        return {}
+
+
+def fetch_pools_volume(pool_addresses: List[str]) -> Dict[str, float]:
+    """
+    Fetches the volume of many pools from the Uniswap subgraph in batched requests.
+
+    Args:
+        pool_addresses (List[str]): The pool addresses.
+
+    Returns:
+        Dict[str, float]: Volume in USD keyed by lowercase pool address.
+    """
+    try:
+        fetcher = get_uniswap_fetcher()
+        return fetcher.fetch_pools_volume(pool_addresses)
+    except Exception as e:
+        logger.error("Failed to fetch pools volume: {}", e)
+        return {}
+
+
 def fetch_all_uniswap_data(
     token: str, pair: str, pool_address: str
 ) -> str:
@@ -313,9 +741,12 @@ def fetch_all_uniswap_data(
         str: A formatted string containing the token data, pair data, and pool volume.
     """
     try:
-        token_data = fetch_token_data(token)
-        pair_data = fetch_pair_data(pair[0], pair[1])
-        pool_volume = fetch_pool_volume(pool_address)
+        token_future = _executor.submit(fetch_token_data, token)
+        pair_future = _executor.submit(fetch_pair_data, pair[0], pair[1])
+        pool_future = _executor.submit(fetch_pool_volume, pool_address)
+        token_data = token_future.result()
+        pair_data = pair_future.result()
+        pool_volume = pool_future.result()
         formatted_data = f"Token Data: {token_data}\nPair Data: {pair_data}\nPool Volume: {pool_volume}"
         return formatted_data
     except Exception as e:
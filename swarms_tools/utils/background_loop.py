@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """
+    An asyncio event loop running forever in a daemon thread.
+
+    Synchronous tool functions submit coroutines to it instead of calling
+    ``asyncio.run`` per call, so sessions and connection pools created on the
+    loop can be reused across calls.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop, started on first access."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="swarms-tools-event-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(
+        self,
+        coro: Coroutine[Any, Any, T],
+        timeout: Optional[float] = None,
+    ) -> T:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coro (Coroutine): The coroutine to run.
+            timeout (Optional[float]): Seconds to wait before giving up.
+
+        Returns:
+            T: The coroutine's result.
+
+        Raises:
+            RuntimeError: If called from the background loop itself.
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "Cannot block on the background loop from inside it"
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return future.result(timeout)
+
+    def stop(self) -> None:
+        """Stop the loop and wait for its thread to exit."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
+_background_loop = BackgroundEventLoop()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """
+    Return the process-wide background event loop.
+
+    Returns:
+        BackgroundEventLoop: The shared loop.
+    """
+    return _background_loop
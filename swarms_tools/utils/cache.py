@@ -0,0 +1,23 @@
+import os
+from pathlib import Path
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """
+    Returns the on-disk cache directory used by swarms_tools, creating it if needed.
+
+    The root defaults to ``~/.cache/swarms_tools`` and can be overridden with the
+    ``SWARMS_TOOLS_CACHE_DIR`` environment variable.
+
+    Args:
+        *parts (str): Optional sub-directories to append to the cache root.
+
+    Returns:
+        Path: The (existing) cache directory.
+    """
+    root = os.getenv("SWARMS_TOOLS_CACHE_DIR") or os.path.join(
+        Path.home(), ".cache", "swarms_tools"
+    )
+    path = Path(root, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,123 @@
+import difflib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+CoinId = Union[str, int]
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_key(text: str) -> str:
+    """
+    Normalizes a coin name, symbol, slug or address for lookups.
+
+    Lowercases and drops everything but letters and digits, so "Wrapped
+    Bitcoin", "wrapped-bitcoin" and "WRAPPED_BITCOIN" share one key.
+
+    Args:
+        text (str): The identifier to normalize.
+
+    Returns:
+        str: The lookup key.
+    """
+    return _NON_ALNUM.sub("", text.lower())
+
+
+class CoinIndex:
+    """
+    O(1) lookup of provider coin ids by id, name, slug, contract address or symbol.
+
+    Ambiguous keys resolve by precedence (id, name and slug, then contract
+    address, then symbol) and within a kind to the best-ranked coin. Misses can
+    fall back to fuzzy matching against coin names.
+    """
+
+    def __init__(
+        self,
+        keys: Optional[Dict[str, CoinId]] = None,
+        names: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            keys (Optional[Dict[str, CoinId]]): Normalized key -> coin id.
+            names (Optional[List[str]]): Normalized names used for fuzzy matching.
+        """
+        self.keys = keys or {}
+        self.names = names or []
+
+    @classmethod
+    def from_coins(cls, coins: Iterable[Dict[str, Any]]) -> "CoinIndex":
+        """
+        Builds an index from coin entries.
+
+        Args:
+            coins (Iterable[Dict[str, Any]]): Entries with ``id``, ``name`` and
+                ``symbol`` and optionally ``slug``, ``addresses`` (list of contract
+                addresses) and ``rank`` (lower is better, None for unranked).
+
+        Returns:
+            CoinIndex: The index.
+        """
+        ranked = sorted(
+            coins,
+            key=lambda coin: (
+                coin.get("rank") is None,
+                coin.get("rank") or 0,
+            ),
+        )
+        keys: Dict[str, CoinId] = {}
+
+        def add(text: Optional[str], coin_id: CoinId) -> None:
+            key = normalize_key(text) if text else ""
+            if key:
+                keys.setdefault(key, coin_id)
+
+        for coin in ranked:
+            add(str(coin["id"]), coin["id"])
+            add(coin.get("name"), coin["id"])
+            add(coin.get("slug"), coin["id"])
+        names = list(keys)
+        for coin in ranked:
+            for address in coin.get("addresses") or ():
+                add(address, coin["id"])
+        for coin in ranked:
+            add(coin.get("symbol"), coin["id"])
+        return cls(keys, names)
+
+    def get(
+        self, query: str, fuzzy: bool = False, cutoff: float = 0.85
+    ) -> Optional[CoinId]:
+        """
+        Looks up the coin id for an identifier.
+
+        Args:
+            query (str): Id, name, slug, contract address or symbol.
+            fuzzy (bool): Fall back to the closest coin name on a miss. Off
+                by default: a valid id that is missing from an old index
+                would otherwise resolve to a different coin.
+            cutoff (float): Minimum similarity (0-1) for a fuzzy match.
+
+        Returns:
+            Optional[CoinId]: The coin id, or None if nothing matched.
+        """
+        key = normalize_key(query)
+        if key in self.keys:
+            return self.keys[key]
+        if not fuzzy or not key:
+            return None
+        matches = difflib.get_close_matches(
+            key, self.names, n=1, cutoff=cutoff
+        )
+        return self.keys[matches[0]] if matches else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the index as JSON-serializable data."""
+        return {"keys": self.keys, "names": self.names}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CoinIndex":
+        """Restores an index saved with ``to_dict``."""
+        return cls(data["keys"], data["names"])
+
+    def __len__(self) -> int:
+        return len(self.keys)
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+# On-disk and in-memory layout of OHLCV candles, one record per bar.
+OHLCV_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+
+
+def ohlcv_to_frame(candles: np.ndarray) -> pd.DataFrame:
+    """
+    Converts an ``OHLCV_DTYPE`` array into a DataFrame indexed by UTC time.
+
+    Columns follow yfinance naming (Open, High, Low, Close, Volume), so the
+    frame can be passed straight to ``sector_analysis.calculate_rsi(frame["Close"])``.
+    """
+    return pd.DataFrame(
+        {
+            "Open": candles["open"],
+            "High": candles["high"],
+            "Low": candles["low"],
+            "Close": candles["close"],
+            "Volume": candles["volume"],
+        },
+        index=pd.to_datetime(candles["timestamp"], unit="s", utc=True),
+    )
@@ -0,0 +1,52 @@
+import asyncio
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+C = TypeVar("C")
+
+
+async def prefetch_pages(
+    fetch_page: Callable[
+        [Optional[C]], Awaitable[Tuple[List[T], Optional[C]]]
+    ],
+    cursor: Optional[C] = None,
+) -> AsyncIterator[List[T]]:
+    """
+    Iterates over cursor-paginated pages, fetching the next page in the background.
+
+    While the caller processes one page the request for the following page is
+    already in flight, so a full scan costs roughly one round trip per page
+    less than fetching pages on demand.
+
+    Args:
+        fetch_page (Callable): Coroutine function taking a cursor (None for the
+            first page) and returning ``(items, next_cursor)``. Iteration stops
+            when a page is empty or ``next_cursor`` is None.
+        cursor (Optional[C]): Cursor to start (or resume) from.
+
+    Yields:
+        List[T]: One page of items at a time.
+    """
+    task: Optional[asyncio.Task] = asyncio.ensure_future(
+        fetch_page(cursor)
+    )
+    try:
+        while task is not None:
+            items, next_cursor = await task
+            task = None
+            if not items:
+                return
+            if next_cursor is not None:
+                task = asyncio.ensure_future(fetch_page(next_cursor))
+            yield items
+    finally:
+        if task is not None:
+            task.cancel()
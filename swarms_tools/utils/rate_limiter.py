@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+class AsyncRateLimiter:
+    """
+    Sliding-window rate limiter for coroutines sharing one API quota.
+
+    At most ``max_calls`` acquisitions are granted in any ``period`` seconds;
+    callers over the limit sleep until the oldest call leaves the window.
+    """
+
+    def __init__(self, max_calls: int, period: float = 60.0):
+        """
+        Args:
+            max_calls (int): Calls allowed per window.
+            period (float): Window length in seconds.
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed and record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                await asyncio.sleep(
+                    self.period - (now - self._calls[0])
+                )
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class RateLimiter:
+    """
+    Thread-safe sliding-window rate limiter for worker threads sharing one quota.
+
+    The synchronous counterpart of ``AsyncRateLimiter``: at most ``max_calls``
+    acquisitions are granted in any ``period`` seconds.
+    """
+
+    def __init__(self, max_calls: int, period: float = 60.0):
+        """
+        Args:
+            max_calls (int): Calls allowed per window.
+            period (float): Window length in seconds.
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed and record it."""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                time.sleep(self.period - (now - self._calls[0]))
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
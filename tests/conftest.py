@@ -0,0 +1,81 @@
+import json
+
+import pytest
+import requests
+
+
+class FakeResponse:
+    """Minimal ``requests.Response`` stand-in.
+
+    A ``payload`` that is an exception is raised from ``json()``, like a body
+    that is not valid JSON.
+    """
+
+    def __init__(self, payload, status_code=200, headers=None):
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = (
+            str(payload)
+            if isinstance(payload, Exception)
+            else json.dumps(payload)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        body = self.text.encode()
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(
+                f"{self.status_code} Error", response=self
+            )
+
+    def json(self):
+        if isinstance(self.payload, Exception):
+            raise self.payload
+        return self.payload
+
+
+class FakeSession:
+    """``requests.Session`` stand-in that records calls and asks a handler for responses.
+
+    ``handler(method, url, **kwargs)`` returns a payload, a
+    ``(payload, status_code[, headers])`` tuple or a ``FakeResponse``, or
+    raises.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        result = self.handler(method, url, **kwargs)
+        if isinstance(result, FakeResponse):
+            return result
+        if isinstance(result, tuple):
+            return FakeResponse(*result)
+        return FakeResponse(result)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+@pytest.fixture
+def fake_session():
+    """Factory for ``FakeSession`` objects: ``fake_session(handler)``."""
+    return FakeSession
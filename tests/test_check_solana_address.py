@@ -0,0 +1,176 @@
+import threading
+
+import pytest
+
+from swarms_tools.finance import check_solana_address
+from swarms_tools.finance.check_solana_address import (
+    aggregate_wallet_balances,
+    load_token_mapping,
+)
+
+
+def make_balances(wallet, sol, tokens):
+    return {
+        "wallet": wallet,
+        "sol": sol,
+        "tokens": [
+            {"mint": mint, "symbol": symbol, "amount": amount}
+            for mint, symbol, amount in tokens
+        ],
+    }
+
+
+def test_aggregate_wallet_balances():
+    balances = {
+        "w1": make_balances(
+            "w1", 1.5, [("usdc", "USDC", 100.0), ("bonk", "BONK", 5.0)]
+        ),
+        "w2": make_balances("w2", 3.0, [("usdc", "USDC", 250.0)]),
+        "w3": {"wallet": "w3", "error": "timeout"},
+    }
+
+    result = aggregate_wallet_balances(balances, top_n=1)
+
+    assert result["total_sol"] == 4.5
+    assert result["top_sol_holders"] == [{"wallet": "w2", "amount": 3.0}]
+    assert result["holdings"][0] == {
+        "mint": "usdc",
+        "symbol": "USDC",
+        "total": 350.0,
+        "holders": 2,
+    }
+    assert result["top_holders"]["usdc"] == [
+        {"wallet": "w2", "amount": 250.0}
+    ]
+    assert result["failed"] == ["w3"]
+
+
+def test_aggregate_wallet_balances_empty():
+    result = aggregate_wallet_balances([])
+    assert result["total_sol"] == 0.0
+    assert result["holdings"] == []
+    assert result["top_holders"] == {}
+
+
+TOKEN_LIST = {
+    "name": "Solana Token List",
+    "tokens": [
+        {"address": "mint1", "symbol": "ONE"},
+        {"address": "mint2", "symbol": "TWO"},
+    ],
+}
+
+
+@pytest.fixture
+def token_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("SWARMS_TOOLS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(check_solana_address, "_token_mapping", None)
+    monkeypatch.setattr(
+        check_solana_address, "_token_mapping_retry_at", None
+    )
+
+
+def test_load_token_mapping_revalidates_with_etag(
+    token_cache, fake_session
+):
+    last_modified = "Mon, 19 Oct 2026 00:00:00 GMT"
+
+    def handler(method, url, headers=None, **kwargs):
+        if headers.get("If-None-Match") == '"v1"':
+            return None, 304
+        return TOKEN_LIST, 200, {
+            "ETag": '"v1"',
+            "Last-Modified": last_modified,
+        }
+
+    session = fake_session(handler)
+
+    mapping = load_token_mapping(session=session)
+    assert dict(mapping) == {"mint1": "ONE", "mint2": "TWO"}
+    assert session.calls[0][2]["headers"] == {}
+
+    mapping = load_token_mapping(session=session, force_refresh=True)
+    assert session.calls[1][2]["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": last_modified,
+    }
+    assert mapping["mint2"] == "TWO"
+
+
+def test_load_token_mapping_backs_off_after_failed_download(
+    token_cache, fake_session, monkeypatch
+):
+    now = [1000.0]
+    monkeypatch.setattr(
+        check_solana_address.time, "monotonic", lambda: now[0]
+    )
+    responses = [({"message": "down"}, 503), TOKEN_LIST]
+    session = fake_session(lambda method, url, **kwargs: responses[0])
+
+    assert dict(load_token_mapping(session=session, retry_after=60)) == {}
+    assert dict(load_token_mapping(session=session, retry_after=60)) == {}
+    assert len(session.calls) == 1
+
+    responses.pop(0)
+    now[0] += 61
+    mapping = load_token_mapping(session=session, retry_after=60)
+    assert len(session.calls) == 2
+    assert mapping["mint1"] == "ONE"
+    assert load_token_mapping(session=session) is mapping
+
+
+def test_force_refresh_keeps_the_replaced_table_readable(
+    token_cache, fake_session
+):
+    session = fake_session(lambda method, url, **kwargs: TOKEN_LIST)
+    first = load_token_mapping(session=session)
+    reading = iter(first.items())
+    assert next(reading) == ("mint1", "ONE")
+
+    swap = threading.Thread(
+        target=load_token_mapping,
+        kwargs={"session": session, "force_refresh": True},
+    )
+    swap.start()
+    swap.join()
+
+    assert list(reading) == [("mint2", "TWO")]
+    second = load_token_mapping(session=session)
+    assert second is not first
+    assert second["mint1"] == "ONE"
+
+
+def test_parse_balances_loads_the_mapping_once(monkeypatch):
+    loads = []
+
+    def load(session=None, **kwargs):
+        loads.append(session)
+        return {"mint1": "ONE"}
+
+    monkeypatch.setattr(check_solana_address, "load_token_mapping", load)
+    checker = check_solana_address.SolanaWalletBalanceChecker(
+        api_key="key"
+    )
+    loads.clear()
+
+    result = checker.parse_balances(
+        "w1",
+        {
+            "nativeBalance": 2_000_000_000,
+            "tokens": [
+                {"mint": "mint1", "amount": 1_500, "decimals": 3},
+                {"mint": "mint2", "amount": 7, "decimals": None},
+                {"mint": "mint3", "amount": None, "decimals": 6},
+            ],
+        },
+    )
+
+    assert len(loads) == 1
+    assert result["sol"] == 2.0
+    assert [
+        (t["symbol"], t["amount"], t["decimals"]) for t in result["tokens"]
+    ] == [
+        ("ONE", 1.5, 3),
+        ("Unknown Token", 7.0, 0),
+        ("Unknown Token", 0.0, 6),
+    ]
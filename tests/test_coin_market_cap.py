@@ -0,0 +1,84 @@
+from swarms_tools.finance import coin_market_cap
+from swarms_tools.finance.coin_market_cap import CoinMarketCapAPI
+
+COIN_MAP = [
+    {"id": 1, "name": "Bitcoin", "symbol": "BTC", "slug": "bitcoin", "rank": 1},
+    {"id": 1027, "name": "Ethereum", "symbol": "ETH", "slug": "ethereum", "rank": 2},
+    {"id": 9999, "name": "Fake Bitcoin", "symbol": "BTC", "slug": "fake-btc", "rank": 900},
+]
+
+
+def cmc_handler(method, url, params=None, **kwargs):
+    path = url.split("/v1", 1)[1]
+    if path == "/cryptocurrency/map":
+        data = COIN_MAP
+    else:
+        names = {str(coin["id"]): coin["name"] for coin in COIN_MAP}
+        data = {
+            i: {"id": int(i), "name": names[i]}
+            for i in params["id"].split(",")
+        }
+    return {"status": {"error_code": 0}, "data": data}
+
+
+def requested(session):
+    return [
+        (url.split("/v1", 1)[1], kwargs.get("params"))
+        for _, url, kwargs in session.calls
+    ]
+
+
+def test_fetch_coin_data_resolves_names_and_symbols(
+    monkeypatch, tmp_path, fake_session
+):
+    monkeypatch.setenv("SWARMS_TOOLS_CACHE_DIR", str(tmp_path))
+    session = fake_session(cmc_handler)
+    monkeypatch.setattr(coin_market_cap, "_session", session)
+    monkeypatch.setattr(coin_market_cap, "_coin_map", None)
+    monkeypatch.setattr(coin_market_cap, "_coin_index", None)
+
+    data = CoinMarketCapAPI.fetch_coin_data(["btc", "Ethereum", "nope"])
+
+    assert sorted(data) == ["Ethereum", "btc"]
+    assert data["btc"]["id"] == 1
+    assert requested(session)[-1] == (
+        "/cryptocurrency/quotes/latest",
+        {"id": "1,1027"},
+    )
+    assert (tmp_path / "coinmarketcap" / "map.json").exists()
+
+    # The map is cached: a second lookup costs a single quotes request.
+    CoinMarketCapAPI.fetch_coin_data(["fake-btc"])
+    assert len(session.calls) == 3
+    assert requested(session)[-1][1] == {"id": "9999"}
+
+
+def test_fetch_coin_data_keeps_coins_with_the_same_name(
+    monkeypatch, tmp_path, fake_session
+):
+    monkeypatch.setenv("SWARMS_TOOLS_CACHE_DIR", str(tmp_path))
+    coin_map = COIN_MAP + [
+        {"id": 4242, "name": "Ethereum", "symbol": "ETHW", "slug": "ethw", "rank": 50},
+    ]
+
+    def handler(method, url, params=None, **kwargs):
+        if url.endswith("/cryptocurrency/map"):
+            return {"status": {"error_code": 0}, "data": coin_map}
+        return {
+            "status": {"error_code": 0},
+            "data": {
+                i: {"id": int(i), "name": "Ethereum"}
+                for i in params["id"].split(",")
+            },
+        }
+
+    monkeypatch.setattr(coin_market_cap, "_session", fake_session(handler))
+    monkeypatch.setattr(coin_market_cap, "_coin_map", None)
+    monkeypatch.setattr(coin_market_cap, "_coin_index", None)
+
+    data = CoinMarketCapAPI.fetch_coin_data(["eth", "ethw"])
+
+    assert {coin: quote["id"] for coin, quote in data.items()} == {
+        "eth": 1027,
+        "ethw": 4242,
+    }
@@ -0,0 +1,126 @@
+import os
+
+import pytest
+
+from swarms_tools.finance import coin_resolver
+from swarms_tools.finance.coin_resolver import (
+    CoinResolver,
+    get_coin_resolver,
+)
+from swarms_tools.utils.coin_index import CoinIndex
+
+
+def test_coin_index_precedence_and_opt_in_fuzzy_match():
+    index = CoinIndex.from_coins(
+        [
+            {"id": "batcat", "name": "BatCat", "symbol": "btc", "rank": None},
+            {"id": "bitcoin", "name": "Bitcoin", "symbol": "btc", "rank": 1},
+            {
+                "id": "usd-coin",
+                "name": "USD Coin",
+                "symbol": "usdc",
+                "addresses": ["0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"],
+                "rank": 6,
+            },
+            # A symbol must not shadow another coin's name.
+            {"id": "bitcoin-token", "name": "BTC Token", "symbol": "bitcoin"},
+        ]
+    )
+
+    assert index.get("BTC") == "bitcoin"
+    assert index.get("Bitcoin") == "bitcoin"
+    assert index.get("usd-coin") == "usd-coin"
+    assert index.get("USD Coin") == "usd-coin"
+    assert (
+        index.get("0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48")
+        == "usd-coin"
+    )
+    assert index.get("Bitcoinn") is None
+    assert index.get("Bitcoinn", fuzzy=True) == "bitcoin"
+    assert index.get("nothing like it", fuzzy=True) is None
+
+
+def test_coin_resolver_round_trips_to_disk(tmp_path):
+    resolver = CoinResolver(
+        {
+            "coinmarketcap": CoinIndex.from_coins(
+                [{"id": 1, "name": "Bitcoin", "symbol": "BTC", "rank": 1}]
+            )
+        }
+    )
+    path = tmp_path / "coin_index.json"
+    resolver.save(path)
+
+    loaded = CoinResolver.load(path)
+    assert loaded.resolve("btc", "coinmarketcap") == 1
+    assert loaded.resolve("btc", "coingecko") is None
+
+
+def btc_resolver():
+    return CoinResolver(
+        {
+            "coingecko": CoinIndex.from_coins(
+                [{"id": "bitcoin", "name": "Bitcoin", "symbol": "btc"}]
+            )
+        }
+    )
+
+
+@pytest.fixture
+def resolver_state(monkeypatch, tmp_path):
+    monkeypatch.setenv("SWARMS_TOOLS_CACHE_DIR", str(tmp_path))
+    for name in (
+        "_resolver",
+        "_resolver_refreshed_at",
+        "_resolver_attempted_at",
+    ):
+        monkeypatch.setattr(coin_resolver, name, None)
+    builds = []
+
+    def build(results):
+        def fake_build(cls):
+            builds.append(1)
+            return results.pop(0)
+
+        monkeypatch.setattr(
+            CoinResolver, "build", classmethod(fake_build)
+        )
+
+    return tmp_path / "resolver" / "coin_index.json", builds, build
+
+
+def test_failed_build_falls_back_to_stale_index_and_cools_down(
+    resolver_state,
+):
+    path, builds, build = resolver_state
+    path.parent.mkdir(parents=True)
+    btc_resolver().save(path)
+    os.utime(path, (0, 0))
+    build([CoinResolver(), CoinResolver(), btc_resolver()])
+
+    assert coin_resolver.resolve_coin_id("btc") == "bitcoin"
+    assert coin_resolver.resolve_coin_id("btc") == "bitcoin"
+    assert len(builds) == 1
+
+    get_coin_resolver(retry_after=0)
+    assert len(builds) == 2
+    assert get_coin_resolver(retry_after=0).resolve("btc") == "bitcoin"
+    assert len(builds) == 3
+    assert get_coin_resolver(retry_after=0) is get_coin_resolver()
+    assert len(builds) == 3
+
+
+def test_built_resolver_is_reused_when_it_cannot_be_saved(
+    resolver_state, monkeypatch
+):
+    _, builds, build = resolver_state
+    build([btc_resolver()])
+
+    def fail(self, path):
+        raise OSError("read-only cache")
+
+    monkeypatch.setattr(CoinResolver, "save", fail)
+
+    assert get_coin_resolver().resolve("btc") == "bitcoin"
+    assert get_coin_resolver().resolve("btc") == "bitcoin"
+    assert len(builds) == 1
@@ -0,0 +1,166 @@
+import base64
+import json
+import time
+
+import pytest
+import requests
+
+from swarms_tools.finance import coinbase_tool
+from swarms_tools.finance.coinbase_tool import (
+    CoinbaseOrderManager,
+    fetch_products_data,
+)
+
+
+def products_handler(method, url, **kwargs):
+    product, endpoint = url.split("/products/")[1].split("/")
+    if product == "NOPE-USD":
+        return {}, 404
+    if product == "BAD-USD":
+        return {"price": "abc"}
+    if product == "HTML-USD":
+        return requests.exceptions.JSONDecodeError("Expecting value", "", 0)
+    if endpoint == "ticker":
+        return {"price": "100.5", "bid": "100", "ask": "101", "volume": "2"}
+    return {"volume": "50", "high": "110", "low": "90", "open": "95"}
+
+
+def test_fetch_products_data_float_fast_path(monkeypatch, fake_session):
+    monkeypatch.setattr(
+        coinbase_tool, "_session", fake_session(products_handler)
+    )
+
+    data = fetch_products_data(
+        ["BTC-USD", "ETH-USD", "NOPE-USD", "BTCUSD", "BAD-USD", "HTML-USD"],
+        as_float=True,
+    )
+
+    assert data["BTC-USD"]["price"] == {
+        "current": 100.5,
+        "bid": 100.0,
+        "ask": 101.0,
+    }
+    assert data["ETH-USD"]["market_data"]["24h_open"] == 95.0
+    assert "raw_data" not in data["BTC-USD"]
+    assert "404" in data["NOPE-USD"]["error"]
+    assert "Invalid symbol format" in data["BTCUSD"]["error"]
+    assert "Invalid data" in data["BAD-USD"]["error"]
+    assert "Invalid data" in data["HTML-USD"]["error"]
+    # Decimal parsing fails per product too.
+    bad = fetch_products_data(["BAD-USD", "BTC-USD"])
+    assert "Invalid data" in bad["BAD-USD"]["error"]
+    assert bad["BTC-USD"]["price"]["bid"] == 100
+
+
+class FlakyExchange:
+    """Drops the response to the first order, like a timeout.
+
+    With ``keep_first=False`` the first order is lost as well, and the first
+    ``lookup_failures`` client_oid lookups time out.
+    """
+
+    def __init__(self, keep_first=True, lookup_failures=0, status="done"):
+        self.orders = {}
+        self.posts = 0
+        self.keep_first = keep_first
+        self.lookup_failures = lookup_failures
+        self.status = status
+
+    def __call__(self, method, url, headers=None, data=None, timeout=None):
+        assert headers["CB-ACCESS-SIGN"]
+        path = url.split("stub", 1)[1]
+        if method == "POST":
+            self.posts += 1
+            if self.posts == 1 and not self.keep_first:
+                raise requests.Timeout("read timed out")
+            order = json.loads(data)
+            order_id = f"order-{len(self.orders)}"
+            self.orders[order_id] = {
+                **order,
+                "id": order_id,
+                "status": self.status,
+            }
+            if self.posts == 1:
+                raise requests.ConnectionError("connection reset")
+            return self.orders[order_id]
+        if path.startswith("/orders/client:"):
+            if self.lookup_failures:
+                self.lookup_failures -= 1
+                raise requests.Timeout("lookup timed out")
+            oid = path.split(":", 1)[1]
+            for order in self.orders.values():
+                if order["client_oid"] == oid:
+                    return order
+            return {"message": "NotFound"}, 404
+        order_id = path.rsplit("/", 1)[1]
+        return self.orders.get(order_id, ({"message": "NotFound"}, 404))
+
+
+def make_manager(exchange, fake_session):
+    return CoinbaseOrderManager(
+        api_key="key",
+        api_secret=base64.b64encode(b"secret").decode(),
+        passphrase="pass",
+        base_url="http://stub",
+        session=fake_session(exchange),
+        retry_delay=0,
+    )
+
+
+def test_order_manager_retries_idempotently_and_polls(fake_session):
+    exchange = FlakyExchange()
+    manager = make_manager(exchange, fake_session)
+
+    order = manager.place_market_buy("BTC-USD", 10)
+    assert order["id"] == "order-0"
+    assert order["funds"] == "10"
+    # The lost order was found by client_oid instead of being re-submitted.
+    assert exchange.posts == 1
+    assert len(exchange.orders) == 1
+
+    second = manager.place_market_sell("ETH-USD", "0.5")
+    statuses = manager.wait_for_orders([order["id"], second["id"]])
+    assert {o["status"] for o in statuses.values()} == {"done"}
+    assert order["client_oid"] != second["client_oid"]
+
+
+def test_order_manager_resubmits_only_after_definitive_lookup(
+    fake_session,
+):
+    # The first lookup times out; the second says the order does not exist.
+    exchange = FlakyExchange(keep_first=False, lookup_failures=1)
+    order = make_manager(exchange, fake_session).place_market_buy(
+        "BTC-USD", 10
+    )
+    assert exchange.posts == 2
+    assert list(exchange.orders) == [order["id"]]
+
+    # If the order's state cannot be determined, the original error is raised.
+    exchange = FlakyExchange(keep_first=False, lookup_failures=10)
+    with pytest.raises(requests.Timeout, match="read timed out"):
+        make_manager(exchange, fake_session).place_market_buy(
+            "BTC-USD", 10
+        )
+    assert exchange.posts == 1
+
+
+def test_wait_for_orders_stops_on_rejected_and_failed_lookups(
+    fake_session,
+):
+    exchange = FlakyExchange(status="rejected")
+    manager = make_manager(exchange, fake_session)
+    order = manager.place_market_buy("BTC-USD", 10)
+
+    start = time.monotonic()
+    statuses = manager.wait_for_orders(
+        [order["id"], "missing"], interval=0.01, timeout=5
+    )
+    assert time.monotonic() - start < 1
+    assert statuses[order["id"]]["status"] == "rejected"
+    assert "error" in statuses["missing"]
+
+
+def test_order_manager_requires_credentials(monkeypatch):
+    monkeypatch.delenv("COINBASE_API_SECRET", raising=False)
+    with pytest.raises(ValueError, match="COINBASE_API_SECRET"):
+        CoinbaseOrderManager(api_key="key", passphrase="pass")
@@ -0,0 +1,48 @@
+from swarms_tools.finance import coin_resolver, coingecko_tool
+from swarms_tools.finance.coin_resolver import CoinResolver
+from swarms_tools.finance.coingecko_tool import CoinGeckoAPI
+from swarms_tools.utils.coin_index import CoinIndex
+
+
+def markets_handler(method, url, params=None, **kwargs):
+    return [
+        {"id": coin_id, "name": coin_id.title(), "current_price": 1.0}
+        for coin_id in params["ids"].split(",")
+        if coin_id != "unknown"
+    ]
+
+
+def test_fetch_markets_batches_ids_and_keeps_schema(
+    monkeypatch, fake_session
+):
+    session = fake_session(markets_handler)
+    monkeypatch.setattr(coingecko_tool, "_session", session)
+    coin_ids = [f"coin-{i}" for i in range(300)] + ["unknown"]
+
+    markets = CoinGeckoAPI.fetch_markets(coin_ids)
+
+    assert len(session.calls) == 2
+    assert len(session.calls[0][2]["params"]["ids"].split(",")) == 250
+    assert len(markets) == 300
+    coin = markets["coin-0"]
+    assert coin["current_price"] == 1.0
+    assert coin["market_cap"] == "N/A"
+    assert coin.keys() == CoinGeckoAPI._format_coin_data({}).keys()
+
+
+def test_unknown_ids_pass_through_without_fuzzy_match(monkeypatch):
+    index = CoinIndex.from_coins(
+        [{"id": "bitcoin", "name": "Bitcoin", "symbol": "btc", "rank": 1}]
+    )
+    resolver = CoinResolver({"coingecko": index})
+    monkeypatch.setattr(
+        coin_resolver, "get_coin_resolver", lambda: resolver
+    )
+
+    assert coingecko_tool._resolve_coingecko_id("BTC") == "bitcoin"
+    # A new id close to a known name is not swapped for the known coin.
+    assert coingecko_tool._resolve_coingecko_id("bitcoins") == "bitcoins"
+    assert (
+        coingecko_tool._resolve_coingecko_id("bitcoins", fuzzy=True)
+        == "bitcoin"
+    )
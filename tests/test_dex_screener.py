@@ -0,0 +1,120 @@
+import time
+
+from swarms_tools.finance.dex_screener import (
+    Liquidity,
+    TokenInfo,
+    TokenPairInfo,
+    TokenUniverse,
+)
+
+
+def make_pair(
+    address: str,
+    chain_id: str = "solana",
+    dex_id: str = "raydium",
+    base: str = "BASE",
+    liquidity: float = 1000.0,
+    market_cap: float = 10000.0,
+    created_at: int = None,
+) -> TokenPairInfo:
+    return TokenPairInfo(
+        chain_id=chain_id,
+        dex_id=dex_id,
+        url=f"https://dexscreener.com/{chain_id}/{address}",
+        pair_address=address,
+        labels=None,
+        base_token=TokenInfo(address=base, name=base, symbol=base),
+        quote_token=TokenInfo(address="USDC", name="USDC", symbol="USDC"),
+        price_native="1",
+        price_usd="1.5",
+        liquidity=Liquidity(usd=liquidity, base=0.0, quote=0.0),
+        fdv=market_cap,
+        market_cap=market_cap,
+        pair_created_at=created_at or int(time.time() * 1000),
+    )
+
+
+def test_token_universe_indexes_and_ranges():
+    universe = TokenUniverse()
+    universe.upsert(
+        [
+            make_pair("p1", liquidity=100, market_cap=1_000),
+            make_pair("p2", liquidity=5_000, market_cap=50_000),
+            make_pair(
+                "p3",
+                chain_id="ethereum",
+                dex_id="uniswap",
+                liquidity=20_000,
+                market_cap=900_000,
+            ),
+        ]
+    )
+
+    assert len(universe) == 3
+    assert {p.pair_address for p in universe.by_chain("solana")} == {
+        "p1",
+        "p2",
+    }
+    assert [p.pair_address for p in universe.by_dex("uniswap")] == [
+        "p3"
+    ]
+    assert [
+        p.pair_address
+        for p in universe.range("liquidity_usd", 100, 5_000)
+    ] == ["p1", "p2"]
+    assert [
+        p.pair_address for p in universe.top_k("market_cap", k=2)
+    ] == ["p3", "p2"]
+
+
+def test_token_universe_upsert_replaces_index_entries():
+    universe = TokenUniverse()
+    universe.upsert([make_pair("p1", liquidity=100)])
+    universe.upsert([make_pair("p1", liquidity=9_000)])
+
+    assert len(universe) == 1
+    assert universe.range("liquidity_usd", max_value=1_000) == []
+    assert len(universe.range("liquidity_usd", min_value=1_000)) == 1
+
+    assert universe.remove("solana", "p1")
+    assert universe.top_k("liquidity_usd") == []
+
+
+def test_token_universe_screen():
+    old = int((time.time() - 7 * 86400) * 1000)
+    universe = TokenUniverse()
+    universe.upsert(
+        [
+            make_pair("p1", liquidity=60_000, created_at=old),
+            make_pair("p2", liquidity=80_000),
+            make_pair("p3", liquidity=70_000),
+            make_pair("p4", liquidity=10_000),
+            make_pair("p5", chain_id="base", liquidity=90_000),
+        ]
+    )
+
+    result = universe.screen(
+        chain_id="solana",
+        ranges={"liquidity_usd": (50_000, None)},
+        created_within_seconds=86400,
+        sort_by="liquidity_usd",
+    )
+    assert [p.pair_address for p in result] == ["p2", "p3"]
+
+
+def test_token_universe_screen_keeps_pairs_missing_sort_field():
+    universe = TokenUniverse()
+    unpriced = make_pair("p2", liquidity=500)
+    unpriced.market_cap = None
+    universe.upsert(
+        [
+            make_pair("p1", liquidity=100, market_cap=1_000),
+            unpriced,
+            make_pair("p3", liquidity=300, market_cap=5_000),
+        ]
+    )
+
+    result = universe.screen(sort_by="market_cap")
+    assert [p.pair_address for p in result] == ["p3", "p1", "p2"]
+    result = universe.screen(sort_by="market_cap", ascending=True, limit=2)
+    assert [p.pair_address for p in result] == ["p1", "p3"]
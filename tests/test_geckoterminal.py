@@ -0,0 +1,119 @@
+import asyncio
+
+import httpx
+
+from swarms_tools.finance import geckoterminal
+from swarms_tools.finance.geckoterminal import fetch_tokens_data
+from swarms_tools.utils.ohlcv import OHLCV_DTYPE
+
+
+def test_fetch_tokens_data_batches_and_maps_back(monkeypatch):
+    monkeypatch.setattr(geckoterminal, "MAX_ADDRESSES_PER_REQUEST", 2)
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        addresses = request.url.path.rsplit("/", 1)[-1].split(",")
+        requested.append(addresses)
+        return httpx.Response(
+            200,
+            json={
+                "data": [
+                    {
+                        "attributes": {
+                            "address": address.lower(),
+                            "symbol": address.upper(),
+                            "price_usd": "1.0",
+                        }
+                    }
+                    for address in addresses
+                    if address != "0xmissing"
+                ]
+            },
+        )
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            return await fetch_tokens_data(
+                ["0xAaa", "0xbbb", "0xmissing", "0xAaa"],
+                network="eth",
+                client=client,
+            )
+
+    result = asyncio.run(run())
+
+    assert sorted(map(len, requested)) == [1, 2]
+    assert list(result) == ["0xAaa", "0xbbb", "0xmissing"]
+    assert result["0xAaa"]["symbol"] == "0XAAA"
+    assert result["0xAaa"]["contract_address"] == "0xAaa"
+    assert result["0xmissing"] == {"error": "Token not found"}
+
+
+def test_fetch_pool_ohlcv_only_requests_new_bars(monkeypatch, tmp_path):
+    monkeypatch.setenv("SWARMS_TOOLS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(geckoterminal, "MAX_OHLCV_PER_REQUEST", 3)
+    day = 86400
+    bars = [[i * day, 1.0, 2.0, 0.5, 1.0 + i, 10.0] for i in range(5)]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        requests.append(dict(params))
+        before = int(params.get("before_timestamp", 10**12))
+        page = [bar for bar in reversed(bars) if bar[0] < before]
+        page = page[: int(params["limit"])]
+        return httpx.Response(
+            200, json={"data": {"attributes": {"ohlcv_list": page}}}
+        )
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            return await geckoterminal.fetch_pool_ohlcv(
+                "0xpool", network="eth", client=client
+            )
+
+    frame = asyncio.run(run())
+    assert list(frame["Close"]) == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert len(requests) == 2
+
+    # The last bar updates and a new bar appears.
+    bars[-1][4] = 9.0
+    bars.append([5 * day, 1.0, 2.0, 0.5, 6.0, 10.0])
+    requests.clear()
+
+    frame = asyncio.run(run())
+    assert len(requests) == 1
+    assert list(frame["Close"]) == [1.0, 2.0, 3.0, 4.0, 9.0, 6.0]
+    assert frame.index.is_monotonic_increasing
+
+    # The re-fetched bar replaced its cached copy instead of being appended.
+    (path,) = (tmp_path / "geckoterminal" / "ohlcv").iterdir()
+    assert path.stat().st_size == 6 * OHLCV_DTYPE.itemsize
+
+
+def test_fetch_tokens_data_shares_one_limiter_per_loop(monkeypatch):
+    limiters = set()
+
+    class RecordingLimiter(geckoterminal.AsyncRateLimiter):
+        async def acquire(self):
+            limiters.add(id(self))
+
+    monkeypatch.setattr(
+        geckoterminal, "AsyncRateLimiter", RecordingLimiter
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": []})
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            for address in ("0xa", "0xb"):
+                await fetch_tokens_data([address], client=client)
+        return geckoterminal.get_rate_limiter()
+
+    first = asyncio.run(run())
+    assert len(limiters) == 1
+    assert asyncio.run(run()) is not first
+    assert len(limiters) == 2
@@ -0,0 +1,110 @@
+import asyncio
+
+import httpx
+
+from swarms_tools.finance.helius_api import (
+    HeliusAPI,
+    iter_address_transactions,
+)
+
+SIGNATURES = [f"sig{i}" for i in range(7)]
+
+
+def history_handler(request: httpx.Request) -> httpx.Response:
+    limit = int(request.url.params["limit"])
+    before = request.url.params.get("before")
+    start = SIGNATURES.index(before) + 1 if before else 0
+    page = SIGNATURES[start : start + limit]
+    return httpx.Response(
+        200, json=[{"signature": signature} for signature in page]
+    )
+
+
+async def collect(**kwargs):
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(history_handler)
+    )
+    async with client:
+        return [
+            transaction["signature"]
+            async for transaction in iter_address_transactions(
+                "wallet", page_size=3, client=client, **kwargs
+            )
+        ]
+
+
+def test_iter_address_transactions_pages_through_history():
+    assert asyncio.run(collect()) == SIGNATURES
+
+
+def test_iter_address_transactions_resumes_from_cursor():
+    assert asyncio.run(collect(before="sig3")) == SIGNATURES[4:]
+
+
+def batch_session(monkeypatch, fake_session, handler):
+    session = fake_session(handler)
+    monkeypatch.setattr(HeliusAPI, "MAX_BATCH_SIZE", 2)
+    monkeypatch.setattr(HeliusAPI, "get_session", lambda: session)
+    return session
+
+
+def test_fetch_transactions_data_chunks_and_splits_per_signature(
+    monkeypatch, fake_session
+):
+    def handler(method, url, json=None, **kwargs):
+        if "sig3" in json["transactions"]:
+            return {"message": "boom"}, 500
+        return [
+            {"signature": signature, "slot": int(signature[-1])}
+            for signature in json["transactions"]
+            if signature != "sig1"
+        ]
+
+    session = batch_session(monkeypatch, fake_session, handler)
+
+    results = HeliusAPI.fetch_transactions_data(
+        ["sig0", "sig1", "sig0", "sig2", "sig3", "sig4"]
+    )
+
+    sent = sorted(
+        kwargs["json"]["transactions"] for _, _, kwargs in session.calls
+    )
+    assert sent == [["sig0", "sig1"], ["sig2", "sig3"], ["sig4"]]
+    assert all("/transactions?" in url for _, url, _ in session.calls)
+    assert list(results) == ["sig0", "sig1", "sig2", "sig3", "sig4"]
+    assert results["sig0"] == {"signature": "sig0", "slot": 0}
+    assert results["sig1"] == {"error": "No data returned"}
+    assert "500" in results["sig2"]["error"]
+    assert "500" in results["sig3"]["error"]
+    assert results["sig4"]["slot"] == 4
+
+
+def test_fetch_tokens_data_posts_mint_accounts(monkeypatch, fake_session):
+    def handler(method, url, json=None, **kwargs):
+        assert json["includeOffChain"] is True
+        return [
+            {"account": mint, "symbol": mint.upper()}
+            for mint in json["mintAccounts"]
+        ]
+
+    session = batch_session(monkeypatch, fake_session, handler)
+
+    results = HeliusAPI.fetch_tokens_data(["mint0", "mint1", "mint2"])
+
+    assert len(session.calls) == 2
+    assert all("/token-metadata?" in url for _, url, _ in session.calls)
+    assert results == {
+        mint: {"account": mint, "symbol": mint.upper()}
+        for mint in ["mint0", "mint1", "mint2"]
+    }
+
+
+def test_shared_session_pools_http_and_https(monkeypatch):
+    monkeypatch.setattr(HeliusAPI, "_session", None)
+    session = HeliusAPI.get_session()
+
+    assert session is HeliusAPI.get_session()
+    assert (
+        session.get_adapter("http://localhost")
+        is session.get_adapter("https://api.helius.xyz")
+    )
@@ -0,0 +1,91 @@
+import threading
+
+import requests
+
+from swarms_tools.finance import htx_tool
+from swarms_tools.finance.htx_tool import fetch_htx_market_data
+
+TICK = {"close": 100, "bid": [99, 1], "ask": [101, 2]}
+PAYLOADS = {
+    "/market/detail/merged": {"status": "ok", "tick": TICK},
+    "/market/depth": {
+        "status": "ok",
+        "tick": {"bids": [[99, 1]], "asks": [[101, 2]]},
+    },
+    "/market/history/trade": {
+        "status": "ok",
+        "data": [{"data": [{"price": 100, "amount": 1, "id": 7}]}],
+    },
+    "/market/history/kline": {
+        "status": "ok",
+        "data": [
+            {
+                "id": 1,
+                "open": 1,
+                "close": 2,
+                "high": 3,
+                "low": 0,
+                "vol": 5,
+            }
+        ],
+    },
+}
+
+
+def htx_handler(method, url, **kwargs):
+    return PAYLOADS[url[len(htx_tool.BASE_URL) :]]
+
+
+def test_fetch_htx_market_data_fetches_sections_concurrently(
+    monkeypatch, fake_session
+):
+    # Every request waits until all four are in flight at once.
+    barrier = threading.Barrier(len(PAYLOADS), timeout=5)
+
+    def handler(method, url, **kwargs):
+        barrier.wait()
+        return htx_handler(method, url, **kwargs)
+
+    session = fake_session(handler)
+    monkeypatch.setattr(htx_tool, "_session", session)
+
+    data = fetch_htx_market_data("btc")
+
+    assert len(session.calls) == 4
+    assert data["ticker"]["bid"] == 99
+    assert data["order_book"]["asks"] == [{"price": 101, "amount": 2}]
+    assert data["recent_trades"][0]["trade_id"] == 7
+    assert data["kline_data"][0]["close"] == 2
+
+
+def test_fetch_htx_market_data_selected_sections_and_errors(
+    monkeypatch, fake_session
+):
+    session = fake_session(htx_handler)
+    monkeypatch.setattr(htx_tool, "_session", session)
+
+    data = fetch_htx_market_data("btc", sections=["ticker"])
+    assert set(data) == {"coin", "ticker"}
+    assert len(session.calls) == 1
+
+    for fetch in (fetch_htx_market_data, htx_tool.fetch_htx_data):
+        assert "No sections" in fetch("btc", sections=[])["error"]
+    assert "Invalid sections" in fetch_htx_market_data(
+        "btc", sections=["ticker", "news"]
+    )["error"]
+
+    def broken(method, url, **kwargs):
+        if url.endswith("/market/depth"):
+            return requests.exceptions.JSONDecodeError(
+                "Expecting value", "", 0
+            )
+        raise requests.ConnectionError("connection reset")
+
+    monkeypatch.setattr(htx_tool, "_session", fake_session(broken))
+    assert fetch_htx_market_data("btc", sections=["depth"]) == {
+        "error": "Invalid response from HTX",
+        "details": "Expecting value: line 1 column 1 (char 0)",
+    }
+    assert fetch_htx_market_data("btc", sections=["ticker"])["error"] == (
+        "HTTP request failed"
+    )
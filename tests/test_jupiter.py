@@ -0,0 +1,145 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from swarms_tools.finance import jupiter as jupiter_module
+from swarms_tools.finance.jupiter import JupiterAPI
+from swarms_tools.utils.background_loop import get_background_loop
+
+
+def stub_quotes(monkeypatch, fail=()):
+    """Replace ``JupiterAPI.get_price`` with a quote that worsens with size."""
+    calls = []
+
+    async def get_price(self, input_mint, output_mint, amount, slippage_bps):
+        calls.append((input_mint, output_mint, amount))
+        if amount in fail:
+            raise RuntimeError("no route")
+        price = 100.0 / (1 + amount / 10**12)
+        return {
+            "success": True,
+            "data": {
+                "out_amount": str(int(amount * price)),
+                "price": price,
+                "price_impact_pct": 0.0,
+            }
+        }
+
+    monkeypatch.setattr(JupiterAPI, "get_price", get_price)
+    return calls
+
+
+def test_curve_ladder_comes_from_sizes_or_decimals(monkeypatch):
+    calls = stub_quotes(monkeypatch, fail={10**9})
+    jupiter = JupiterAPI()
+
+    with pytest.raises(ValueError):
+        asyncio.run(jupiter.get_price_impact_curve("A", "B"))
+
+    curve = asyncio.run(
+        jupiter.get_price_impact_curve("A", "B", input_decimals=6)
+    )
+    assert [amount for _, _, amount in calls] == [
+        10**3,
+        10**4,
+        10**5,
+        10**6,
+        10**7,
+        10**8,
+        10**9,
+    ]
+    assert curve["errors"] == {10**9: "no route"}
+    assert curve["points"][0]["impact_vs_best"] == 0.0
+    assert curve["points"][-1]["impact_vs_best"] > 0
+
+    curve = asyncio.run(
+        jupiter.get_price_impact_curve("A", "B", sizes=[5, 2, 5])
+    )
+    assert [p["amount"] for p in curve["points"]] == [2, 5]
+
+
+def test_curve_cache_is_bounded_and_returns_copies(monkeypatch):
+    calls = stub_quotes(monkeypatch)
+    jupiter = JupiterAPI(curve_cache_size=2)
+
+    def curve(output_mint):
+        return asyncio.run(
+            jupiter.get_price_impact_curve("A", output_mint, sizes=[1])
+        )
+
+    first = curve("B")
+    first["points"].clear()
+    assert curve("B")["points"]
+    assert len(calls) == 1
+
+    curve("C")
+    curve("D")
+    assert len(jupiter._curve_cache) == 2
+    curve("B")
+    assert len(calls) == 4
+
+
+def test_get_prices_dedupes_pairs_and_reports_failures(monkeypatch):
+    calls = stub_quotes(monkeypatch, fail={13})
+    in_flight = peak = 0
+    get_price = JupiterAPI.get_price
+
+    async def tracked(self, input_mint, output_mint, amount, slippage_bps):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await get_price(
+            self, input_mint, output_mint, amount, slippage_bps
+        )
+
+    monkeypatch.setattr(JupiterAPI, "get_price", tracked)
+    pairs = [("A", "B"), ("A", "C"), ("A", "B"), ("A", "D")]
+
+    prices = asyncio.run(
+        JupiterAPI().get_prices(pairs, max_concurrency=2, amount=13)
+    )
+
+    assert len(calls) == 3
+    assert peak == 2
+    assert list(prices) == [("A", "B"), ("A", "C"), ("A", "D")]
+    assert prices[("A", "B")] == {"success": False, "error": "no route"}
+
+
+def test_sync_wrappers_share_one_client_on_the_background_loop(
+    monkeypatch,
+):
+    stub_quotes(monkeypatch)
+    opened = []
+
+    async def aenter(self):
+        opened.append(self)
+        await asyncio.sleep(0.01)
+        self.session = SimpleNamespace(closed=False)
+        return self
+
+    monkeypatch.setattr(JupiterAPI, "__aenter__", aenter)
+    monkeypatch.setattr(jupiter_module, "_shared_jupiter", None)
+    loop = get_background_loop()
+
+    async def open_many():
+        return await asyncio.gather(
+            *(jupiter_module._get_shared_jupiter() for _ in range(5))
+        )
+
+    clients = loop.run(open_many(), timeout=5)
+    assert len(opened) == 1
+    assert all(client is opened[0] for client in clients)
+
+    prices = jupiter_module.get_jupiter_prices([("A", "B")], timeout=5)
+    assert prices[("A", "B")]["data"]["price"] > 0
+    assert len(opened) == 1
+    assert loop.loop is get_background_loop().loop
+
+    async def reenter():
+        return loop.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        loop.run(reenter(), timeout=5)
@@ -0,0 +1,295 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from swarms_tools.finance import market_streams
+from swarms_tools.finance.market_streams import (
+    HTXMarketStream,
+    OKXMarketStream,
+    start_market_streams,
+    stop_market_streams,
+)
+
+
+async def _wait_for(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+def test_htx_stream_handles_gzip_ping_and_reconnects():
+    received = []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        for _ in range(2):
+            received.append(json.loads(await ws.receive_str()))
+
+        def send(payload):
+            return ws.send_bytes(gzip.compress(json.dumps(payload).encode()))
+
+        await send({"ping": 123})
+        received.append(json.loads(await ws.receive_str()))
+        await send(
+            {
+                "ch": "market.btcusdt.ticker",
+                "ts": 1000,
+                "tick": {"close": 50000.0, "bid": 49999.0, "ask": 50001.0},
+            }
+        )
+        await send(
+            {
+                "ch": "market.btcusdt.trade.detail",
+                "ts": 1001,
+                "tick": {
+                    "data": [
+                        {
+                            "tradeId": 1,
+                            "price": 50000.5,
+                            "amount": 0.1,
+                            "direction": "buy",
+                            "ts": 1001,
+                        }
+                    ]
+                },
+            }
+        )
+        # Drop the connection; the client must reconnect and resubscribe.
+        await ws.close()
+        return ws
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        async with TestServer(app) as server:
+            stream = HTXMarketStream(
+                ["btcusdt"],
+                channels=["ticker", "trades"],
+                url=str(server.make_url("/ws")),
+                reconnect_delay=0.01,
+            )
+            task = asyncio.ensure_future(stream.run())
+            await _wait_for(lambda: stream.connections >= 2)
+            await stream.stop()
+            await asyncio.wait_for(task, 5)
+            return stream
+
+    stream = asyncio.run(main())
+
+    assert received[:3] == [
+        {"sub": "market.btcusdt.ticker", "id": "1"},
+        {"sub": "market.btcusdt.trade.detail", "id": "2"},
+        {"pong": 123},
+    ]
+    # Resubscribed after the reconnect.
+    assert received[3] == received[0]
+    assert stream.state.get_ticker("htx", "btcusdt")["last"] == 50000.0
+    trades = stream.state.get_trades("htx", "btcusdt")
+    assert trades[0]["price"] == 50000.5
+    assert trades[0]["side"] == "buy"
+
+
+def test_okx_stream_sends_ping_when_idle():
+    received = []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        received.append(json.loads(await ws.receive_str()))
+        await ws.send_str(
+            json.dumps(
+                {
+                    "arg": {"channel": "books5", "instId": "BTC-USDT"},
+                    "data": [
+                        {
+                            "bids": [["49999", "1.5", "0", "3"]],
+                            "asks": [["50001", "2", "0", "1"]],
+                            "ts": "1000",
+                        }
+                    ],
+                }
+            )
+        )
+        received.append(await ws.receive_str())
+        await ws.send_str("pong")
+        async for _ in ws:
+            pass
+        return ws
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        async with TestServer(app) as server:
+            stream = OKXMarketStream(
+                ["BTC-USDT"],
+                channels=["depth"],
+                url=str(server.make_url("/ws")),
+                idle_timeout=0.05,
+            )
+            task = asyncio.ensure_future(stream.run())
+            await _wait_for(lambda: len(received) >= 2)
+            await stream.stop()
+            await asyncio.wait_for(task, 5)
+            return stream
+
+    stream = asyncio.run(main())
+
+    assert received[0] == {
+        "op": "subscribe",
+        "args": [{"channel": "books5", "instId": "BTC-USDT"}],
+    }
+    assert received[1] == "ping"
+    book = stream.state.get_book("okx", "BTC-USDT")
+    assert book["bids"] == [(49999.0, 1.5)]
+    assert book["asks"] == [(50001.0, 2.0)]
+
+
+def test_htx_stream_skips_malformed_frames():
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.receive_str()
+        await ws.send_bytes(b"not gzip")
+        await ws.send_bytes(gzip.compress(b'{"ch": "bad", "tick": {}}'))
+        await ws.send_bytes(
+            gzip.compress(
+                json.dumps(
+                    {"ch": "market.btcusdt.ticker", "tick": {"close": 1.0}}
+                ).encode()
+            )
+        )
+        async for _ in ws:
+            pass
+        return ws
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        async with TestServer(app) as server:
+            stream = HTXMarketStream(
+                ["btcusdt"],
+                channels=["ticker"],
+                url=str(server.make_url("/ws")),
+            )
+            task = asyncio.ensure_future(stream.run())
+            await _wait_for(
+                lambda: stream.state.get_ticker("htx", "btcusdt")
+            )
+            await stream.stop()
+            await asyncio.wait_for(task, 5)
+            return stream
+
+    stream = asyncio.run(main())
+
+    assert stream.connections == 1
+    assert stream.state.get_ticker("htx", "btcusdt")["last"] == 1.0
+
+
+def test_start_market_streams_is_idempotent(monkeypatch):
+    connections = []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        connections.append(ws)
+        async for _ in ws:
+            pass
+        return ws
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        async with TestServer(app) as server:
+            monkeypatch.setattr(
+                HTXMarketStream, "default_url", str(server.make_url("/ws"))
+            )
+            for _ in range(2):
+                await asyncio.to_thread(
+                    start_market_streams,
+                    htx_symbols=["btcusdt"],
+                    channels=["ticker"],
+                )
+            await _wait_for(lambda: connections)
+            await asyncio.sleep(0.1)
+            assert len(connections) == 1
+            assert list(market_streams._streams) == ["htx"]
+
+            await asyncio.to_thread(stop_market_streams)
+            assert not market_streams._streams
+
+    asyncio.run(main())
+
+
+def test_okx_books_resubscribes_on_sequence_gap():
+    received = []
+
+    def books(action, seq, prev, bids):
+        return json.dumps(
+            {
+                "arg": {"channel": "books", "instId": "BTC-USDT"},
+                "action": action,
+                "data": [
+                    {
+                        "bids": bids,
+                        "asks": [],
+                        "ts": "1",
+                        "seqId": seq,
+                        "prevSeqId": prev,
+                    }
+                ],
+            }
+        )
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        received.append(json.loads(await ws.receive_str()))
+        await ws.send_str(books("snapshot", 10, -1, [["100", "1", "0", "1"]]))
+        await ws.send_str(books("update", 11, 10, [["99", "2", "0", "1"]]))
+        await ws.send_str(books("update", 51, 50, [["98", "3", "0", "1"]]))
+        await ws.send_str(books("update", 52, 51, [["97", "3", "0", "1"]]))
+        for _ in range(2):
+            received.append(json.loads(await ws.receive_str()))
+        await ws.send_str(books("snapshot", 60, -1, [["101", "1", "0", "1"]]))
+        async for _ in ws:
+            pass
+        return ws
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        async with TestServer(app) as server:
+            stream = OKXMarketStream(
+                ["BTC-USDT"],
+                channels=["full_depth"],
+                url=str(server.make_url("/ws")),
+            )
+            task = asyncio.ensure_future(stream.run())
+            await _wait_for(lambda: len(received) >= 3)
+            await _wait_for(
+                lambda: stream.state.get_book("okx", "BTC-USDT")["bids"]
+                == [(101.0, 1.0)]
+            )
+            await stream.stop()
+            await asyncio.wait_for(task, 5)
+
+    asyncio.run(main())
+
+    args = [{"channel": "books", "instId": "BTC-USDT"}]
+    assert received == [
+        {"op": "subscribe", "args": args},
+        {"op": "unsubscribe", "args": args},
+        {"op": "subscribe", "args": args},
+    ]
+
+
+def test_depth_channels_are_exclusive_and_full_depth_opt_in():
+    assert "full_depth" not in HTXMarketStream(["btcusdt"]).channels
+    with pytest.raises(ValueError):
+        OKXMarketStream(["BTC-USDT"], channels=["depth", "full_depth"])
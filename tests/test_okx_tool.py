@@ -0,0 +1,77 @@
+from swarms_tools.finance.okx_tool import (
+    OKXTickerSnapshot,
+    fetch_history_candles,
+)
+from swarms_tools.utils.rate_limiter import RateLimiter
+
+
+def tickers_handler(method, url, params=None, **kwargs):
+    if url.endswith("/market/tickers"):
+        data = [
+            {"instId": f"COIN{i}-USDT", "last": str(i)} for i in range(10)
+        ]
+        return {"code": "0", "data": data}
+    inst_id = params["instId"]
+    if inst_id.startswith("COIN"):
+        return {"code": "0", "data": [{"instId": inst_id, "last": "1"}]}
+    return {"code": "51001", "msg": "Instrument ID does not exist"}
+
+
+def endpoints(session):
+    return [url.rsplit("/", 1)[-1] for _, url, _ in session.calls]
+
+
+def test_ticker_snapshot_uses_single_endpoint_and_index(fake_session):
+    session = fake_session(tickers_handler)
+    snapshot = OKXTickerSnapshot(
+        ttl=60, max_single_requests=2, session=session
+    )
+
+    result = snapshot.get(["COIN1-USDT", "NOPE-USDT"])
+    assert list(result) == ["COIN1-USDT"]
+    assert endpoints(session) == ["ticker", "ticker"]
+
+    # Fresh entries are served from the cache.
+    snapshot.get(["COIN1-USDT"])
+    assert len(session.calls) == 2
+
+    # Too many stale symbols: one full snapshot instead of many requests.
+    result = snapshot.get(["COIN2-USDT", "COIN3-USDT", "COIN4-USDT"])
+    assert len(result) == 3
+    assert endpoints(session)[-1] == "tickers"
+    assert len(snapshot.get()) == 10
+    assert len(session.calls) == 3
+
+
+def candles_handler(method, url, params=None, **kwargs):
+    """Serves 1m candles for every minute, honoring OKX's exclusive bounds."""
+    after, before = int(params["after"]), int(params["before"])
+    limit = int(params["limit"])
+    rows = []
+    ts = (after - 1) // 60000 * 60000
+    while ts > before and len(rows) < limit:
+        rows.append([str(ts), "1", "2", "0.5", str(ts), "10"])
+        ts -= 60000
+    return {"code": "0", "data": rows}
+
+
+def test_fetch_history_candles_backfills_windows(fake_session):
+    session = fake_session(candles_handler)
+    start, end = 600, 600 + 250 * 60
+
+    candles = fetch_history_candles(
+        "BTC-USDT",
+        start,
+        end,
+        bar="1m",
+        rate_limiter=RateLimiter(100, 1.0),
+        session=session,
+    )
+
+    assert len(candles) == 250
+    assert candles["timestamp"][0] == start
+    assert candles["timestamp"][-1] == end - 60
+    assert (candles["timestamp"][1:] - candles["timestamp"][:-1] == 60).all()
+    assert candles["close"][0] == start * 1000
+    # Three windows of at most 100 bars, one request each.
+    assert len(session.calls) == 3
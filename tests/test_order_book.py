@@ -0,0 +1,70 @@
+import pytest
+
+from swarms_tools.finance.market_streams import MarketState
+from swarms_tools.finance.order_book import OrderBook
+
+
+def test_order_book_queries_and_updates():
+    book = OrderBook.from_htx_depth(
+        {
+            "status": "ok",
+            "tick": {
+                "bids": [[99.0, 2.0], [100.0, 1.0], [98.0, 5.0]],
+                "asks": [[101.0, 1.0], [102.0, 3.0], [110.0, 10.0]],
+                "ts": 1,
+            },
+        }
+    )
+
+    assert book.best_bid() == (100.0, 1.0)
+    assert book.best_ask() == (101.0, 1.0)
+    assert book.spread() == 1.0
+    assert book.mid() == 100.5
+    assert book.bids(2) == [(100.0, 1.0), (99.0, 2.0)]
+    # ±2% of 100.5 covers 98.49..102.51.
+    depth = book.depth_within(2)
+    assert depth["bids"] == 3.0
+    assert depth["asks"] == 4.0
+    assert book.vwap(3, "buy") == pytest.approx((101 + 2 * 102) / 3)
+    assert book.vwap(100, "buy") is None
+
+    book.apply_update(
+        bids=[[100.0, 0], [100.5, 4.0]], asks=[[101.0, "0"]], timestamp=2
+    )
+    assert book.best_bid() == (100.5, 4.0)
+    assert book.best_ask() == (102.0, 3.0)
+    assert book.vwap(5, "sell") == pytest.approx((4 * 100.5 + 99) / 5)
+    assert book.timestamp == 2
+    assert len(book) == 5
+
+
+def test_market_state_applies_okx_incremental_books():
+    state = MarketState()
+    snapshot = OrderBook.from_okx_books(
+        {
+            "code": "0",
+            "data": [
+                {
+                    "bids": [["10", "1", "0", "1"]],
+                    "asks": [["11", "1", "0", "1"]],
+                    "ts": "5",
+                }
+            ],
+        }
+    )
+    state.update_book(
+        "okx", "BTC-USDT", snapshot.bids(), snapshot.asks(), 5
+    )
+    state.update_book(
+        "okx",
+        "BTC-USDT",
+        [["10.5", "2", "0", "1"]],
+        [["11", "0", "0", "0"], ["12", "3", "0", "1"]],
+        6,
+        snapshot=False,
+    )
+
+    book = state.get_order_book("okx", "BTC-USDT")
+    assert book.best_bid() == (10.5, 2.0)
+    assert book.best_ask() == (12.0, 3.0)
+    assert state.get_book("okx", "BTC-USDT")["timestamp"] == 6
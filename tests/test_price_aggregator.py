@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from swarms_tools.finance import price_aggregator
+from swarms_tools.finance.price_aggregator import get_best_price
+
+
+def fake_venue(venue, bid, ask, delay=0.0, timeouts=None):
+    def fetch(base, timeout):
+        if timeouts is not None:
+            timeouts[venue] = timeout
+        time.sleep(delay)
+        return price_aggregator._quote(venue, base, bid, ask, bid)
+
+    return fetch
+
+
+def test_get_best_price_picks_best_venues_and_times_out(monkeypatch):
+    timeouts = {}
+
+    def failing(base, timeout):
+        raise ValueError("No OKX ticker")
+
+    monkeypatch.setattr(
+        price_aggregator,
+        "VENUE_FETCHERS",
+        {
+            "coinbase": fake_venue("coinbase", 100.0, 101.0),
+            "okx": failing,
+            "htx": fake_venue("htx", 100.5, 100.8),
+            "jupiter": fake_venue(
+                "jupiter", 200.0, 90.0, delay=2, timeouts=timeouts
+            ),
+        },
+    )
+
+    started = time.monotonic()
+    result = get_best_price("btc-usd", timeouts={"jupiter": 0.2})
+
+    assert time.monotonic() - started < 1.5
+    assert result["symbol"] == "BTC"
+    assert result["best_bid"] == {"venue": "htx", "price": 100.5}
+    assert result["best_ask"] == {"venue": "htx", "price": 100.8}
+    assert result["spread"] == pytest.approx(0.3)
+    assert result["errors"] == {"okx": "No OKX ticker", "jupiter": "timeout"}
+    # The venue timeout reaches the fetcher's HTTP requests.
+    assert timeouts == {"jupiter": 0.2}
+
+
+def test_best_price_tool_formats_errors():
+    result = price_aggregator.best_price_tool("BTC", venues=["nowhere"])
+    assert isinstance(result, str)
+    assert "Invalid venues" in result
+
+
+def test_jupiter_quote_rescales_base_units(monkeypatch):
+    sol, usdc = (
+        price_aggregator.SOLANA_TOKENS["SOL"][0],
+        price_aggregator.SOLANA_TOKENS["USDC"][0],
+    )
+
+    def fake_prices(pairs, timeout=None):
+        # 1 SOL (1e9 units) -> 150 USDC (150e6 units); 1000 USDC -> 6.6 SOL.
+        return {
+            (sol, usdc): {"success": True, "data": {"price": 150e6 / 1e9}},
+            (usdc, sol): {"success": True, "data": {"price": 6.6e9 / 1e9}},
+        }
+
+    monkeypatch.setattr(price_aggregator, "get_jupiter_prices", fake_prices)
+
+    quote = price_aggregator._jupiter_quote("SOL", 5.0)
+
+    assert quote["bid"] == pytest.approx(150.0)
+    assert quote["ask"] == pytest.approx(1000 / 6.6)
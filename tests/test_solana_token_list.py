@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from swarms_tools.finance.solana_token_list import (
+    TokenSymbolTable,
+    iter_token_symbols,
+    write_token_symbol_table,
+)
+
+TOKEN_LIST = {
+    "name": "Solana Token List",
+    "tags": {"stablecoin": {"name": "stablecoin"}},
+    "timestamp": "2021-03-03T19:57:21+0000",
+    "tokens": [
+        {
+            "chainId": 101,
+            "address": "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            "symbol": "USDC",
+            "decimals": 6,
+        },
+        {
+            "chainId": 101,
+            "address": "So11111111111111111111111111111111111111112",
+            "symbol": "SOL",
+            "decimals": 9,
+        },
+        {"chainId": 101, "address": "Mint3", "symbol": "Ünï"},
+    ],
+    "version": {"major": 0, "minor": 2, "patch": 2},
+}
+
+
+def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def test_iter_token_symbols_across_chunk_boundaries():
+    document = json.dumps(TOKEN_LIST, ensure_ascii=False).encode(
+        "utf-8"
+    )
+    expected = [
+        (token["address"], token["symbol"])
+        for token in TOKEN_LIST["tokens"]
+    ]
+    for size in (1, 3, 7, len(document)):
+        assert list(iter_token_symbols(chunked(document, size))) == (
+            expected
+        )
+
+
+def test_token_symbol_table_roundtrip(tmp_path):
+    mapping = dict(
+        iter_token_symbols([json.dumps(TOKEN_LIST).encode("utf-8")])
+    )
+    path = tmp_path / "symbols.bin"
+    write_token_symbol_table(path, mapping)
+
+    table = TokenSymbolTable(path)
+    assert len(table) == 3
+    assert table["So11111111111111111111111111111111111111112"] == "SOL"
+    assert table.get("Mint3") == "Ünï"
+    assert table.get("missing", "Unknown Token") == "Unknown Token"
+    assert "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v" in table
+    assert dict(table) == mapping
+    table.close()
+
+
+def test_token_symbol_table_rejects_truncated_files(tmp_path):
+    path = tmp_path / "symbols.bin"
+    write_token_symbol_table(path, {"mint": "SYM"})
+    data = path.read_bytes()
+
+    for size in (3, 16, 20, len(data) - 1):
+        path.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            TokenSymbolTable(path)
@@ -0,0 +1,161 @@
+import asyncio
+import json
+
+import httpx
+
+from swarms_tools.finance import uniswap_tool
+from swarms_tools.finance.uniswap_tool import UniswapDataFetcher
+
+
+def subgraph(respond):
+    """Wrap ``respond(payload) -> data`` as a ``fake_session`` handler."""
+    return lambda method, url, json=None, **kwargs: {"data": respond(json)}
+
+
+def payloads(session):
+    return [kwargs["json"] for _, _, kwargs in session.calls]
+
+
+def test_batch_methods_split_results_per_input(fake_session):
+    def respond(payload):
+        variables = payload["variables"]
+        if "tokens(" in payload["query"]:
+            return {
+                "tokens": [
+                    {"id": i, "symbol": i.upper()}
+                    for i in variables["ids"]
+                    if i != "0xmissing"
+                ]
+            }
+        return {
+            f"p{i}": [{"id": f"pair-{i}"}] if i == 0 else []
+            for i in range(len(variables) // 2)
+        }
+
+    session = fake_session(subgraph(respond))
+    fetcher = UniswapDataFetcher("http://rpc", "http://subgraph", session)
+
+    tokens = fetcher.fetch_tokens_data(
+        ["0xA", "0xb", "0xa", "0xmissing"], batch_size=2
+    )
+    assert len(session.calls) == 2
+    assert tokens == {
+        "0xa": {"id": "0xa", "symbol": "0XA"},
+        "0xb": {"id": "0xb", "symbol": "0XB"},
+    }
+
+    pairs = fetcher.fetch_pairs_data([("0xA", "0xB"), ("0xC", "0xD")])
+    assert len(session.calls) == 3
+    assert payloads(session)[-1]["variables"]["t0_0"] == "0xa"
+    assert pairs == {("0xA", "0xB"): {"id": "pair-0"}, ("0xC", "0xD"): None}
+
+
+def test_fetch_pairs_data_omits_failed_pairs(fake_session):
+    def handler(method, url, json=None, **kwargs):
+        variables = json["variables"]
+        if variables["t0_0"] == "0xe":
+            return {"errors": ["unavailable"]}, 502
+        # p1 failed to resolve; GraphQL reports it as null with an error.
+        return {
+            "data": {"p0": [], "p1": None},
+            "errors": [{"message": "p1 timed out"}],
+        }
+
+    session = fake_session(handler)
+    fetcher = UniswapDataFetcher("http://rpc", "http://subgraph", session)
+
+    pairs = fetcher.fetch_pairs_data(
+        [("0xA", "0xB"), ("0xC", "0xD"), ("0xE", "0xF")], batch_size=2
+    )
+
+    assert len(session.calls) == 2
+    assert pairs == {("0xA", "0xB"): None}
+
+
+def test_helpers_share_a_lazily_connected_fetcher(monkeypatch, fake_session):
+    session = fake_session(
+        subgraph(
+            lambda payload: {"token": {"id": "0xa"}, "pairs": [], "pair": {}}
+        )
+    )
+    monkeypatch.setattr(uniswap_tool, "_session", session)
+    monkeypatch.setattr(uniswap_tool, "_fetcher", None)
+
+    result = uniswap_tool.fetch_all_uniswap_data(
+        "0xA", ("0xA", "0xB"), "0xpool"
+    )
+
+    assert "Token Data: {'id': '0xa'}" in result
+    assert len(session.calls) == 3
+    fetcher = uniswap_tool.get_uniswap_fetcher()
+    assert fetcher is uniswap_tool.get_uniswap_fetcher()
+    assert fetcher._web3 is None
+
+
+PAIR_IDS = [f"0x{i:02x}" for i in range(7)]
+
+
+def subgraph_handler(request: httpx.Request) -> httpx.Response:
+    variables = json.loads(request.content)["variables"]
+    after = variables["where"]["id_gt"]
+    page = [i for i in PAIR_IDS if i > after][: variables["first"]]
+    return httpx.Response(
+        200, json={"data": {"pairs": [{"id": i} for i in page]}}
+    )
+
+
+def test_iter_pairs_pages_with_id_cursor():
+    async def collect(**kwargs):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(subgraph_handler)
+        )
+        async with client:
+            return [
+                pair["id"]
+                async for pair in uniswap_tool.iter_pairs(
+                    page_size=3, client=client, **kwargs
+                )
+            ]
+
+    assert asyncio.run(collect()) == PAIR_IDS
+    assert asyncio.run(collect(after_id="0x03")) == PAIR_IDS[4:]
+
+
+def test_fetch_liquidity_positions_pages_over_the_fetcher_session(
+    fake_session,
+):
+    positions = [{"id": f"0x{i:02x}"} for i in range(5)]
+
+    def respond(payload):
+        variables = payload["variables"]
+        after = variables["where"]["id_gt"]
+        page = [p for p in positions if p["id"] > after]
+        return {"liquidityPositions": page[: variables["first"]]}
+
+    session = fake_session(subgraph(respond))
+    fetcher = UniswapDataFetcher("http://rpc", "http://subgraph", session)
+
+    assert fetcher.fetch_liquidity_positions("0xUser", page_size=2) == (
+        positions
+    )
+    assert len(session.calls) == 3
+    assert payloads(session)[0]["variables"]["where"] == {
+        "user": "0xuser",
+        "id_gt": "",
+    }
+
+
+def test_fetch_liquidity_positions_returns_none_on_bad_pages(
+    fake_session,
+):
+    handlers = [
+        # Not JSON.
+        lambda method, url, **kwargs: ValueError("not JSON"),
+        # A full page whose positions have no id to page after.
+        subgraph(lambda payload: {"liquidityPositions": [{}, {}]}),
+    ]
+    for handler in handlers:
+        fetcher = UniswapDataFetcher(
+            "http://rpc", "http://subgraph", fake_session(handler)
+        )
+        assert fetcher.fetch_liquidity_positions("0xu", page_size=2) is None